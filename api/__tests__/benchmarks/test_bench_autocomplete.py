@@ -0,0 +1,51 @@
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from app_lib.visibility import VisibilityFilter
+from user.filters import UserDataFilter
+from user.lib import user_autocomplete
+from user.models import AppUser as User
+
+
+@benchmark
+class BenchUserAutocomplete(BaseTestClass):
+    """
+    Typeahead over 10k then 200k users visible to the same user, the `search`
+    filter first page vs `user_autocomplete`
+    """
+    users_counts = [10_000, 200_000]
+    names = ["alice", "albert", "bob", "carol", "dave", "eve", "frank", "grace"]
+
+    def setUp(self):
+        self.owner_user = self.create_and_activate_random_user()
+
+    def create_users(self, start, end):
+        User.objects.bulk_create([
+            User(
+                email=f"user{i}@example.com",
+                first_name=self.names[i % len(self.names)].title(),
+                last_name=f"Name{i}",
+                created_by=self.owner_user,
+            )
+            for i in range(start, end)
+        ], batch_size=5000)
+
+    def test_autocomplete(self):
+        # users list visibility, see `UserViewSet.get_queryset`
+        queryset = VisibilityFilter(User, self.owner_user).created_by().in_m2m(
+            "can_be_accessed_by"
+        ).is_user().filter(User.objects.all())
+        created = 0
+        for count in self.users_counts:
+            self.create_users(created, count)
+            created = count
+            # the last value matches nothing, the filter scans every row
+            for value, expected in [("a", 10), ("al", 10), ("alb", 10), ("zed", 0)]:
+                with measure(f"{count} users, search filter {value!r}"):
+                    list(UserDataFilter().search_through(
+                        queryset, "search", value
+                    ).order_by("created_at")[:10])
+                with measure(f"{count} users, autocomplete {value!r}"):
+                    results = user_autocomplete.search(queryset, value, 10)
+                self.assertEqual(len(results), expected)
+
@@ -0,0 +1,49 @@
+from django.urls import reverse
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from tasks.models import Task
+
+
+@benchmark
+class BenchBulkCreate(BaseTestClass):
+    """
+    Create 5k tasks of an org with a tag and an assigned user each, one request per
+    task then with a single bulk create request
+    """
+    tasks_count = 5000
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        self.tag = self.create_new_tag(self.org)[-1]
+        self.user = self.create_and_activate_random_user()
+        self.user.can_be_accessed_by.add(self.owner)
+        access, _ = self.get_tokens(self.owner)
+        self.headers = {"Authorization": f"Bearer {access}"}
+
+    def get_task_data(self, name):
+        return {
+            "name": name,
+            "org": str(self.org.id),
+            "tags": [str(self.tag.id)],
+            "assigned_to": [str(self.user.id)],
+        }
+
+    def test_bulk_create(self):
+        with measure(f"create {self.tasks_count} tasks one by one"):
+            for i in range(self.tasks_count):
+                response = self.client.post(
+                    reverse("tasks-list"), self.get_task_data(f"task {i}"),
+                    format="json", headers=self.headers
+                )
+                self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+
+        with measure(f"bulk create {self.tasks_count} tasks"):
+            response = self.client.post(
+                reverse("tasks-bulk-create"),
+                [self.get_task_data(f"bulk task {i}") for i in range(self.tasks_count)],
+                format="json", headers=self.headers
+            )
+        self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        self.assertEqual(Task.objects.filter(org=self.org).count(), self.tasks_count * 2)
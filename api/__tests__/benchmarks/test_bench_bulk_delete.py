@@ -0,0 +1,52 @@
+from django.urls import reverse
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from app_lib.views import BulkDeleteResourceMixin
+from jobs.worker import job_worker
+from tasks.models import Task
+
+
+@benchmark
+class BenchBulkDelete(BaseTestClass):
+    """
+    Bulk delete 20k tasks of an org, in the request then with a job. The org owner
+    deletes them, access is checked through the org
+    """
+    url_name = "tasks-bulk-delete"
+    tasks_count = 20_000
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        tasks = Task.objects.bulk_create([
+            Task(name=f"task {i}", org=self.org) for i in range(self.tasks_count * 2)
+        ], batch_size=5000)
+        ids = [str(task.id) for task in tasks]
+        self.request_ids, self.job_ids = ids[:self.tasks_count], ids[self.tasks_count:]
+
+    def delete_ids(self, ids):
+        # json, form encoded data is limited to `DATA_UPLOAD_MAX_NUMBER_FIELDS` values
+        access, _ = self.get_tokens(self.owner)
+        return self.client.delete(
+            reverse(self.url_name), {"ids": ids}, format="json",
+            headers={"Authorization": f"Bearer {access}"}
+        )
+
+    def test_bulk_delete(self):
+        self.addCleanup(
+            setattr, BulkDeleteResourceMixin, "bulk_delete_async_threshold",
+            BulkDeleteResourceMixin.bulk_delete_async_threshold
+        )
+        BulkDeleteResourceMixin.bulk_delete_async_threshold = self.tasks_count
+        with measure(f"bulk delete {self.tasks_count} tasks in the request"):
+            response = self.delete_ids(self.request_ids)
+        self.assertEqual(response.status_code, self.status.HTTP_204_NO_CONTENT)
+
+        BulkDeleteResourceMixin.bulk_delete_async_threshold = 1000
+        with measure(f"bulk delete {self.tasks_count} tasks, job creation"):
+            response = self.delete_ids(self.job_ids)
+        self.assertEqual(response.status_code, self.status.HTTP_202_ACCEPTED)
+        with measure(f"bulk delete {self.tasks_count} tasks, job run"):
+            job_worker.run_pending()
+        self.assertFalse(Task.objects.filter(org=self.org).exists())
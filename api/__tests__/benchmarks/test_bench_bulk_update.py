@@ -0,0 +1,46 @@
+from django.urls import reverse
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from tasks.models import Task
+
+
+@benchmark
+class BenchBulkUpdate(BaseTestClass):
+    """
+    Move 500 tasks of an org to `completed`, one status update request per task then
+    with a single bulk update request, half of the tasks also get a new priority
+    """
+    tasks_count = 500
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        self.tasks = Task.objects.bulk_create([
+            Task(name=f"task {i}", org=self.org) for i in range(self.tasks_count * 2)
+        ])
+        access, _ = self.get_tokens(self.owner)
+        self.headers = {"Authorization": f"Bearer {access}"}
+
+    def test_bulk_update(self):
+        with measure(f"update {self.tasks_count} tasks status one by one"):
+            for task in self.tasks[:self.tasks_count]:
+                response = self.client.patch(
+                    reverse("tasks-update-status", args=[task.id]),
+                    {"status": Task.Status.COMPLETED}, format="json", headers=self.headers
+                )
+                self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+
+        with measure(f"bulk update {self.tasks_count} tasks"):
+            response = self.client.patch(reverse("tasks-bulk-update"), [
+                {
+                    "id": str(task.id),
+                    "status": Task.Status.COMPLETED,
+                    **({"priority": Task.Priority.HIGH} if i % 2 else {}),
+                }
+                for i, task in enumerate(self.tasks[self.tasks_count:])
+            ], format="json", headers=self.headers)
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        self.assertEqual(
+            Task.objects.filter(status=Task.Status.COMPLETED).count(), self.tasks_count * 2
+        )
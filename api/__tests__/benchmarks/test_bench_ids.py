@@ -0,0 +1,37 @@
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from tasks.models import Task
+
+
+@benchmark
+class BenchPrimaryKeys(BaseTestClass):
+    """
+    Insert 200k tasks with two assigned users each, in batches, with random UUIDv4
+    then time ordered UUIDv7 primary keys, see `UUID7_PRIMARY_KEYS`. UUIDv7 rows
+    are inserted last, in the already filled tables
+    """
+    tasks_count = 200_000
+    batch_size = 5000
+
+    def setUp(self):
+        self.creator, _, self.org = self.create_new_org()
+        self.users = [self.create_and_activate_random_user() for _ in range(2)]
+
+    def insert_tasks(self, label):
+        assigned = Task.assigned_to.through
+        for start in range(0, self.tasks_count, self.batch_size):
+            tasks = Task.objects.bulk_create([
+                Task(name=f"{label} {i}", org=self.org, created_by=self.creator)
+                for i in range(start, start + self.batch_size)
+            ])
+            assigned.objects.bulk_create([
+                assigned(task_id=task.id, appuser_id=user.id)
+                for task in tasks for user in self.users
+            ])
+
+    def test_insert(self):
+        for label, uuid7_enabled in [("UUIDv4", False), ("UUIDv7", True)]:
+            with self.settings(UUID7_PRIMARY_KEYS=uuid7_enabled):
+                with measure(f"{label} insert {self.tasks_count} tasks"):
+                    self.insert_tasks(label)
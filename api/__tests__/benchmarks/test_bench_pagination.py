@@ -0,0 +1,67 @@
+import json
+import tracemalloc
+from base64 import b64encode
+from urllib.parse import urlencode
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from tasks.models import Task
+
+
+@benchmark
+class BenchPaginationTotalCount(BaseTestClass):
+    """
+    List the first page of 100k tasks, counting rows in memory vs with a `COUNT`.
+    Fetch first and deep pages over each ordering.
+    """
+    url_name = "tasks-list"
+    tasks_count = 100_000
+
+    def setUp(self):
+        self.owner, creator, self.org = self.create_new_org()
+        Task.objects.bulk_create([
+            Task(name=f"task {i}", org=self.org, created_by=creator)
+            for i in range(self.tasks_count)
+        ], batch_size=5000)
+
+    def measure_memory(self, label, func):
+        tracemalloc.start()
+        with measure(label):
+            result = func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"[benchmark] {label}: {peak / 1024 / 1024:.1f}MB peak")
+        return result
+
+    def test_total_count(self):
+        queryset = Task.objects.filter(org=self.org)
+        in_memory = self.measure_memory(
+            f"len() over {self.tasks_count} tasks", lambda: len(queryset.all())
+        )
+        counted = self.measure_memory(
+            f"COUNT over {self.tasks_count} tasks", lambda: queryset.count()
+        )
+        self.assertEqual(in_memory, counted)
+
+        for query_params in [{}, {"include_total": "false"}]:
+            response = self.measure_memory(
+                f"tasks first page {query_params}",
+                lambda: self.auth_get(self.owner, query_params=query_params)
+            )
+            self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+
+    def test_deep_pages(self):
+        for ordering in ["name", "-created_at", "status"]:
+            field = ordering.lstrip("-")
+            tasks = Task.objects.filter(org=self.org).order_by(ordering, ordering.replace(field, "id"))
+            deep_task = tasks.values(field, "id")[self.tasks_count - 100]
+            position = json.dumps([deep_task[field], deep_task["id"]], default=str)
+            cursor = b64encode(urlencode({"p": position}).encode("ascii")).decode("ascii")
+            for label, query_params in [
+                ("first page", {"ordering": ordering, "include_total": "false"}),
+                ("deep page", {"ordering": ordering, "include_total": "false", "cursor": cursor}),
+            ]:
+                with measure(f"tasks {label} ordered by {ordering}"):
+                    response = self.auth_get(self.owner, query_params=query_params)
+                self.assertEqual(response.status_code, self.status.HTTP_200_OK)
@@ -0,0 +1,53 @@
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from search.backends import FTS5SearchBackend, DatabaseSearchBackend
+from search.documents import search_registry
+from search.models import SearchDocument
+from tasks.models import Task
+
+
+@benchmark
+class BenchTaskSearch(BaseTestClass):
+    """
+    Search 1M tasks documents with the FTS5 trigram index vs a `LIKE` scan,
+    for a rare and a common value
+    """
+    tasks_count = 1_000_000
+    words = ["report", "meeting", "invoice", "release", "review", "budget", "planning"]
+
+    def setUp(self):
+        creator, _, org = self.create_new_org()
+        content_type = search_registry.get_content_type(Task)
+        for start in range(0, self.tasks_count, 50_000):
+            tasks = Task.objects.bulk_create([
+                Task(
+                    name=f"{self.words[i % len(self.words)]} {i}",
+                    description="needle in the haystack" if i % 100_000 == 0 else "",
+                    org=org,
+                    created_by=creator,
+                )
+                for i in range(start, start + 50_000)
+            ], batch_size=5000)
+            SearchDocument.objects.bulk_create([
+                SearchDocument(
+                    content_type=content_type,
+                    object_id=search_registry.get_object_id(Task, task.pk),
+                    body=f"{task.name}\n{task.description}",
+                )
+                for task in tasks
+            ], batch_size=5000)
+
+    def test_search(self):
+        for value in ["haystack", "review"]:
+            counts = []
+            for label, backend in [
+                ("LIKE", DatabaseSearchBackend()),
+                ("FTS5", FTS5SearchBackend()),
+            ]:
+                queryset = backend.search(Task.objects.all(), value)
+                with measure(f"{label} {value!r} count"):
+                    counts.append(queryset.count())
+                with measure(f"{label} {value!r} first page"):
+                    list(queryset.order_by(backend.rank_annotation, "id")[:50])
+            self.assertEqual(counts[0], counts[1])
@@ -0,0 +1,48 @@
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from organization.models import Department
+from tags.models import Tag
+from tasks.models import Task
+
+
+@benchmark
+class BenchSoftDelete(BaseTestClass):
+    """
+    Soft delete an organization with 100k tasks, 10k tags and 1k departments,
+    tasks being in departments. Nothing is cascaded to the organization of
+    the same size created alongside
+    """
+    tasks_count = 100_000
+    tags_count = 10_000
+    departs_count = 1_000
+    batch_size = 5000
+
+    def setUp(self):
+        self.creator, _, self.org = self.create_new_org()
+        _, _, self.other_org = self.create_new_org()
+        for org in [self.org, self.other_org]:
+            self.fill_org(org)
+
+    def fill_org(self, org):
+        departs = Department.objects.bulk_create([
+            Department(name=f"depart {i}", org=org, created_by=self.creator)
+            for i in range(self.departs_count)
+        ])
+        Tag.objects.bulk_create([
+            Tag(name=f"tag {i}", org=org, created_by=self.creator)
+            for i in range(self.tags_count)
+        ], batch_size=self.batch_size)
+        Task.objects.bulk_create([
+            Task(
+                name=f"task {i}", org=org, created_by=self.creator,
+                depart=departs[i % self.departs_count]
+            )
+            for i in range(self.tasks_count)
+        ], batch_size=self.batch_size)
+
+    def test_delete_org(self):
+        with measure(f"soft delete an org with {self.tasks_count} tasks"):
+            count, _ = self.org.delete()
+        self.assertEqual(count, 1 + self.tasks_count + self.tags_count + self.departs_count)
+        self.assertEqual(Task.objects.filter(org=self.other_org).count(), self.tasks_count)
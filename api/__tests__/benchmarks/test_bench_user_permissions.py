@@ -0,0 +1,38 @@
+import uuid
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from app_lib.authorization import auth_checker
+from app_lib.app_permssions import CAN_CREATE_TASK, CAN_CREATE_TAG
+from perms.models import UserPermissions
+from user.models import AppUser
+
+
+@benchmark
+class BenchUserPermissions(BaseTestClass):
+    """Add and remove permissions to 10k users in an org"""
+    users_count = 10_000
+
+    def setUp(self):
+        _, _, self.org = self.create_new_org()
+        self.users = AppUser.objects.bulk_create([
+            AppUser(email=f"{uuid.uuid4()}@bench.co", first_name="bench")
+            for _ in range(self.users_count)
+        ], batch_size=1000)
+
+    def test_add_and_remove_permissions(self):
+        with measure(f"add perms to {self.users_count} users (create)"):
+            auth_checker.add_permissions_to_users(self.users, self.org, [CAN_CREATE_TASK])
+        with measure(f"add perms to {self.users_count} users (update)"):
+            auth_checker.add_permissions_to_users(self.users, self.org, [CAN_CREATE_TAG])
+        with measure(f"add perms to {self.users_count} users (no change)"):
+            auth_checker.add_permissions_to_users(self.users, self.org, [CAN_CREATE_TAG])
+        with measure(f"remove perms from {self.users_count} users"):
+            auth_checker.remove_permissions_from_users(
+                self.users, self.org, [CAN_CREATE_TASK, CAN_CREATE_TAG]
+            )
+        self.assertEqual(
+            UserPermissions.objects.filter(org=self.org, perms=0).count(),
+            self.users_count
+        )
@@ -0,0 +1,73 @@
+from django.db.models import Q
+
+from ..base_classe import BaseTestClass
+from ..lib import benchmark, measure
+
+from app_lib.visibility import VisibilityFilter
+from organization.models import OrgAccess
+from tasks.models import Task
+
+
+@benchmark
+class BenchTaskVisibility(BaseTestClass):
+    """
+    Count and list tasks visible to a user among 50k tasks, with the former
+    OR joins plus `DISTINCT` filter vs `VisibilityFilter`
+    """
+    tasks_count = 50_000
+
+    def setUp(self):
+        self.user = self.create_and_activate_random_user()
+        other_users = [self.create_and_activate_random_user() for _ in range(5)]
+        creator, _, self.org = self.create_new_org()
+        _, _, user_org = self.create_new_org(owner=self.user)
+        tasks = Task.objects.bulk_create([
+            Task(name=f"task {i}", org=user_org if i % 10 == 0 else self.org, created_by=creator)
+            for i in range(self.tasks_count)
+        ], batch_size=5000)
+        assigned = Task.assigned_to.through
+        accessed = Task.can_be_accessed_by.through
+        assigned.objects.bulk_create([
+            assigned(task_id=task.id, appuser_id=user.id)
+            for index, task in enumerate(tasks)
+            for user in other_users + ([self.user] if index % 7 == 0 else [])
+        ], batch_size=5000)
+        accessed.objects.bulk_create([
+            accessed(task_id=task.id, appuser_id=user.id)
+            for index, task in enumerate(tasks)
+            for user in other_users + ([self.user] if index % 5 == 0 else [])
+        ], batch_size=5000)
+
+    def get_distinct_queryset(self):
+        user = self.user
+        return Task.objects.filter(
+            Q(org__in=OrgAccess.objects.org_ids_for(user, OrgAccess.FULL_ACCESS_LEVELS)) |
+            Q(depart__created_by=user) |
+            Q(depart__can_be_accessed_by__in=[user]) |
+            Q(created_by=user) |
+            Q(can_be_accessed_by__in=[user]) |
+            Q(assigned_to__in=[user])
+        ).distinct()
+
+    def get_exists_queryset(self):
+        return VisibilityFilter(Task, self.user).in_orgs(
+            OrgAccess.FULL_ACCESS_LEVELS
+        ).created_by("depart").in_m2m(
+            "can_be_accessed_by", "depart"
+        ).created_by().in_m2m("can_be_accessed_by").in_m2m("assigned_to").filter(
+            Task.objects.all()
+        )
+
+    def test_visibility(self):
+        counts = []
+        for label, get_queryset in [
+            ("OR joins + DISTINCT", self.get_distinct_queryset),
+            ("EXISTS", self.get_exists_queryset),
+        ]:
+            queryset = get_queryset()
+            print(f"\n[benchmark] {label} plan:\n{queryset.order_by('-created_at', '-id')[:50].explain()}")
+            with measure(f"{label} count"):
+                counts.append(queryset.count())
+            with measure(f"{label} first page"):
+                list(queryset.order_by("-created_at", "-id")[:50])
+        self.assertEqual(counts[0], counts[1])
@@ -0,0 +1,170 @@
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.test import override_settings
+from django.utils import timezone
+
+from ...base_classe import BaseTestClass
+from app_lib.views import BulkDeleteResourceMixin
+from jobs.models import Job
+from jobs.worker import job_worker
+from organization.models import Department
+from tasks.models import Task
+from user.models import AppUser as User
+
+
+class TestBulkDeleteJob(BaseTestClass):
+    """### Flow
+    - above `bulk_delete_async_threshold` ids, a 202 response is returned with a pending
+    job and nothing is deleted until a worker runs it
+    - the threshold defaults to the `BULK_DELETE_ASYNC_THRESHOLD` setting
+    - the worker deletes ressources chunk by chunk and reports deleted and not found counts
+    - the job status is only available to its creator
+    - a job with ressources the user can't delete fails and nothing is deleted
+    - jobs left running by a stopped worker are run again, carrying on from the
+    deleted count, and failed after `JOB_MAX_ATTEMPTS` runs
+    - views with their own permissions or url kwargs are rebuilt for the job, eg: users
+    and departments
+    """
+    url_name = "tasks-bulk-delete"
+
+    def setUp(self):
+        self.addCleanup(
+            setattr, BulkDeleteResourceMixin, "bulk_delete_async_threshold",
+            BulkDeleteResourceMixin.bulk_delete_async_threshold
+        )
+        self.addCleanup(
+            setattr, BulkDeleteResourceMixin, "bulk_delete_chunk_size",
+            BulkDeleteResourceMixin.bulk_delete_chunk_size
+        )
+        BulkDeleteResourceMixin.bulk_delete_async_threshold = 2
+        BulkDeleteResourceMixin.bulk_delete_chunk_size = 2
+        self.owner_user, _, self.org = self.create_new_org()
+        self.tasks = self.bulk_create_object(Task, [
+            {"name": f"task {i}", "org": self.org} for i in range(5)
+        ])
+        self.task_ids = [str(task.id) for task in self.tasks]
+
+    def get_job(self, user, job_id):
+        self.url_name = "jobs-detail"
+        return self.auth_get(user, [job_id])
+
+    def test_job_is_accepted(self):
+        response = self.auth_delete(self.owner_user, {"ids": self.task_ids})
+        self.assertEqual(response.status_code, self.status.HTTP_202_ACCEPTED)
+        data = self.loads(response.content)
+        self.assertEqual(data["status"], Job.Status.PENDING)
+        self.assertEqual(data["total_count"], 5)
+        self.assertEqual(Task.objects.filter(id__in=self.task_ids).count(), 5)
+
+    def test_threshold_setting(self):
+        BulkDeleteResourceMixin.bulk_delete_async_threshold = None
+        with override_settings(BULK_DELETE_ASYNC_THRESHOLD=10):
+            response = self.auth_delete(self.owner_user, {"ids": self.task_ids})
+        self.assertEqual(response.status_code, self.status.HTTP_204_NO_CONTENT)
+        self.assertFalse(Job.objects.exists())
+
+    def test_worker_deletes_ressources(self):
+        req_ids = [*self.task_ids, str(uuid.uuid4())]
+        response = self.auth_delete(self.owner_user, {"ids": req_ids})
+        job_id = self.loads(response.content)["id"]
+        self.assertEqual(job_worker.run_pending(), 1)
+
+        self.assertFalse(Task.objects.filter(id__in=self.task_ids).exists())
+        self.assertEqual(Task.all_objects.filter(id__in=self.task_ids).count(), 5)
+        response = self.get_job(self.owner_user, job_id)
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        data = self.loads(response.content)
+        self.assertEqual(data["status"], Job.Status.DONE)
+        self.assertEqual(data["deleted_count"], 5)
+        self.assertEqual(data["not_found_count"], 1)
+        self.assertIsNotNone(data["finished_at"])
+
+    def test_job_only_visible_to_creator(self):
+        response = self.auth_delete(self.owner_user, {"ids": self.task_ids})
+        job_id = self.loads(response.content)["id"]
+        other_user = self.create_and_activate_random_user()
+        response = self.get_job(other_user, job_id)
+        self.assertEqual(response.status_code, self.status.HTTP_404_NOT_FOUND)
+
+    def test_forbidden_ressources(self):
+        user = self.create_and_activate_random_user()
+        self.tasks[0].assigned_to.add(user)
+        self.tasks[3].assigned_to.add(user)
+        response = self.auth_delete(user, {"ids": self.task_ids})
+        self.assertEqual(response.status_code, self.status.HTTP_202_ACCEPTED)
+        job_worker.run_pending()
+
+        job = Job.objects.get(id=self.loads(response.content)["id"])
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertTrue(job.error)
+        self.assertEqual(job.deleted_count, 0)
+        self.assertEqual(Task.objects.filter(id__in=self.task_ids).count(), 5)
+
+    def stop_worker(self, deleted_ids):
+        """Claim the pending job and delete `deleted_ids` as a worker stopped partway would"""
+        job = Job.objects.claim_next()
+        Task.objects.filter(id__in=deleted_ids).delete()
+        Job.objects.filter(pk=job.pk).update(
+            deleted_count=len(deleted_ids),
+            heartbeat_at=timezone.now() - timedelta(seconds=settings.JOB_HEARTBEAT_TIMEOUT + 1)
+        )
+        return job
+
+    def test_stale_job_is_run_again(self):
+        req_ids = [*self.task_ids, str(uuid.uuid4())]
+        self.auth_delete(self.owner_user, {"ids": req_ids})
+        job = self.stop_worker(self.task_ids[:2])
+        # still running for the worker
+        self.assertEqual(
+            Job.objects.reclaim_stale(settings.JOB_HEARTBEAT_TIMEOUT + 60, 3), (0, 0)
+        )
+        self.assertEqual(job_worker.run_pending(), 1)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertEqual(job.attempts, 2)
+        self.assertEqual(job.deleted_count, 5)
+        self.assertEqual(job.not_found_count, 1)
+        self.assertFalse(Task.objects.filter(id__in=self.task_ids).exists())
+
+    def test_stale_job_fails_after_max_attempts(self):
+        self.auth_delete(self.owner_user, {"ids": self.task_ids})
+        job = self.stop_worker([])
+        Job.objects.filter(pk=job.pk).update(attempts=settings.JOB_MAX_ATTEMPTS)
+        self.assertEqual(job_worker.run_pending(), 0)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, Job.Status.FAILED)
+        self.assertTrue(job.error)
+        self.assertIsNotNone(job.finished_at)
+
+    def test_users_job(self):
+        users = []
+        for _ in range(3):
+            user = self.create_and_activate_random_user()
+            user.created_by = self.owner_user
+            user.save()
+            users.append(user)
+        self.url_name = "users-bulk-delete"
+        response = self.auth_delete(self.owner_user, {"ids": [str(user.id) for user in users]})
+        self.assertEqual(response.status_code, self.status.HTTP_202_ACCEPTED)
+        job_worker.run_pending()
+        job = Job.objects.get(id=self.loads(response.content)["id"])
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertEqual(job.deleted_count, 3)
+        self.assertFalse(User.objects.filter(id__in=[user.id for user in users]).exists())
+
+    def test_departments_job(self):
+        departs = [self.create_new_depart(self.org)[-1] for _ in range(3)]
+        self.url_name = "departments-delete"
+        response = self.auth_delete(
+            self.owner_user, {"ids": [str(depart.id) for depart in departs]}, [self.org.id]
+        )
+        self.assertEqual(response.status_code, self.status.HTTP_202_ACCEPTED)
+        job_worker.run_pending()
+        job = Job.objects.get(id=self.loads(response.content)["id"])
+        self.assertEqual(job.status, Job.Status.DONE)
+        self.assertEqual(job.deleted_count, 3)
+        self.assertFalse(Department.objects.filter(org=self.org).exists())
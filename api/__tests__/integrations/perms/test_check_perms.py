@@ -0,0 +1,83 @@
+import uuid
+
+from ...base_classe import BaseTestClass
+from ...lib import wrap_with_query_capture
+from app_lib.app_permssions import CAN_CREATE_TASK, CAN_CHANGE_RESSOURCES_OWNERS
+
+
+class TestCheckPermsView(BaseTestClass):
+    """### Flow
+    - user need to be authenticated
+    - test data validation:
+        - `orgs` is required, should contain valid uuids, as repeated and/or comma separated params
+        - `perm` is required and should be a known permission
+    - test orgs granting the perm are returned in `granted`, others and unknown orgs in `not_granted`
+    - test the number of queries doesn't depend on the number of orgs
+    """
+    url_name = "check-perms"
+
+    def setUp(self):
+        self.user = self.create_and_activate_random_user()
+        _, _, self.created_org = self.create_new_org(creator=self.user)
+        _, _, self.owned_org = self.create_new_org(owner=self.user)
+        _, _, self.member_org = self.create_new_org()
+        _, _, perm_obj = self.create_new_permission(self.member_org, self.user)
+        perm_obj.add_permissions(CAN_CREATE_TASK)
+        _, _, self.other_org = self.create_new_org()
+        self.orgs = [self.created_org, self.owned_org, self.member_org, self.other_org]
+
+    def test_only_authenticated_user_can_access(self):
+        self.evaluate_method_unauthenticated_request(
+            self.HTTP_GET,
+        )
+
+    def test_data_validation(self):
+        test_data = [
+            {"perm": CAN_CREATE_TASK},
+            {"orgs": "", "perm": CAN_CREATE_TASK},
+            {"orgs": "not-an-id", "perm": CAN_CREATE_TASK},
+            {"orgs": str(self.owned_org.id)},
+            {"orgs": str(self.owned_org.id), "perm": "fake_perm"},
+        ]
+        for query_params in test_data:
+            response = self.auth_get(self.user, query_params=query_params)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+
+    def test_granted_and_not_granted_orgs(self):
+        unknown_id = uuid.uuid4()
+        response = self.auth_get(self.user, query_params={
+            "orgs": [
+                f"{self.created_org.id},{self.owned_org.id}",
+                str(self.member_org.id),
+                f"{self.other_org.id},{unknown_id}"
+            ],
+            "perm": CAN_CREATE_TASK.upper()
+        })
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        data = self.loads(response.content)
+        self.assertEqual(data["perm"], CAN_CREATE_TASK)
+        self.assertEqual(data["granted"], [
+            str(self.created_org.id), str(self.owned_org.id), str(self.member_org.id)
+        ])
+        self.assertEqual(data["not_granted"], [str(self.other_org.id), str(unknown_id)])
+
+        response = self.auth_get(self.user, query_params={
+            "orgs": [str(org.id) for org in self.orgs],
+            "perm": CAN_CHANGE_RESSOURCES_OWNERS
+        })
+        data = self.loads(response.content)
+        self.assertEqual(data["granted"], [str(self.created_org.id)])
+
+    def test_constant_number_of_queries(self):
+        with wrap_with_query_capture() as ctx:
+            self.auth_get(self.user, query_params={
+                "orgs": str(self.owned_org.id), "perm": CAN_CREATE_TASK
+            })
+        queries_count = len(ctx.captured_queries)
+        orgs = self.orgs + [self.create_new_org()[2] for _ in range(10)]
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(self.user, query_params={
+                "orgs": [str(org.id) for org in orgs], "perm": CAN_CREATE_TASK
+            })
+        self.assertEqual(len(self.loads(response.content)["granted"]), 3)
+        self.assertEqual(len(ctx.captured_queries), queries_count)
@@ -0,0 +1,222 @@
+import uuid
+
+from django.urls import reverse
+
+from ...base_classe import BaseTestClass
+from ...lib import wrap_with_query_capture
+from tasks.models import Task
+from tasks.serializers import BulkCreateTaskListSerializer
+from tasks.views import TaskViewSet
+from organization.models import Organization
+from search.backends import search_backend
+from app_lib.app_permssions import CAN_CREATE_TASK
+
+
+class TestBulkCreateTaskView(BaseTestClass):
+    """### Flow
+    - user need to be authenticated
+    - test data should be a list of at most `bulk_create_max_size` tasks
+    - test errors are returned by task index and no task is created:
+        - fields validation errors
+        - org, depart, tags and assigned_to references errors
+    - test names should be unique within the org, with existing tasks and in the request
+    - test the user should have access over the org or be allowed to create tasks in it
+    - test tasks are created with their tags and assigned users, in the request order
+    - test assigned_to get added to org members if not existed, invitation emails are
+    sent once tasks are saved
+    - test nothing is saved when the creation fails partway
+    - test created tasks are searchable
+    - test the number of queries doesn't depend on the number of tasks
+    """
+    url_name = "tasks-bulk-create"
+
+    def setUp(self):
+        self.owner_user, self.org_creator, self.org = self.create_new_org()
+        self.tag = self.create_new_tag(self.org)[-1]
+        self.depart = self.create_new_depart(self.org)[-1]
+        _, _, self.another_org = self.create_new_org(owner=self.owner_user)
+        self.another_tag = self.create_new_tag(self.another_org)[-1]
+        self.another_depart = self.create_new_depart(self.another_org)[-1]
+        self.existing_task = self.create_new_task(self.org, name="existing_task")[-1]
+        self.simple_user = self.create_and_activate_random_user()
+        self.simple_user.can_be_accessed_by.add(self.owner_user)
+
+    def post_tasks(self, user, data):
+        # json, lists can't be sent as form data
+        access, _ = self.get_tokens(user)
+        return self.client.post(
+            reverse(self.url_name), data, format="json",
+            headers={"Authorization": f"Bearer {access}"}
+        )
+
+    def assert_task_number(self, count=1):
+        self.assertEqual(Task.objects.count(), count)
+
+    def test_only_authenticated_user_can_access(self):
+        self.evaluate_method_unauthenticated_request(self.HTTP_POST)
+
+    def test_data_should_be_a_list(self):
+        self.addCleanup(
+            setattr, TaskViewSet, "bulk_create_max_size", TaskViewSet.bulk_create_max_size
+        )
+        TaskViewSet.bulk_create_max_size = 2
+        for req_data in [
+            {"name": "task", "org": str(self.org.id)},
+            [{"name": f"task {i}", "org": str(self.org.id)} for i in range(3)],
+        ]:
+            response = self.post_tasks(self.owner_user, req_data)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        self.assert_task_number()
+
+    def test_errors_by_index(self):
+        response = self.post_tasks(self.owner_user, [
+            {"name": "valid_task", "org": str(self.org.id)},
+            {"org": str(self.org.id), "priority": "urgent"},
+            {"name": "task 2", "org": str(uuid.uuid4())},
+            {"name": "task 3", "org": str(self.org.id), "depart": str(self.another_depart.id)},
+            {"name": "task 4", "org": str(self.org.id), "tags": [str(self.another_tag.id)]},
+            {"name": "task 5", "org": str(self.org.id), "assigned_to": [str(uuid.uuid4())]},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        errors = self.loads(response.content)
+        self.assertEqual(len(errors), 6)
+        self.assertEqual(errors[0], {})
+        self.assertEqual(set(errors[1]), {"name", "priority"})
+        self.assertEqual(set(errors[2]), {"org"})
+        self.assertEqual(set(errors[3]), {"depart"})
+        self.assertEqual(set(errors[4]), {"tags"})
+        self.assertEqual(set(errors[5]), {"assigned_to"})
+        self.assert_task_number()
+
+    def test_assigned_to_should_be_accessible_by_org_owner(self):
+        user = self.create_and_activate_random_user()
+        response = self.post_tasks(self.owner_user, [
+            {"name": "task", "org": str(self.org.id), "assigned_to": [str(user.id)]},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(self.loads(response.content)[0]), {"assigned_to"})
+        self.assert_task_number()
+
+    def test_names_should_be_unique_in_org(self):
+        response = self.post_tasks(self.owner_user, [
+            {"name": self.existing_task.name, "org": str(self.org.id)},
+            {"name": "new_task", "org": str(self.org.id)},
+            {"name": "new_task", "org": str(self.org.id)},
+            {"name": "new_task", "org": str(self.another_org.id)},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        errors = self.loads(response.content)
+        self.assertEqual([set(item_errors) for item_errors in errors], [
+            {"name"}, set(), {"name"}, set()
+        ])
+        self.assert_task_number()
+
+    def test_user_should_be_allowed_in_org(self):
+        response = self.post_tasks(self.simple_user, [
+            {"name": "task", "org": str(self.org.id)},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(self.loads(response.content)[0]), {"org"})
+        self.assert_task_number()
+
+        # can_access_org_user
+        self.org.can_be_accessed_by.add(self.simple_user)
+        # user with permission to create task
+        user_wth_perm, _, perm_obj = self.create_new_permission(self.org)
+        perm_obj.add_permissions(CAN_CREATE_TASK)
+        for user in [self.org_creator, self.simple_user, user_wth_perm]:
+            response = self.post_tasks(user, [
+                {"name": f"task {user.email}", "org": str(self.org.id)},
+            ])
+            self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        self.assert_task_number(4)
+
+    def test_bulk_create_tasks(self):
+        req_data = [
+            {
+                "name": "first_task",
+                "description": "bulk created task",
+                "org": str(self.org.id),
+                "assigned_to": [str(self.simple_user.id)],
+                "due_date": "2023-10-10T10:00:00Z",
+                "priority": Task.Priority.HIGH,
+                "estimated_duration": "01:00:00",
+                "tags": [str(self.tag.id)],
+                "depart": str(self.depart.id),
+            },
+            {"name": "second_task", "org": str(self.org.id)},
+            {"name": "third_task", "org": str(self.another_org.id)},
+        ]
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_tasks(self.owner_user, req_data)
+        self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        response_data = self.loads(response.content)
+        self.assertEqual(
+            [task["name"] for task in response_data], [task["name"] for task in req_data]
+        )
+        self.assertEqual(response_data[0]["due_date"], req_data[0]["due_date"])
+        self.assertEqual(response_data[0]["priority"], Task.Priority.HIGH)
+        self.assertEqual(response_data[1]["priority"], Task.Priority.MEDIUM)
+        self.assertEqual(response_data[0]["created_by"], str(self.owner_user.id))
+
+        self.assert_task_number(4)
+        task = Task.objects.get(name="first_task", org=self.org)
+        self.assertEqual(task.depart, self.depart)
+        self.assertTrue(Task.objects.filter(name="third_task", org=self.another_org).exists())
+        self.assertEqual(task.priority_rank, Task.PRIORITY_RANKS[Task.Priority.HIGH])
+        self.assertEqual(list(task.tags.all()), [self.tag])
+        self.assertEqual(list(task.assigned_to.all()), [self.simple_user])
+        self.assertTrue(
+            Organization.objects.filter(id=self.org.id, members__in=[self.simple_user]).exists()
+        )
+        self.assertEqual(
+            [message.to for message in self.get_mailbox()], [[self.simple_user.email]]
+        )
+        self.assertEqual(
+            set(search_backend.search(Task.objects.all(), "bulk created")), {task}
+        )
+
+    def test_nothing_is_created_on_failure(self):
+        def fail(*args, **kwargs):
+            raise RuntimeError("failure after tasks are inserted")
+
+        self.addCleanup(
+            setattr, BulkCreateTaskListSerializer, "add_org_members",
+            BulkCreateTaskListSerializer.add_org_members
+        )
+        BulkCreateTaskListSerializer.add_org_members = fail
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError):
+                self.post_tasks(self.owner_user, [
+                    {
+                        "name": "task",
+                        "org": str(self.org.id),
+                        "tags": [str(self.tag.id)],
+                        "assigned_to": [str(self.simple_user.id)],
+                    },
+                ])
+        self.assert_task_number()
+        self.assertFalse(Task.tags.through.objects.filter(tag=self.tag).exists())
+        self.assertEqual(self.get_mailbox(), [])
+
+    def test_queries_dont_depend_on_tasks_number(self):
+        def get_req_data(prefix, count):
+            return [
+                {
+                    "name": f"{prefix} {i}",
+                    "org": str(self.org.id),
+                    "tags": [str(self.tag.id)],
+                    "assigned_to": [str(self.simple_user.id)],
+                }
+                for i in range(count)
+            ]
+
+        # first request adds `simple_user` to org members
+        self.post_tasks(self.owner_user, get_req_data("first", 1))
+        with wrap_with_query_capture() as small:
+            response = self.post_tasks(self.owner_user, get_req_data("small", 2))
+        self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        with wrap_with_query_capture() as large:
+            response = self.post_tasks(self.owner_user, get_req_data("large", 30))
+        self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
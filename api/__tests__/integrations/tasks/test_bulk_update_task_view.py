@@ -0,0 +1,233 @@
+import uuid
+
+from django.urls import reverse
+
+from ...base_classe import BaseTestClass
+from ...lib import wrap_with_query_capture
+from tasks.models import Task
+from tasks.views import TaskViewSet
+from organization.models import Organization
+from search.backends import search_backend
+
+
+class TestBulkUpdateTaskView(BaseTestClass):
+    """### Flow
+    - user need to be authenticated
+    - test tasks are updated from a list of tasks with their `id` and changed fields:
+        - scalar fields, tags and assigned users are updated
+        - tasks with unchanged fields are skipped
+        - assigned_to get added to org members if not existed
+        - updated tasks are reindexed for search
+    - test errors are returned by task index and no task is updated:
+        - fields validation errors
+        - not found and duplicated task ids
+        - names uniqueness within the org
+        - depart, tags and assigned_to references errors
+    - test tasks are updated from a filter plus a patch, errors are returned by task id
+    - test the number of tasks updated is limited
+    - test users tasks are assigned to can only change their status
+    - test the number of queries doesn't depend on the number of tasks
+    """
+    url_name = "tasks-bulk-update"
+
+    def setUp(self):
+        self.owner_user, self.org_creator, self.org = self.create_new_org()
+        self.tag = self.create_new_tag(self.org)[-1]
+        self.depart = self.create_new_depart(self.org)[-1]
+        _, _, self.another_org = self.create_new_org(owner=self.owner_user)
+        self.another_depart = self.create_new_depart(self.another_org)[-1]
+        self.tasks = [
+            self.create_new_task(self.org, name=f"task {i}")[-1] for i in range(3)
+        ]
+        self.tasks[0].tags.add(self.tag)
+        self.simple_user = self.create_and_activate_random_user()
+        self.simple_user.can_be_accessed_by.add(self.owner_user)
+
+    def patch_tasks(self, user, data):
+        # json, lists can't be sent as form data
+        access, _ = self.get_tokens(user)
+        return self.client.patch(
+            reverse(self.url_name), data, format="json",
+            headers={"Authorization": f"Bearer {access}"}
+        )
+
+    def get_task(self, task):
+        return Task.objects.get(pk=task.pk)
+
+    def test_only_authenticated_user_can_access(self):
+        self.evaluate_method_unauthenticated_request(self.HTTP_PATCH)
+
+    def test_bulk_update_tasks(self):
+        response = self.patch_tasks(self.owner_user, [
+            {
+                "id": str(self.tasks[0].id),
+                "name": "renamed task",
+                "description": "bulk updated task",
+                "priority": Task.Priority.HIGH,
+                "due_date": "2023-10-10T10:00:00Z",
+                "depart": str(self.depart.id),
+                "tags": [],
+                "assigned_to": [str(self.simple_user.id)],
+            },
+            {"id": str(self.tasks[1].id), "status": Task.Status.COMPLETED},
+            {"id": str(self.tasks[2].id), "status": Task.Status.COMPLETED},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        self.assertEqual(self.loads(response.content), {
+            "updated": [str(task.id) for task in self.tasks], "unchanged": [],
+        })
+
+        task = self.get_task(self.tasks[0])
+        self.assertEqual(task.name, "renamed task")
+        self.assertEqual(task.priority_rank, Task.PRIORITY_RANKS[Task.Priority.HIGH])
+        self.assertEqual(task.depart, self.depart)
+        self.assertEqual(task.due_date.isoformat(), "2023-10-10T10:00:00+00:00")
+        self.assertGreater(task.updated_at, self.tasks[0].updated_at)
+        self.assertEqual(list(task.tags.all()), [])
+        self.assertEqual(list(task.assigned_to.all()), [self.simple_user])
+        for other_task in self.tasks[1:]:
+            self.assertEqual(self.get_task(other_task).status, Task.Status.COMPLETED)
+        self.assertTrue(
+            Organization.objects.filter(id=self.org.id, members__in=[self.simple_user]).exists()
+        )
+        self.assertEqual(
+            set(search_backend.search(Task.objects.all(), "bulk updated")), {task}
+        )
+
+    def test_unchanged_tasks_are_skipped(self):
+        response = self.patch_tasks(self.owner_user, [
+            {
+                "id": str(self.tasks[0].id),
+                "name": self.tasks[0].name,
+                "status": self.tasks[0].status,
+                "tags": [str(self.tag.id)],
+            },
+            {"id": str(self.tasks[1].id), "tags": [str(self.tag.id)]},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        self.assertEqual(self.loads(response.content), {
+            "updated": [str(self.tasks[1].id)], "unchanged": [str(self.tasks[0].id)],
+        })
+        self.assertEqual(self.get_task(self.tasks[0]).updated_at, self.tasks[0].updated_at)
+        self.assertEqual(list(self.get_task(self.tasks[1]).tags.all()), [self.tag])
+
+    def test_errors_by_index(self):
+        _, task = self.create_new_task(self.org)
+        response = self.patch_tasks(self.owner_user, [
+            {"id": str(self.tasks[0].id), "status": Task.Status.COMPLETED},
+            {"id": str(self.tasks[1].id), "priority": "urgent"},
+            {"status": Task.Status.COMPLETED},
+            {"id": str(uuid.uuid4()), "status": Task.Status.COMPLETED},
+            {"id": str(self.tasks[0].id), "status": Task.Status.COMPLETED},
+            {"id": str(self.tasks[2].id), "name": self.tasks[1].name},
+            {"id": str(self.tasks[1].id), "depart": str(self.another_depart.id)},
+            {"id": str(task.id), "assigned_to": [str(uuid.uuid4())]},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        errors = self.loads(response.content)
+        self.assertEqual([set(item_errors) for item_errors in errors], [
+            set(), {"priority"}, {"id"}, {"id"}, {"id"}, {"name"}, {"depart"}, {"assigned_to"},
+        ])
+        self.assertEqual(self.get_task(self.tasks[0]).status, Task.Status.PENDING)
+
+    def test_bulk_update_from_filter(self):
+        self.tasks[2].status = Task.Status.IN_PROGRESS
+        self.tasks[2].save()
+        response = self.patch_tasks(self.owner_user, {
+            "filter": {"status": Task.Status.PENDING, "org": str(self.org.id)},
+            "patch": {"status": Task.Status.COMPLETED, "tags": [str(self.tag.id)]},
+        })
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        response_data = self.loads(response.content)
+        self.assertEqual(
+            set(response_data["updated"]), {str(self.tasks[0].id), str(self.tasks[1].id)}
+        )
+        self.assertEqual(response_data["unchanged"], [])
+        self.assertEqual(
+            Task.objects.filter(status=Task.Status.COMPLETED, tags=self.tag).count(), 2
+        )
+        self.assertEqual(self.get_task(self.tasks[2]).status, Task.Status.IN_PROGRESS)
+
+    def test_filter_validation(self):
+        for req_data in [
+            {"filter": {}, "patch": {"status": Task.Status.COMPLETED}},
+            {"filter": {"org": str(self.org.id)}, "patch": {"name": "same name"}},
+            {"filter": {"org": str(self.org.id)}, "patch": {"priority": "urgent"}},
+            {"filter": {"due_date_after": "not a date"}, "patch": {}},
+        ]:
+            response = self.patch_tasks(self.owner_user, req_data)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+
+        response = self.patch_tasks(self.owner_user, {
+            "filter": {"org": str(self.org.id)},
+            "patch": {"depart": str(self.another_depart.id)},
+        })
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        errors = self.loads(response.content)
+        self.assertEqual(set(errors), {str(task.id) for task in self.tasks})
+        self.assertEqual(set(errors[str(self.tasks[0].id)]), {"depart"})
+
+    def test_max_size(self):
+        self.addCleanup(
+            setattr, TaskViewSet, "bulk_update_max_size", TaskViewSet.bulk_update_max_size
+        )
+        TaskViewSet.bulk_update_max_size = 2
+        for req_data in [
+            [{"id": str(task.id), "status": Task.Status.COMPLETED} for task in self.tasks],
+            {"filter": {"org": str(self.org.id)}, "patch": {"status": Task.Status.COMPLETED}},
+        ]:
+            response = self.patch_tasks(self.owner_user, req_data)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Task.objects.filter(status=Task.Status.COMPLETED).exists())
+
+    def test_assigned_user_can_only_update_status(self):
+        self.tasks[0].assigned_to.add(self.simple_user)
+        response = self.patch_tasks(self.simple_user, [
+            {"id": str(self.tasks[0].id), "priority": Task.Priority.HIGH},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_403_FORBIDDEN)
+
+        response = self.patch_tasks(self.simple_user, [
+            {"id": str(self.tasks[0].id), "status": Task.Status.COMPLETED},
+            {"id": str(self.tasks[1].id), "status": Task.Status.COMPLETED},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [set(item_errors) for item_errors in self.loads(response.content)], [set(), {"id"}]
+        )
+
+        response = self.patch_tasks(self.simple_user, [
+            {"id": str(self.tasks[0].id), "status": Task.Status.COMPLETED},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        self.assertEqual(self.get_task(self.tasks[0]).status, Task.Status.COMPLETED)
+
+        self.org.can_be_accessed_by.add(self.simple_user)
+        response = self.patch_tasks(self.simple_user, [
+            {"id": str(self.tasks[1].id), "priority": Task.Priority.HIGH},
+        ])
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+
+    def test_queries_dont_depend_on_tasks_number(self):
+        tasks = self.bulk_create_object(Task, [
+            {"name": f"bulk task {i}", "org": self.org} for i in range(30)
+        ])
+
+        def get_req_data(tasks, suffix):
+            return [
+                {
+                    "id": str(task.id),
+                    "description": f"{task.name} {suffix}",
+                    "priority": Task.Priority.HIGH if i % 2 else Task.Priority.LOW,
+                    "tags": [str(self.tag.id)],
+                }
+                for i, task in enumerate(tasks)
+            ]
+
+        with wrap_with_query_capture() as small:
+            response = self.patch_tasks(self.owner_user, get_req_data(tasks[:2], "small"))
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        with wrap_with_query_capture() as large:
+            response = self.patch_tasks(self.owner_user, get_req_data(tasks[2:], "large"))
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
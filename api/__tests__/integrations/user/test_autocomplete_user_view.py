@@ -0,0 +1,87 @@
+from django.db import connection
+
+from ...base_classe import BaseTestClass
+from ...lib import wrap_with_query_capture
+from user.models import AppUser as User
+
+
+class TestAutocompleteUserView(BaseTestClass):
+    """### Flow
+    - user need to be authenticated
+    - `q` is required, `limit` is bounded
+    - users whose email, first name or last name starts with `q`, case insensitive
+    - only users the user has access to, himself included
+    - results are ordered by matched value and capped to `limit`
+    - each field is matched with a range on its lower cased index
+    """
+    url_name = "users-autocomplete"
+    user_data_list = [
+        {"email": "alice.martin@example.com", "first_name": "Alice", "last_name": "Martin"},
+        {"email": "bob@example.com", "first_name": "Bob", "last_name": "Alvarez"},
+        {"email": "carol@example.com", "first_name": "Albert", "last_name": "Carol"},
+        {"email": "dave@example.com", "first_name": "Dave", "last_name": "Smith"},
+    ]
+
+    def setUp(self):
+        self.owner_user = self.create_and_active_user(
+            email="owner_user@noway.com", first_name="Owner"
+        )
+        self.users = self.bulk_create_object(User, [
+            {**data, "created_by": self.owner_user} for data in self.user_data_list
+        ])
+        self.create_and_active_user(email="alex@example.com", first_name="Alex")
+
+    def autocomplete(self, user=None, **query_params):
+        return self.auth_get(user or self.owner_user, query_params=query_params)
+
+    def test_only_authenticated_user_can_access(self):
+        self.evaluate_method_unauthenticated_request(
+            self.HTTP_GET
+        )
+
+    def test_params_validation(self):
+        for query_params in [{}, {"q": ""}, {"q": "al", "limit": 0}, {"q": "al", "limit": 21}]:
+            response = self.autocomplete(**query_params)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+
+    def test_prefix_matching(self):
+        response = self.autocomplete(q="AL")
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        data = self.loads(response.content)
+        # ordered by matched value, not accessible `alex@example.com` excluded
+        self.assertEqual(
+            [user["email"] for user in data],
+            ["carol@example.com", "alice.martin@example.com", "bob@example.com"]
+        )
+        self.assertEqual(
+            set(data[0]), {"id", "email", "first_name", "last_name", "created_at", "created_by"}
+        )
+
+        data = self.loads(self.autocomplete(q="mart").content)
+        self.assertEqual([user["email"] for user in data], ["alice.martin@example.com"])
+        data = self.loads(self.autocomplete(q="artin").content)
+        self.assertEqual(data, [])
+        data = self.loads(self.autocomplete(q="own").content)
+        self.assertEqual([user["email"] for user in data], ["owner_user@noway.com"])
+
+    def test_access(self):
+        simple_user = self.create_and_active_user(email="simple_user@gmaddil.com")
+        self.assertEqual(self.loads(self.autocomplete(simple_user, q="al").content), [])
+        self.users[1].can_be_accessed_by.add(simple_user)
+        data = self.loads(self.autocomplete(simple_user, q="al").content)
+        self.assertEqual([user["email"] for user in data], ["bob@example.com"])
+
+    def test_limit(self):
+        data = self.loads(self.autocomplete(q="al", limit=2, fields="id").content)
+        self.assertEqual(data, [{"id": str(self.users[2].id)}, {"id": str(self.users[0].id)}])
+
+    def test_uses_prefix_indexes(self):
+        with wrap_with_query_capture() as ctx:
+            self.autocomplete(q="al")
+        queries = [query["sql"] for query in ctx.captured_queries if "LOWER(" in query["sql"]]
+        self.assertEqual(len(queries), 3)
+        for query, index in zip(queries, ["email", "first_name", "last_name"]):
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+                plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+            self.assertIn(f"USING INDEX user_{index}_lower_idx", plan)
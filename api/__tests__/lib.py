@@ -1,3 +1,6 @@
+import os
+import time
+import unittest
 from contextlib import contextmanager
 from django.test.utils import CaptureQueriesContext
 from django.db import connection, reset_queries
@@ -8,4 +11,30 @@ def wrap_with_query_capture(reset=True, show_sql=False):
         reset_queries()
         
     with CaptureQueriesContext(connection) as ctx:
-        yield ctx
\ No newline at end of file
+        yield ctx
+
+
+# benchmarks are slow, they only run when `RUN_BENCHMARKS` env variable is set
+benchmark = unittest.skipUnless(
+    os.environ.get("RUN_BENCHMARKS"), "set RUN_BENCHMARKS=1 to run benchmarks"
+)
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def measure(label):
+    """Print elapsed time and number of queries for `label`. Queries are counted
+    without being logged, the log is capped"""
+    counter = QueryCounter()
+    with connection.execute_wrapper(counter):
+        start = time.perf_counter()
+        yield counter
+        elapsed = time.perf_counter() - start
+    print(f"\n[benchmark] {label}: {elapsed:.3f}s, {counter.count} queries")
@@ -0,0 +1,91 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.authorization import auth_checker
+from app_lib.authorization_cache import decision_cache
+from app_lib.permission_cache import perm_cache
+from app_lib.app_permssions import get_perm_list
+
+
+class TestAuthorizationDecisionCache(BaseTestClass):
+    """
+    - outside of a scope, decisions are always computed
+    - within a scope, a `has_permission` decision is computed once
+    - within a scope, a `has_access_to_obj` decision is computed once
+    - decisions are keyed on user, object and permission
+    - a write during the scope invalidates computed decisions
+    - the explicit invalidation hook drops computed decisions
+    """
+
+    def setUp(self):
+        self.org_owner, self.org_creator, self.org = self.create_new_org()
+        self.user = self.create_and_activate_random_user()
+        self.perm = get_perm_list(default_only=True)[0]
+
+    def test_no_caching_outside_of_a_scope(self):
+        auth_checker.has_permission(self.user, self.org, self.perm)
+        # only the request scoped cache is under test
+        perm_cache.clear()
+        with wrap_with_query_capture() as ctx:
+            auth_checker.has_permission(self.user, self.org, self.perm)
+        self.assertGreater(len(ctx.captured_queries), 0)
+
+    def test_permission_decision_computed_once(self):
+        with decision_cache.scope():
+            self.assertFalse(
+                auth_checker.has_permission(self.user, self.org, self.perm)
+            )
+            with wrap_with_query_capture() as ctx:
+                self.assertFalse(
+                    auth_checker.has_permission(self.user, self.org, self.perm)
+                )
+            self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_access_decision_computed_once(self):
+        self.org.can_be_accessed_by.add(self.user)
+        org = self.org.__class__.objects.get(id=self.org.id)
+        with decision_cache.scope():
+            self.assertTrue(auth_checker.has_access_to_obj(org, self.user))
+            with wrap_with_query_capture() as ctx:
+                self.assertTrue(auth_checker.has_access_to_obj(org, self.user))
+            self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_decisions_keyed_on_user_object_and_perm(self):
+        with decision_cache.scope():
+            self.assertTrue(
+                auth_checker.has_permission(self.org_owner, self.org, self.perm)
+            )
+            self.assertFalse(
+                auth_checker.has_permission(self.user, self.org, self.perm)
+            )
+            self.assertFalse(
+                auth_checker.has_permission(
+                    self.org_owner, self.org, get_perm_list(creator_only=True)[0]
+                )
+            )
+
+    def test_write_invalidates_decisions(self):
+        with decision_cache.scope():
+            self.assertFalse(
+                auth_checker.has_permission(self.user, self.org, self.perm)
+            )
+            _, _, perm_obj = self.create_new_permission(self.org, self.user)
+            perm_obj.add_permissions(self.perm)
+            self.assertTrue(
+                auth_checker.has_permission(self.user, self.org, self.perm)
+            )
+
+    def test_m2m_write_invalidates_decisions(self):
+        with decision_cache.scope():
+            self.assertFalse(auth_checker.has_access_to_obj(self.org, self.user))
+            self.org.can_be_accessed_by.add(self.user)
+            self.assertTrue(auth_checker.has_access_to_obj(self.org, self.user))
+
+    def test_explicit_invalidation(self):
+        with decision_cache.scope():
+            auth_checker.has_permission(self.user, self.org, self.perm)
+            auth_checker.invalidate_cache()
+            perm_cache.clear()
+            with wrap_with_query_capture() as ctx:
+                auth_checker.has_permission(self.user, self.org, self.perm)
+            self.assertGreater(len(ctx.captured_queries), 0)
@@ -0,0 +1,107 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.authorization import auth_checker
+from app_lib.permissions import Is_Object_Or_Org_Or_Depart_Creator
+from tasks.models import Task
+from user.models import AppUser
+
+
+class TestBulkAccessChecks(BaseTestClass):
+    """
+    - inaccessible ids are computed in one query and match per object checks:
+        - for objects access, through `id`, `owner`, `created_by` and `can_be_accessed_by`
+        - for creator access
+        - for access through the object, its org or depart
+    - checks above the threshold use the database in one query
+    """
+
+    def setUp(self):
+        self.user = self.create_and_activate_random_user()
+        _, _, self.org = self.create_new_org()
+        _, _, self.user_org = self.create_new_org(owner=self.user)
+        _, self.depart = self.create_new_depart(self.org, creator=self.user)
+        self.tasks = []
+        for _ in range(8):
+            self.tasks.append(self.create_new_task(self.org)[1])
+        # accessible tasks
+        self.tasks[0].created_by = self.user
+        self.tasks[0].save()
+        self.tasks[1].can_be_accessed_by.add(self.user)
+        self.tasks[2].org = self.user_org
+        self.tasks[2].save()
+        self.tasks[3].depart = self.depart
+        self.tasks[3].save()
+        self.users = [self.create_and_activate_random_user() for _ in range(4)]
+        self.users[0].can_be_accessed_by.add(self.user)
+        self.users[1].created_by = self.user
+        self.users[1].save()
+        self.users.append(self.user)
+
+    def assert_matches_per_obj_check(self, get_inaccessible_ids, check, objs):
+        with wrap_with_query_capture() as ctx:
+            inaccessible = get_inaccessible_ids(
+                type(objs[0]), [obj.id for obj in objs], self.user
+            )
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            inaccessible,
+            {obj.id for obj in objs if not check(obj, self.user)}
+        )
+        return inaccessible
+
+    def test_inaccessible_ids(self):
+        inaccessible = self.assert_matches_per_obj_check(
+            auth_checker.get_inaccessible_ids,
+            auth_checker.has_access_to_obj,
+            self.users
+        )
+        self.assertEqual(inaccessible, {user.id for user in self.users[2:4]})
+        inaccessible = self.assert_matches_per_obj_check(
+            auth_checker.get_inaccessible_ids,
+            auth_checker.has_access_to_obj,
+            self.tasks
+        )
+        self.assertEqual(inaccessible, {task.id for task in self.tasks[2:]})
+
+    def test_creator_inaccessible_ids(self):
+        inaccessible = self.assert_matches_per_obj_check(
+            auth_checker.get_creator_inaccessible_ids,
+            auth_checker.has_creator_access_on_obj,
+            self.users
+        )
+        self.assertEqual(inaccessible, {user.id for user in self.users[:4]} - {self.users[1].id})
+
+    def test_org_depart_or_obj_inaccessible_ids(self):
+        inaccessible = self.assert_matches_per_obj_check(
+            auth_checker.get_org_depart_or_obj_inaccessible_ids,
+            auth_checker.has_access_to_org_depart_or_obj,
+            self.tasks
+        )
+        self.assertEqual(inaccessible, {task.id for task in self.tasks[4:]})
+        permission = Is_Object_Or_Org_Or_Depart_Creator()
+        inaccessible = auth_checker.get_org_depart_or_obj_inaccessible_ids(
+            Task, [task.id for task in self.tasks], self.user, creator_only=True
+        )
+        self.assertEqual(inaccessible, {
+            task.id for task in self.tasks
+            if not permission.permform_check(self.user, task)
+        })
+
+    def test_checks_above_threshold_use_one_query(self):
+        users = list(AppUser.objects.filter(can_be_accessed_by=self.user))
+        users.extend(
+            self.create_and_activate_random_user()
+            for _ in range(auth_checker.BULK_CHECK_THRESHOLD)
+        )
+        AppUser.can_be_accessed_by.through.objects.bulk_create([
+            AppUser.can_be_accessed_by.through(from_appuser_id=user.id, to_appuser_id=self.user.id)
+            for user in users[1:]
+        ])
+        with wrap_with_query_capture() as ctx:
+            self.assertTrue(auth_checker.has_access_to_objs(users, self.user))
+            self.assertFalse(
+                auth_checker.has_access_to_objs(users + [self.users[2]], self.user)
+            )
+            self.assertFalse(auth_checker.has_creator_access_on_objs(users, self.user))
+        self.assertEqual(len(ctx.captured_queries), 3)
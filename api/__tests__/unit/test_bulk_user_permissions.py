@@ -0,0 +1,75 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.authorization import auth_checker
+from app_lib.app_permssions import CAN_CREATE_TASK, CAN_CREATE_TAG
+from perms.models import UserPermissions
+
+
+class TestBulkUserPermissions(BaseTestClass):
+    """
+    - added and not found perms are reported as before
+    - missing permission objects are created, existing ones updated and soft deleted
+    ones restored with only the added perms
+    - the number of queries doesn't depend on the number of users
+    - permissions are removed only from users having them
+    """
+
+    def setUp(self):
+        _, _, self.org = self.create_new_org()
+        self.users = [self.create_and_activate_random_user() for _ in range(6)]
+
+    def get_perms_per_user(self):
+        return {
+            perm_obj.user_id: sorted(perm_obj.get_perms())
+            for perm_obj in UserPermissions.objects.filter(org=self.org)
+        }
+
+    def test_add_permissions(self):
+        added, not_found = auth_checker.add_permissions_to_users(
+            self.users[0], self.org, [CAN_CREATE_TASK, "fake_perm"]
+        )
+        self.assertEqual(added, [CAN_CREATE_TASK])
+        self.assertEqual(not_found, ["fake_perm"])
+        _, _, deleted = self.create_new_permission(self.org, self.users[1])
+        deleted.add_permissions(CAN_CREATE_TASK)
+        deleted.delete()
+
+        with wrap_with_query_capture() as ctx:
+            auth_checker.add_permissions_to_users(self.users, self.org, [CAN_CREATE_TAG])
+        # read, create, restore deleted, update existing, within a savepoint
+        self.assertEqual(len(ctx.captured_queries), 6)
+
+        perms_per_user = self.get_perms_per_user()
+        self.assertEqual(len(perms_per_user), len(self.users))
+        self.assertEqual(
+            perms_per_user[self.users[0].id], sorted([CAN_CREATE_TASK, CAN_CREATE_TAG])
+        )
+        # soft deleted permissions are not restored
+        self.assertEqual(perms_per_user[self.users[1].id], [CAN_CREATE_TAG])
+        self.assertEqual(
+            UserPermissions.all_objects.filter(org=self.org).count(), len(self.users)
+        )
+
+        users = self.users + [self.create_and_activate_random_user() for _ in range(10)]
+        with wrap_with_query_capture() as ctx:
+            auth_checker.add_permissions_to_users(users, self.org, [CAN_CREATE_TASK])
+        # nothing to restore
+        self.assertEqual(len(ctx.captured_queries), 5)
+        self.assertEqual(len(self.get_perms_per_user()), len(users))
+
+    def test_remove_permissions(self):
+        auth_checker.add_permissions_to_users(
+            self.users[:3], self.org, [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        )
+        auth_checker.add_permissions_to_users(self.users[3:], self.org, [CAN_CREATE_TAG])
+        with wrap_with_query_capture() as ctx:
+            removed, not_found = auth_checker.remove_permissions_from_users(
+                self.users, self.org, [CAN_CREATE_TASK, "fake_perm"]
+            )
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(removed, [CAN_CREATE_TASK])
+        self.assertEqual(not_found, ["fake_perm"])
+        self.assertEqual(
+            set(map(tuple, self.get_perms_per_user().values())), {(CAN_CREATE_TAG,)}
+        )
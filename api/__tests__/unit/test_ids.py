@@ -0,0 +1,46 @@
+import time
+import uuid
+
+from ..base_classe import BaseTestClass
+
+from app_lib.ids import uuid7, UUID7Generator
+from tasks.models import Task
+
+
+class TestIds(BaseTestClass):
+    """
+    - UUIDv7 are RFC 9562 version 7 ids holding their creation time in milliseconds
+    - ids generated by a process are strictly increasing, even in the same millisecond
+      and when the counter overflows
+    - new rows get UUIDv7 ids when `UUID7_PRIMARY_KEYS` is enabled, UUIDv4 otherwise
+    """
+
+    def test_uuid7_layout(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        self.assertEqual(value.version, 7)
+        self.assertEqual(value.variant, uuid.RFC_4122)
+        self.assertTrue(before <= value.int >> 80 <= after)
+
+    def test_uuid7_is_monotonic(self):
+        ids = [uuid7() for _ in range(10_000)]
+        self.assertEqual(ids, sorted(set(ids)))
+
+        generator = UUID7Generator()
+        generator._last_ms = time.time_ns() // 1_000_000 + 1000
+        generator._counter = (1 << generator.counter_bits) - 2
+        ids = [generator() for _ in range(3)]
+        self.assertEqual(ids, sorted(set(ids)))
+        self.assertEqual(ids[-1].int >> 80, generator._last_ms)
+
+    def test_primary_keys(self):
+        org = self.create_new_org()[-1]
+        task = Task.objects.create(name="v4", org=org)
+        self.assertEqual(task.id.version, 4)
+        with self.settings(UUID7_PRIMARY_KEYS=True):
+            tasks = [Task.objects.create(name=f"v7 {i}", org=org) for i in range(3)]
+        self.assertEqual([task.id.version for task in tasks], [7, 7, 7])
+        self.assertEqual(
+            list(Task.objects.filter(name__startswith="v7").order_by("id")), tasks
+        )
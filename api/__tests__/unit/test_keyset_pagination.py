@@ -0,0 +1,117 @@
+from datetime import timedelta
+from urllib.parse import urlsplit, parse_qs
+
+from django.utils import timezone
+
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from tasks.models import Task
+
+
+class TestKeysetPagination(BaseTestClass):
+    """
+    - pages can be walked forward and backward over every ordering field, rows are
+      ordered by the field then `id`, without duplicates or missing rows, even with
+      duplicated or null sort values
+    - pages are fetched without offset
+    - invalid cursors are rejected
+    - `ordering=-id` pages over `id` alone, newest first with UUIDv7 ids
+    """
+    url_name = "tasks-list"
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        descriptions = [None, "b", "a", None, "b", "c", None]
+        statuses = [Task.Status.PENDING, Task.Status.COMPLETED, Task.Status.PENDING]
+        priorities = [Task.Priority.HIGH, Task.Priority.LOW]
+        now = timezone.now()
+        due_dates = [None, now, now + timedelta(days=1)]
+        self.tasks = []
+        for index, description in enumerate(descriptions):
+            task = self.create_new_task(self.org)[1]
+            task.description = description
+            task.status = statuses[index % len(statuses)]
+            task.priority = priorities[index % len(priorities)]
+            task.due_date = due_dates[index % len(due_dates)]
+            task.save()
+            self.tasks.append(task)
+
+    def get_expected_ids(self, ordering):
+        field, now = ordering.lstrip("-"), timezone.now()
+        if field == "priority":
+            # sorted by rank then due date ascending with nulls last whatever the rank
+            # direction, the tiebreaker follows the due date
+            sign = -1 if ordering.startswith("-") else 1
+            tasks = sorted(self.tasks, key=lambda task: (
+                sign * Task.PRIORITY_RANKS[task.priority],
+                task.due_date is None, task.due_date or now, task.id.hex
+            ))
+            return [str(task.id) for task in tasks]
+        else:
+            tasks = sorted(self.tasks, key=lambda task: (
+                getattr(task, field) is not None, getattr(task, field) or "", task.id.hex
+            ))
+        ids = [str(task.id) for task in tasks]
+        return ids[::-1] if ordering.startswith("-") else ids
+
+    def get_page(self, query_params):
+        response = self.auth_get(self.owner, query_params={"page_size": 2, **query_params})
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        return self.loads(response.content)
+
+    def get_cursor(self, link):
+        return parse_qs(urlsplit(link).query)["cursor"][0]
+
+    def walk(self, ordering):
+        """Return ids walking every page forward then backward"""
+        forward, backward = [], []
+        data = self.get_page({"ordering": ordering})
+        while True:
+            forward.extend(obj["id"] for obj in data["results"])
+            if not data["next"]:
+                break
+            data = self.get_page({"ordering": ordering, "cursor": self.get_cursor(data["next"])})
+        while True:
+            backward[:0] = [obj["id"] for obj in data["results"]]
+            if not data["previous"]:
+                break
+            data = self.get_page({
+                "ordering": ordering, "cursor": self.get_cursor(data["previous"])
+            })
+        return forward, backward
+
+    def test_pages_over_every_ordering(self):
+        for ordering in [
+            "name", "-name", "description", "-description", "status", "-status",
+            "priority", "-priority", "created_at", "-created_at"
+        ]:
+            expected = self.get_expected_ids(ordering)
+            forward, backward = self.walk(ordering)
+            self.assertEqual(forward, expected, ordering)
+            self.assertEqual(backward, expected, ordering)
+
+    def test_default_ordering(self):
+        forward, _ = self.walk("")
+        self.assertEqual(forward, self.get_expected_ids("-created_at"))
+
+    def test_pages_are_fetched_without_offset(self):
+        data = self.get_page({"ordering": "description"})
+        with wrap_with_query_capture() as ctx:
+            self.get_page({"ordering": "description", "cursor": self.get_cursor(data["next"])})
+        for query in ctx.captured_queries:
+            self.assertNotIn("OFFSET", query["sql"])
+
+    def test_invalid_cursor(self):
+        response = self.auth_get(self.owner, query_params={"cursor": "cD1ub3QtanNvbg=="})
+        self.assertEqual(response.status_code, self.status.HTTP_404_NOT_FOUND)
+
+    def test_id_pagination(self):
+        Task.objects.filter(id__in=[task.id for task in self.tasks]).delete()
+        with self.settings(UUID7_PRIMARY_KEYS=True):
+            self.tasks = [self.create_new_task(self.org)[1] for _ in range(5)]
+
+        expected = [str(task.id) for task in reversed(self.tasks)]
+        forward, backward = self.walk("-id")
+        self.assertEqual(forward, expected)
+        self.assertEqual(backward, expected)
@@ -0,0 +1,94 @@
+from io import StringIO
+
+from django.core.management import call_command
+
+from ..base_classe import BaseTestClass
+
+from organization.models import Organization, OrgAccess
+
+
+class TestOrgAccessIndex(BaseTestClass):
+    """
+    - creator and owner entries are added when an org is created or bulk created
+    - owner entry follows owner changes through save, with `update_fields` by name or
+    attname, and queryset update, from both managers
+    - full access entries follow `can_be_accessed_by` add, remove and clear
+    - member entries follow `members` add, remove and clear, from both sides
+    - `rebuild_access_index` command rebuild the index from organizations data
+    """
+
+    def setUp(self):
+        self.owner, self.creator, self.org = self.create_new_org()
+        self.user = self.create_and_activate_random_user()
+
+    def get_levels(self, user, org):
+        return set(
+            OrgAccess.objects.filter(user=user, org=org)
+            .values_list("access_level", flat=True)
+        )
+
+    def test_creator_and_owner_entries_on_create(self):
+        self.assertEqual(self.get_levels(self.owner, self.org), {OrgAccess.Level.OWNER})
+        self.assertEqual(self.get_levels(self.creator, self.org), {OrgAccess.Level.CREATOR})
+        orgs = self.bulk_create_object(Organization, [
+            {"name": "bulk org 1", "owner": self.user, "created_by": self.user},
+            {"name": "bulk org 2", "owner": self.user},
+        ])
+        self.assertEqual(
+            self.get_levels(self.user, orgs[0]),
+            {OrgAccess.Level.OWNER, OrgAccess.Level.CREATOR}
+        )
+        self.assertEqual(self.get_levels(self.user, orgs[1]), {OrgAccess.Level.OWNER})
+
+    def test_owner_entry_follows_owner_changes(self):
+        self.org.owner = self.user
+        self.org.save()
+        self.assertEqual(self.get_levels(self.owner, self.org), set())
+        self.assertEqual(self.get_levels(self.user, self.org), {OrgAccess.Level.OWNER})
+        Organization.objects.filter(id=self.org.id).update(owner=self.owner)
+        self.assertEqual(self.get_levels(self.user, self.org), set())
+        self.assertEqual(self.get_levels(self.owner, self.org), {OrgAccess.Level.OWNER})
+        Organization.all_objects.filter(id=self.org.id).update(owner=self.user)
+        self.assertEqual(self.get_levels(self.owner, self.org), set())
+        self.assertEqual(self.get_levels(self.user, self.org), {OrgAccess.Level.OWNER})
+
+    def test_owner_entry_follows_owner_changes_with_update_fields(self):
+        org = Organization.objects.get(id=self.org.id)
+        for update_fields in [["owner"], ["owner_id"]]:
+            org.owner_id = self.user.id if org.owner_id == self.owner.id else self.owner.id
+            org.save(update_fields=update_fields)
+            self.assertEqual(self.get_levels(org.owner, org), {OrgAccess.Level.OWNER})
+        self.assertEqual(self.get_levels(self.user, org), set())
+
+    def test_full_access_entries_follow_m2m_changes(self):
+        self.org.can_be_accessed_by.add(self.user)
+        self.assertEqual(self.get_levels(self.user, self.org), {OrgAccess.Level.FULL_ACCESS})
+        self.org.can_be_accessed_by.remove(self.user)
+        self.assertEqual(self.get_levels(self.user, self.org), set())
+        self.org.can_be_accessed_by.add(self.user)
+        self.org.can_be_accessed_by.clear()
+        self.assertEqual(self.get_levels(self.user, self.org), set())
+
+    def test_member_entries_follow_m2m_changes(self):
+        self.org.members.add(self.user)
+        self.assertEqual(self.get_levels(self.user, self.org), {OrgAccess.Level.MEMBER})
+        self.user.organization_set.remove(self.org)
+        self.assertEqual(self.get_levels(self.user, self.org), set())
+        self.user.organization_set.add(self.org)
+        self.assertEqual(self.get_levels(self.user, self.org), {OrgAccess.Level.MEMBER})
+        self.user.organization_set.clear()
+        self.assertEqual(self.get_levels(self.user, self.org), set())
+
+    def test_rebuild_access_index_command(self):
+        self.org.members.add(self.user)
+        self.org.can_be_accessed_by.add(self.user)
+        OrgAccess.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_access_index", stdout=out)
+        self.assertIn("4 entries", out.getvalue())
+        self.assertEqual(
+            self.get_levels(self.user, self.org),
+            {OrgAccess.Level.MEMBER, OrgAccess.Level.FULL_ACCESS}
+        )
+        self.assertEqual(self.get_levels(self.owner, self.org), {OrgAccess.Level.OWNER})
+        self.assertEqual(self.get_levels(self.creator, self.org), {OrgAccess.Level.CREATOR})
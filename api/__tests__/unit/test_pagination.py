@@ -0,0 +1,47 @@
+from django.test import override_settings
+
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+
+class TestPaginationTotalCount(BaseTestClass):
+    """
+    - `total_count` is computed with a `COUNT`, rows aren't loaded
+    - counting is skipped with `include_total=false`
+    - above `PAGINATION_COUNT_LIMIT`, `total_count` is capped and not exact
+    """
+    url_name = "tags-list"
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        self.tags = [self.create_new_tag(self.org)[-1] for _ in range(5)]
+
+    def get_page(self, **query_params):
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(self.owner, query_params=query_params)
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        count_queries = [
+            query["sql"] for query in ctx.captured_queries if "COUNT(" in query["sql"]
+        ]
+        return self.loads(response.content), count_queries
+
+    def test_total_count_is_counted(self):
+        data, count_queries = self.get_page()
+        self.assertEqual(data["total_count"], 5)
+        self.assertTrue(data["total_count_exact"])
+        self.assertEqual(len(count_queries), 1)
+
+    def test_total_count_can_be_skipped(self):
+        data, count_queries = self.get_page(include_total="false")
+        self.assertIsNone(data["total_count"])
+        self.assertEqual(len(data["results"]), 5)
+        self.assertEqual(count_queries, [])
+
+    @override_settings(PAGINATION_COUNT_LIMIT=3)
+    def test_total_count_limit(self):
+        data, _ = self.get_page()
+        self.assertEqual(data["total_count"], 3)
+        self.assertFalse(data["total_count_exact"])
+        data, _ = self.get_page(name=self.tags[0].name)
+        self.assertEqual(data["total_count"], 1)
+        self.assertTrue(data["total_count_exact"])
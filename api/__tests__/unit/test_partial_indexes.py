@@ -0,0 +1,85 @@
+from django.db import connection
+
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from organization.models import Organization, Department
+from perms.models import Role
+from tags.models import Tag
+from tasks.models import Task
+
+
+class TestPartialIndexes(BaseTestClass):
+    """
+    Indexes and unique constraints on live rows, `WHERE NOT is_deleted`:
+    - org objects lists, list views included, and tasks of a department use them
+    - name uniqueness checks use them
+    - soft deleted objects names can be reused
+    """
+    url_name = "tags-list"
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+
+    def get_plan(self, sql, params=()):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return " ".join(str(row[-1]) for row in cursor.fetchall())
+
+    def assert_uses_index(self, queryset, index):
+        sql, params = queryset.query.sql_with_params()
+        self.assertIn(f"USING INDEX {index} ", self.get_plan(sql, params))
+
+    def test_org_lists(self):
+        for model, index in [
+            (Task, "task_org_created_live_idx"),
+            (Tag, "tag_org_created_live_idx"),
+            (Role, "role_org_created_live_idx"),
+            (Department, "depart_org_created_live_idx"),
+        ]:
+            self.assert_uses_index(
+                model.objects.filter(org=self.org).order_by("-created_at")[:50], index
+            )
+        _, depart = self.create_new_depart(self.org)
+        self.assert_uses_index(Task.objects.filter(depart=depart), "task_depart_live_idx")
+
+    def test_list_views(self):
+        for url_name, table, index in [
+            ("tasks-list", "tasks_task", "task_org_created_live_idx"),
+            ("roles-list", "perms_role", "role_org_created_live_idx"),
+        ]:
+            self.url_name = url_name
+            with wrap_with_query_capture() as ctx:
+                response = self.auth_get(self.owner, query_params={"org": str(self.org.id)})
+            self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+            page_query = next(
+                query["sql"] for query in ctx.captured_queries
+                if query["sql"].startswith(f'SELECT "{table}"."id"')
+            )
+            self.assertIn(f"USING INDEX {index} ", self.get_plan(page_query))
+
+    def test_name_uniqueness_checks(self):
+        for queryset, index in [
+            (Task.objects.filter(name="name", org=self.org), "task_name_org_live_uniq"),
+            (Tag.objects.filter(name="name", org=self.org), "tag_name_org_live_uniq"),
+            (Role.objects.filter(name="name", org=self.org), "role_name_org_live_uniq"),
+            (Department.objects.filter(name="name", org=self.org), "depart_name_org_live_uniq"),
+            (Organization.objects.filter(name="name", owner=self.owner), "org_name_owner_live_uniq"),
+        ]:
+            self.assert_uses_index(queryset.values("pk")[:1], index)
+
+    def test_soft_deleted_names_reuse(self):
+        _, tag = self.create_new_tag(self.org, name="reused")
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_post(self.owner, {"org": self.org.id, "name": "reused"})
+        self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
+        check = next(
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].startswith('SELECT 1 AS "a" FROM "tags_tag"')
+        )
+        self.assertIn("USING INDEX tag_name_org_live_uniq ", self.get_plan(check))
+
+        tag.delete()
+        response = self.auth_post(self.owner, {"org": self.org.id, "name": "reused"})
+        self.assertEqual(response.status_code, self.status.HTTP_201_CREATED)
+        self.assertEqual(Tag.all_objects.filter(name="reused", org=self.org).count(), 2)
@@ -0,0 +1,89 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.authorization import auth_checker
+from app_lib.permission_cache import perm_cache
+from app_lib.app_permssions import CAN_CREATE_TASK, CAN_CREATE_TAG
+from organization.models import Organization
+from perms.models import UserPermissions
+
+
+class TestPermissionCache(BaseTestClass):
+    """
+    - resolved permissions are reused across requests, counted as hits
+    - entries are invalidated when:
+        - user permissions are changed or soft deleted
+        - a role is changed, soft deleted or its users change, from both sides
+        - org owner or can_be_accessed_by change, owner included through queryset update
+    - the cache is neither read nor filled within `bypass`
+    """
+
+    def setUp(self):
+        perm_cache.clear()
+        perm_cache.reset_stats()
+        _, _, self.org = self.create_new_org()
+        self.user = self.create_and_activate_random_user()
+
+    def assert_has_perm(self, perm, expected=True):
+        self.assertEqual(
+            auth_checker.has_permission(self.user, self.org, perm), expected
+        )
+
+    def test_hits_and_misses(self):
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        with wrap_with_query_capture() as ctx:
+            self.assert_has_perm(CAN_CREATE_TASK, False)
+            self.assert_has_perm(CAN_CREATE_TAG, False)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(
+            perm_cache.stats(), {"hits": 2, "misses": 1, "hit_ratio": 2 / 3}
+        )
+
+    def test_user_permissions_invalidation(self):
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        _, _, perm_obj = self.create_new_permission(self.org, self.user)
+        perm_obj.add_permissions(CAN_CREATE_TASK)
+        self.assert_has_perm(CAN_CREATE_TASK)
+        UserPermissions.objects.filter(id=perm_obj.id).delete()
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+
+    def test_role_invalidation(self):
+        _, role = self.create_new_role(self.org)
+        role.add_permissions(CAN_CREATE_TAG)
+        self.assert_has_perm(CAN_CREATE_TAG, False)
+        role.users.add(self.user)
+        self.assert_has_perm(CAN_CREATE_TAG)
+        role.remove_permissions(CAN_CREATE_TAG)
+        self.assert_has_perm(CAN_CREATE_TAG, False)
+        role.add_permissions(CAN_CREATE_TAG)
+        self.user.role_set.remove(role)
+        self.assert_has_perm(CAN_CREATE_TAG, False)
+        role.users.add(self.user)
+        self.assert_has_perm(CAN_CREATE_TAG)
+        role.delete()
+        self.assert_has_perm(CAN_CREATE_TAG, False)
+
+    def test_org_invalidation(self):
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        self.org.can_be_accessed_by.add(self.user)
+        self.assert_has_perm(CAN_CREATE_TASK)
+        self.org.can_be_accessed_by.remove(self.user)
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        self.org.owner = self.user
+        self.org.save()
+        self.assert_has_perm(CAN_CREATE_TASK)
+        Organization.objects.filter(id=self.org.id).update(owner=self.org.created_by)
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+
+    def test_bypass(self):
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        with perm_cache.bypass():
+            auth_checker.invalidate_cache()
+            with wrap_with_query_capture() as ctx:
+                self.assert_has_perm(CAN_CREATE_TASK, False)
+        self.assertGreater(len(ctx.captured_queries), 0)
+        self.assertEqual(perm_cache.stats(), {"hits": 0, "misses": 1, "hit_ratio": 0.0})
+
+        auth_checker.invalidate_cache()
+        self.assert_has_perm(CAN_CREATE_TASK, False)
+        self.assertEqual(perm_cache.stats()["hits"], 1)
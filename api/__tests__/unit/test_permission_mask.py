@@ -0,0 +1,89 @@
+from ..base_classe import BaseTestClass
+
+from app_lib.app_permssions import (
+    PERMISSION_BITS,
+    get_perm_list,
+    perms_to_mask,
+    mask_to_perms,
+    CAN_CREATE_TASK,
+    CAN_CREATE_TAG,
+)
+from perms.models import UserPermissions, Role
+from perms.filters import RoleDataFilter
+
+
+class TestPermissionMask(BaseTestClass):
+    """
+    - every registered permission has its own bit
+    - mask conversion ignore unknown permissions and round trip known ones
+    - perms can still be assigned as a list or a comma separated string
+    - add and remove permissions update the stored mask
+    - `filter_with_perms` only match objects having the exact permission bits
+    - role search match roles by permission label
+    """
+
+    def setUp(self):
+        _, _, self.org = self.create_new_org()
+        self.user, _, self.perm_obj = self.create_new_permission(self.org)
+
+    def test_each_permission_has_its_own_bit(self):
+        self.assertCountEqual(PERMISSION_BITS.keys(), get_perm_list())
+        self.assertEqual(
+            len(set(PERMISSION_BITS.values())), len(PERMISSION_BITS)
+        )
+
+    def test_mask_conversion(self):
+        perms = [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        mask = perms_to_mask(perms + ["fake_perm"])
+        self.assertEqual(mask, perms_to_mask(perms))
+        self.assertCountEqual(mask_to_perms(mask), perms)
+        self.assertEqual(mask_to_perms(0), [])
+
+    def test_perms_assignment(self):
+        self.perm_obj.perms = [CAN_CREATE_TASK]
+        self.assertEqual(self.perm_obj.perms, perms_to_mask([CAN_CREATE_TASK]))
+        self.perm_obj.perms = f"{CAN_CREATE_TASK},{CAN_CREATE_TAG}"
+        self.assertCountEqual(
+            self.perm_obj.get_perms(), [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        )
+        with self.assertRaises(ValueError):
+            self.perm_obj.perms = None
+
+    def test_add_and_remove_permissions(self):
+        added, not_found = self.perm_obj.add_permissions(
+            [CAN_CREATE_TASK, CAN_CREATE_TAG, "fake_perm"]
+        )
+        self.assertCountEqual(added, [CAN_CREATE_TASK, CAN_CREATE_TAG])
+        self.assertEqual(not_found, ["fake_perm"])
+        self.perm_obj.refresh_from_db()
+        self.assertCountEqual(
+            self.perm_obj.get_perms(), [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        )
+        self.perm_obj.remove_permissions(CAN_CREATE_TAG)
+        self.perm_obj.refresh_from_db()
+        self.assertEqual(self.perm_obj.get_perms(), [CAN_CREATE_TASK])
+
+    def test_filter_with_perms(self):
+        self.perm_obj.add_permissions([CAN_CREATE_TASK])
+        queryset = UserPermissions.objects.filter(id=self.perm_obj.id)
+        self.assertTrue(
+            UserPermissions.filter_with_perms(queryset, CAN_CREATE_TASK).exists()
+        )
+        self.assertFalse(
+            UserPermissions.filter_with_perms(queryset, CAN_CREATE_TAG).exists()
+        )
+        self.assertFalse(
+            UserPermissions.filter_with_perms(
+                queryset, [CAN_CREATE_TASK, CAN_CREATE_TAG]
+            ).exists()
+        )
+
+    def test_role_search_by_permission(self):
+        _, role = self.create_new_role(self.org)
+        role.add_permissions([CAN_CREATE_TAG])
+        _, other_role = self.create_new_role(self.org)
+        other_role.add_permissions([CAN_CREATE_TASK])
+        queryset = RoleDataFilter().search_through(
+            Role.objects.all(), "search", "create_TAG"
+        )
+        self.assertEqual(list(queryset), [role])
@@ -0,0 +1,68 @@
+from ..base_classe import BaseTestClass
+
+from app_lib.app_permssions import (
+    perm_registry,
+    PermissionRegistry,
+    APP_PERMISSIONS,
+    CREATOR_ONLY_PERMS,
+    PERMISSION_BITS,
+    get_perm_list,
+    get_perm_data,
+    CAN_CREATE_TASK,
+    CAN_CHANGE_RESSOURCES_OWNERS,
+)
+
+
+class TestPermissionRegistry(BaseTestClass):
+    """
+    - default and creator only permissions are frozensets matching the definitions
+    - permission ids are the permission bits
+    - registry can't be changed
+    - registry can't be compiled when a permission doesn't have its own bit
+    - permission data are precomputed and returned as is
+    """
+
+    def test_permission_sets(self):
+        self.assertIsInstance(perm_registry.default, frozenset)
+        self.assertEqual(perm_registry.default, set(APP_PERMISSIONS))
+        self.assertEqual(perm_registry.creator_only, set(CREATOR_ONLY_PERMS))
+        self.assertEqual(
+            perm_registry.all, perm_registry.default | perm_registry.creator_only
+        )
+        self.assertEqual(get_perm_list(), list(perm_registry.all_list))
+        self.assertEqual(
+            get_perm_list(creator_only=True), [CAN_CHANGE_RESSOURCES_OWNERS]
+        )
+
+    def test_permission_ids(self):
+        self.assertEqual(dict(perm_registry.ids), PERMISSION_BITS)
+        self.assertEqual(
+            perm_registry.masks[CAN_CREATE_TASK], 1 << PERMISSION_BITS[CAN_CREATE_TASK]
+        )
+        self.assertEqual(
+            perm_registry.all_mask,
+            perm_registry.default_mask | perm_registry.masks[CAN_CHANGE_RESSOURCES_OWNERS]
+        )
+
+    def test_registry_is_immutable(self):
+        with self.assertRaises(AttributeError):
+            perm_registry.default = frozenset()
+        with self.assertRaises(TypeError):
+            perm_registry.ids[CAN_CREATE_TASK] = 10
+        with self.assertRaises(TypeError):
+            perm_registry.data[CAN_CREATE_TASK]["label"] = "changed"
+
+    def test_each_permission_needs_its_own_bit(self):
+        with self.assertRaises(ValueError):
+            PermissionRegistry(APP_PERMISSIONS, CREATOR_ONLY_PERMS, {
+                **PERMISSION_BITS, CAN_CREATE_TASK: PERMISSION_BITS[CAN_CHANGE_RESSOURCES_OWNERS]
+            })
+        with self.assertRaises(ValueError):
+            PermissionRegistry(APP_PERMISSIONS, CREATOR_ONLY_PERMS, {})
+
+    def test_permission_data(self):
+        data = get_perm_data([CAN_CREATE_TASK, "fake_perm"])
+        self.assertEqual(len(data), 1)
+        self.assertIs(data[0], perm_registry.data[CAN_CREATE_TASK])
+        self.assertEqual(data[0]["label"], CAN_CREATE_TASK)
+        self.assertEqual(data[0]["name"], APP_PERMISSIONS[CAN_CREATE_TASK]["name"])
@@ -0,0 +1,101 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.permission_resolver import perm_resolver, OrgPermissions
+from app_lib.app_permssions import (
+    get_perm_list,
+    CAN_CREATE_TASK,
+    CAN_CREATE_TAG,
+    CAN_CHANGE_RESSOURCES_OWNERS,
+)
+from user.lib import get_user_authorizations_per_org
+
+
+class TestEffectivePermissionResolver(BaseTestClass):
+    """
+    - orgs the user has access to are resolved in one query
+    - creator has every perms
+    - owner and user in can_be_accessed_by have default perms only
+    - members get direct and role perms
+    - roles are loaded with one additional query when requested
+    - orgs can be restricted, even to orgs the user has no access to
+    - user authorizations per org are built from the resolver
+    """
+
+    def setUp(self):
+        self.user = self.create_and_activate_random_user()
+        _, _, self.created_org = self.create_new_org(creator=self.user)
+        _, _, self.owned_org = self.create_new_org(owner=self.user)
+        _, _, self.full_access_org = self.create_new_org()
+        self.full_access_org.can_be_accessed_by.add(self.user)
+        _, _, self.member_org = self.create_new_org()
+        self.member_org.members.add(self.user)
+        _, _, self.perm_obj = self.create_new_permission(self.member_org, self.user)
+        self.perm_obj.add_permissions(CAN_CREATE_TASK)
+        _, self.role = self.create_new_role(self.member_org)
+        self.role.add_permissions(CAN_CREATE_TAG)
+        self.role.users.add(self.user)
+        _, _, self.other_org = self.create_new_org()
+
+    def test_resolve_in_one_query(self):
+        with wrap_with_query_capture() as ctx:
+            resolved = perm_resolver.resolve(self.user)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertCountEqual(resolved.keys(), [
+            self.created_org.id, self.owned_org.id,
+            self.full_access_org.id, self.member_org.id
+        ])
+        for org_perms in resolved.values():
+            self.assertIsInstance(org_perms, OrgPermissions)
+            self.assertEqual(org_perms.roles, [])
+
+    def test_effective_perms(self):
+        resolved = perm_resolver.resolve(self.user)
+        self.assertCountEqual(
+            resolved[self.created_org.id].get_perms(), get_perm_list()
+        )
+        for org in [self.owned_org, self.full_access_org]:
+            self.assertCountEqual(
+                resolved[org.id].get_perms(), get_perm_list(default_only=True)
+            )
+            self.assertFalse(resolved[org.id].has(CAN_CHANGE_RESSOURCES_OWNERS))
+        member_perms = resolved[self.member_org.id]
+        self.assertEqual(member_perms.direct_mask, self.perm_obj.perms)
+        self.assertEqual(member_perms.role_mask, self.role.perms)
+        self.assertCountEqual(
+            member_perms.get_perms(), [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        )
+        self.assertFalse(member_perms.has("fake_perm"))
+
+    def test_resolve_with_roles(self):
+        with wrap_with_query_capture() as ctx:
+            resolved = perm_resolver.resolve(self.user, with_roles=True)
+        self.assertEqual(len(ctx.captured_queries), 2)
+        self.assertEqual(resolved[self.member_org.id].roles, [self.role])
+        self.assertEqual(resolved[self.owned_org.id].roles, [])
+
+    def test_resolve_restricted_orgs(self):
+        self.assertIsNotNone(perm_resolver.resolve_org(self.user, self.other_org))
+        self.assertEqual(
+            perm_resolver.resolve_org(self.user, self.other_org).get_perms(), []
+        )
+        resolved = perm_resolver.resolve(
+            self.user, orgs=[self.member_org, self.other_org]
+        )
+        self.assertCountEqual(
+            resolved.keys(), [self.member_org.id, self.other_org.id]
+        )
+
+    def test_user_authorizations_per_org(self):
+        with wrap_with_query_capture() as ctx:
+            data = get_user_authorizations_per_org(self.user)
+        self.assertEqual(len(ctx.captured_queries), 2)
+        data_per_org = {item["org"]["id"]: item for item in data}
+        self.assertEqual(len(data_per_org), 4)
+        member_data = data_per_org[self.member_org.id]
+        self.assertCountEqual(
+            [perm["label"] for perm in member_data["perms"]],
+            [CAN_CREATE_TASK, CAN_CREATE_TAG]
+        )
+        self.assertEqual(member_data["roles"][0]["id"], self.role.id)
+        self.assertEqual(member_data["roles"][0]["perms"], [CAN_CREATE_TAG])
@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from tasks.models import Task
+
+
+class TestPriorityOrdering(BaseTestClass):
+    """
+    - `priority_rank` follows `priority`, including bulk and queryset updates
+    - `ordering=priority` sorts tasks by priority rank then due date, soonest first with
+    tasks without due date last in both directions
+    - pages of an org tasks are read from the priority index, without sorting
+    """
+    url_name = "tasks-list"
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        now = timezone.now()
+        self.tasks = Task.objects.bulk_create([
+            Task(name=name, org=self.org, priority=priority, due_date=due_date)
+            for name, priority, due_date in [
+                ("low", Task.Priority.LOW, now),
+                ("critical soon", Task.Priority.CRITICAL, now),
+                ("medium", Task.Priority.MEDIUM, None),
+                ("critical later", Task.Priority.CRITICAL, now + timedelta(days=1)),
+                ("high", Task.Priority.HIGH, now),
+                ("critical no due date", Task.Priority.CRITICAL, None),
+            ]
+        ])
+
+    def get_names(self, ordering):
+        response = self.auth_get(
+            self.owner, query_params={"org": str(self.org.id), "ordering": ordering}
+        )
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        return [task["name"] for task in self.loads(response.content)["results"]]
+
+    def get_rank(self, task):
+        return Task.objects.values_list("priority_rank", flat=True).get(pk=task.pk)
+
+    def test_rank_follows_priority(self):
+        task = self.tasks[0]
+        self.assertEqual(self.get_rank(task), 1)
+        task.priority = Task.Priority.HIGH
+        task.save()
+        self.assertEqual(self.get_rank(task), 3)
+        Task.objects.filter(pk=task.pk).update(priority=Task.Priority.MEDIUM)
+        self.assertEqual(self.get_rank(task), 2)
+        task.priority = Task.Priority.CRITICAL
+        Task.objects.bulk_update([task], ["priority"])
+        self.assertEqual(self.get_rank(task), 4)
+
+    def test_ordering(self):
+        self.assertEqual(self.get_names("-priority"), [
+            "critical soon", "critical later", "critical no due date", "high", "medium", "low"
+        ])
+        self.assertEqual(self.get_names("priority"), [
+            "low", "medium", "high", "critical soon", "critical later", "critical no due date"
+        ])
+
+    def test_pages_use_index(self):
+        with wrap_with_query_capture() as ctx:
+            self.get_names("-priority")
+        page_query = next(
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].startswith('SELECT "tasks_task"."id"')
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {page_query}")
+            plan = " ".join(str(row[-1]) for row in cursor.fetchall())
+        self.assertIn("USING INDEX task_org_priority_due_idx ", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -0,0 +1,123 @@
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from ..base_classe import BaseTestClass
+
+from jobs.purge import SoftDeletePurger
+from organization.models import Organization
+from tags.models import Tag
+from tasks.models import Task
+from user.models import AppUser
+
+
+class TestPurgeSoftDeleted(BaseTestClass):
+    """
+    - rows soft deleted before the retention window are hard deleted, recent and live
+    ones are kept
+    - rows soft deleted without `deleted_at` use their last update date
+    - rows are deleted in batches
+    - purged rows are archived with their many to many ids when requested
+    - models cascaded from others are purged first
+    - rows are kept while rows cascaded from them are within their retention window
+    - dry run only counts rows
+    """
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        self.tasks = [self.create_new_task(self.org)[-1] for _ in range(4)]
+        self.tag = self.create_new_tag(self.org)[-1]
+        self.tasks[0].tags.add(self.tag)
+        self.tasks[0].assigned_to.add(self.owner)
+        for task in self.tasks[:3]:
+            task.delete()
+        self.old = timezone.now() - timedelta(days=40)
+        Task.all_objects.filter(pk__in=[self.tasks[0].pk, self.tasks[1].pk]).update(
+            deleted_at=self.old
+        )
+
+    def purge(self, *args):
+        out = StringIO()
+        call_command("purge_soft_deleted", "--sleep", "0", *args, stdout=out)
+        return out.getvalue()
+
+    def get_task_ids(self):
+        return set(Task.all_objects.values_list("id", flat=True))
+
+    def test_retention(self):
+        output = self.purge("--days", "30")
+        self.assertIn("Purged rows: ", output)
+        self.assertEqual(self.get_task_ids(), {self.tasks[2].id, self.tasks[3].id})
+        self.assertTrue(Tag.objects.filter(pk=self.tag.pk).exists())
+
+        self.purge("--days", "0")
+        self.assertEqual(self.get_task_ids(), {self.tasks[3].id})
+
+    def test_without_deleted_at(self):
+        Task.all_objects.filter(pk=self.tasks[2].pk).update(
+            deleted_at=None, updated_at=self.old
+        )
+        self.purge("--days", "30")
+        self.assertEqual(self.get_task_ids(), {self.tasks[3].id})
+
+    def test_batches(self):
+        deleted = SoftDeletePurger(retention_days=30, batch_size=1, sleep=0).purge()
+        self.assertEqual(deleted[Task._meta.label], 2)
+        self.assertEqual(self.get_task_ids(), {self.tasks[2].id, self.tasks[3].id})
+
+    def test_archive(self):
+        fd, path = tempfile.mkstemp(suffix=".ndjson.gz")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        self.purge("--days", "30", "--archive", path)
+
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            rows = {row["fields"]["id"]: row for row in map(json.loads, archive)}
+        self.assertEqual(set(rows), {str(self.tasks[0].id), str(self.tasks[1].id)})
+        row = rows[str(self.tasks[0].id)]
+        self.assertEqual(row["model"], Task._meta.label)
+        self.assertEqual(row["fields"]["name"], self.tasks[0].name)
+        self.assertEqual(row["fields"]["org_id"], str(self.org.id))
+        self.assertEqual(row["fields"]["tags"], [str(self.tag.id)])
+        self.assertEqual(row["fields"]["assigned_to"], [str(self.owner.id)])
+
+    def test_models_order(self):
+        models = SoftDeletePurger().get_models()
+        for dependent, model in [
+            (Task, Organization), (Tag, Organization), (Organization, AppUser),
+        ]:
+            self.assertLess(models.index(dependent), models.index(model))
+
+    def test_cascaded_rows_retention(self):
+        _, _, org = self.create_new_org()
+        task = self.create_new_task(org)[-1]
+        org.delete()
+        Organization.all_objects.filter(pk=org.pk).update(deleted_at=self.old)
+        # soft deleted before `deleted_at` existed, updated since
+        Task.all_objects.filter(pk=task.pk).update(deleted_at=None)
+
+        fd, path = tempfile.mkstemp(suffix=".ndjson.gz")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        self.purge("--days", "30", "--archive", path)
+        self.assertTrue(Organization.all_objects.filter(pk=org.pk).exists())
+        self.assertTrue(Task.all_objects.filter(pk=task.pk).exists())
+
+        Task.all_objects.filter(pk=task.pk).update(updated_at=self.old)
+        self.purge("--days", "30", "--archive", path)
+        self.assertFalse(Organization.all_objects.filter(pk=org.pk).exists())
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            archived = {row["fields"]["id"] for row in map(json.loads, archive)}
+        self.assertTrue({str(org.pk), str(task.pk)}.issubset(archived))
+
+    def test_dry_run(self):
+        output = self.purge("--days", "30", "--dry-run")
+        self.assertIn("Rows to purge: 2", output)
+        self.assertIn(f"{Task._meta.label}: 2", output)
+        self.assertEqual(len(self.get_task_ids()), 4)
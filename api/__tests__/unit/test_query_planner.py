@@ -0,0 +1,78 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.query_planner import query_planner
+from app_lib.read_only_serializers import (
+    TaskSerializer,
+    TaskDetailSerializer,
+    SimpleRoleSerializer,
+)
+from perms.models import Role
+
+
+class TestSerializerQueryPlanner(BaseTestClass):
+    """
+    - plans only load rendered fields, primary key relations load the key only
+    - nested forward relations are selected, many to many ones are prefetched
+    - serializers reading non model fields load every field of their model
+    - plans are computed once per serializer class
+    - list and retrieve views don't load unrendered relations, queries
+      don't grow with rows or relations
+    """
+
+    def test_plain_serializer_plan(self):
+        plan = query_planner.get_plan(TaskSerializer)
+        self.assertEqual(plan.fields, {
+            "id", "name", "description", "due_date", "priority", "status",
+            "estimated_duration", "actual_duration", "created_at", "created_by",
+        })
+        self.assertEqual(plan.select_related, [])
+        self.assertEqual(plan.prefetches, [])
+        self.assertIs(query_planner.get_plan(TaskSerializer), plan)
+
+    def test_nested_serializer_plan(self):
+        plan = query_planner.get_plan(TaskDetailSerializer)
+        self.assertEqual(set(plan.select_related), {
+            "org", "org__owner", "org__created_by", "depart", "depart__org",
+            "depart__org__owner", "depart__org__created_by", "depart__created_by",
+        })
+        self.assertIn("org__owner__email", plan.fields)
+        self.assertNotIn("org__owner__password", plan.fields)
+        prefetches = dict(plan.prefetches)
+        self.assertEqual(set(prefetches), {"assigned_to", "tags", "can_be_accessed_by"})
+        self.assertEqual(prefetches["tags"].fields, {
+            "id", "name", "description", "created_at", "created_by"
+        })
+
+    def test_opaque_serializer_plan(self):
+        plan = query_planner.get_plan(SimpleRoleSerializer)
+        self.assertEqual(plan.fields, {field.name for field in Role._meta.concrete_fields})
+
+    def test_views_queries(self):
+        owner, _, org = self.create_new_org()
+        _, task = self.create_new_task(org)
+        self.url_name = "tasks-list"
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(owner)
+        self.assertEqual(len(self.loads(response.content)["results"]), 1)
+        list_queries = [query["sql"] for query in ctx.captured_queries]
+        for query in list_queries:
+            self.assertNotIn("organization_organization_can_be_accessed_by", query)
+
+        self.url_name = "tasks-detail"
+        with wrap_with_query_capture() as ctx:
+            self.auth_get(owner, args=[task.id])
+        queries_count = len(ctx.captured_queries)
+        for _ in range(3):
+            self.create_new_task(org)
+            task.assigned_to.add(self.create_and_activate_random_user())
+            task.tags.add(self.create_new_tag(org)[1])
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(owner, args=[task.id])
+        self.assertEqual(len(self.loads(response.content)["assigned_to"]), 3)
+        self.assertEqual(len(ctx.captured_queries), queries_count)
+
+        self.url_name = "tasks-list"
+        with wrap_with_query_capture() as ctx:
+            self.auth_get(owner)
+        self.assertEqual(len(ctx.captured_queries), len(list_queries))
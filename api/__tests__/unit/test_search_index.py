@@ -0,0 +1,104 @@
+from ..base_classe import BaseTestClass
+
+from search.backends import search_backend
+from search.documents import search_registry
+from search.models import SearchDocument
+from tags.models import Tag
+from tasks.models import Task
+
+
+class TestSearchIndex(BaseTestClass):
+    """
+    - documents are created, updated and removed along with their object:
+        - saved, soft deleted and deleted objects
+    - `search` filter matches substrings of documents, case insensitively, ranked
+    - tasks priority, status and tags names only match the whole searched value
+    - values too short for the index fall back to the default search
+    - results are ordered by rank unless an ordering is requested
+    """
+    url_name = "tasks-list"
+
+    def setUp(self):
+        self.owner_user, _, self.org = self.create_new_org()
+        _, self.task = self.create_new_task(self.org, name="Prepare quarterly report")
+        _, self.tag = self.create_new_tag(self.org, name="finance")
+
+    def get_body(self, obj):
+        document = SearchDocument.objects.filter(
+            content_type=search_registry.get_content_type(type(obj)),
+            object_id=search_registry.get_object_id(type(obj), obj.pk),
+        ).first()
+        return document.body if document else None
+
+    def search(self, value, **query_params):
+        response = self.auth_get(
+            self.owner_user, query_params={"search": value, **query_params}
+        )
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        return [result["id"] for result in self.loads(response.content)["results"]]
+
+    def test_documents_follow_objects(self):
+        self.assertIn("Prepare quarterly report", self.get_body(self.task))
+        self.task.description = "Numbers of the last quarter"
+        self.task.save()
+        self.assertIn("Numbers of the last quarter", self.get_body(self.task))
+
+        self.task.delete()
+        self.assertIsNone(self.get_body(self.task))
+        Task.all_objects.filter(pk=self.task.pk).update(is_deleted=False)
+        search_backend.index_ids(Task, [self.task.pk])
+        self.assertIsNotNone(self.get_body(self.task))
+        Task.all_objects.filter(pk=self.task.pk).delete()
+        self.assertIsNone(self.get_body(self.task))
+
+        self.tag.hard_delete()
+        self.assertIsNone(self.get_body(self.tag))
+
+    def test_search_matches_documents(self):
+        self.task.tags.add(self.tag)
+        _, other_task = self.create_new_task(self.org, name="Quarterly planning")
+
+        self.assertCountEqual(self.search("QUARTER"), [str(self.task.id), str(other_task.id)])
+        self.assertEqual(self.search("planning"), [str(other_task.id)])
+        self.assertEqual(self.search("missing"), [])
+        # the whole value is matched as a phrase
+        self.assertEqual(self.search('report" OR "planning'), [])
+
+    def test_exact_task_fields(self):
+        self.task.tags.add(self.tag)
+        _, other_task = self.create_new_task(self.org, name="Quarterly planning")
+        other_task.priority, other_task.status = Task.Priority.LOW, Task.Status.COMPLETED
+        other_task.save()
+
+        self.assertEqual(self.search("finance"), [str(self.task.id)])
+        self.assertEqual(self.search("ance"), [])
+        self.assertEqual(self.search("LOW"), [str(other_task.id)])
+        self.assertEqual(self.search("completed"), [str(other_task.id)])
+        for value in ["lo", "do", "omplete", "pend"]:
+            self.assertEqual(self.search(value), [], value)
+        # exact matches are combined with documents matches
+        self.assertCountEqual(
+            self.search("quarterly"), [str(self.task.id), str(other_task.id)]
+        )
+
+    def test_search_rank_ordering(self):
+        _, best_task = self.create_new_task(self.org, name="report report report")
+        self.assertEqual(self.search("report"), [str(best_task.id), str(self.task.id)])
+        self.assertEqual(
+            self.search("report", ordering="created_at"),
+            [str(self.task.id), str(best_task.id)]
+        )
+        self.assertEqual(self.search("report", page_size=1), [str(best_task.id)])
+
+    def test_short_value_fallback(self):
+        self.assertFalse(search_backend.can_search(Task, "re"))
+        _, other_task = self.create_new_task(self.org, name="other")
+        self.assertEqual(self.search("re"), [str(self.task.id)])
+
+    def test_rebuild(self):
+        Tag.objects.filter(pk=self.tag.pk).update(name="renamed")
+        self.assertEqual(self.search("renamed"), [])
+        SearchDocument.objects.all().delete()
+        self.assertEqual(search_backend.rebuild(), SearchDocument.objects.count())
+        self.assertIn("renamed", self.get_body(self.tag))
+        self.assertEqual(self.search("quarterly"), [str(self.task.id)])
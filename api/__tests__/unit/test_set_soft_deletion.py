@@ -0,0 +1,118 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from app_lib.soft_deletion import SoftDeleteCollector, post_soft_delete
+from organization.models import Organization, Department
+from perms.models import Role
+from tags.models import Tag
+from tasks.models import Task
+from user.models import AppUser
+
+
+class TestSetSoftDeletion(BaseTestClass):
+    """
+    Soft deletion cascades with `UPDATE` statements, no instance is loaded:
+    - counters per model only count rows soft deleted by the call, `deleted_at` is set
+    - rows already soft deleted are left as it
+    - the number of queries doesn't depend on the number of cascaded rows
+    - primary keys are read chunk by chunk
+    - users created by a deleted user, a self relation, are cascaded
+    - `post_soft_delete` is sent once per model with the soft deleted rows
+    """
+
+    def setUp(self):
+        self.owner, self.creator, self.org = self.create_new_org()
+        self.depart = self.create_new_depart(self.org)[-1]
+        self.tasks = [self.create_new_task(self.org)[-1] for _ in range(3)]
+        self.tasks[0].depart = self.depart
+        self.tasks[0].save()
+        self.tags = [self.create_new_tag(self.org)[-1] for _ in range(2)]
+        self.role = self.create_new_role(self.org)[-1]
+
+    def capture_signals(self):
+        sent = {}
+
+        def receiver(sender, queryset, **kwargs):
+            self.assertNotIn(sender, sent)
+            sent[sender] = set(queryset.values_list("pk", flat=True))
+
+        post_soft_delete.connect(receiver)
+        self.addCleanup(post_soft_delete.disconnect, receiver)
+        return sent
+
+    def test_counters(self):
+        deleted_task = self.tasks[-1]
+        deleted_task.delete()
+        deleted_task.refresh_from_db()
+        previous_deleted_at = deleted_task.deleted_at
+
+        count, per_model = self.org.delete()
+        self.assertEqual(per_model, {
+            Organization._meta.label: 1,
+            Department._meta.label: 1,
+            Task._meta.label: 2,
+            Tag._meta.label: 2,
+            Role._meta.label: 1,
+        })
+        self.assertEqual(count, 7)
+        self.assertTrue(self.org.is_deleted)
+
+        self.org.refresh_from_db()
+        self.assertIsNotNone(self.org.deleted_at)
+        for task in Task.all_objects.filter(org=self.org).exclude(pk=deleted_task.pk):
+            self.assertTrue(task.is_deleted)
+            self.assertEqual(task.deleted_at, self.org.deleted_at)
+            self.assertIsNone(task.depart)
+        deleted_task.refresh_from_db()
+        self.assertEqual(deleted_task.deleted_at, previous_deleted_at)
+
+    def test_queries_dont_depend_on_rows(self):
+        _, _, other_org = self.create_new_org()
+        self.bulk_create_object(Task, [
+            {"name": f"task {i}", "org": other_org} for i in range(50)
+        ])
+        with wrap_with_query_capture() as small:
+            Organization.objects.filter(pk=self.org.pk).delete()
+        with wrap_with_query_capture() as large:
+            Organization.objects.filter(pk=other_org.pk).delete()
+        self.assertEqual(len(small.captured_queries), len(large.captured_queries))
+        self.assertEqual(Task.objects.filter(org=other_org).count(), 0)
+
+    def test_chunks(self):
+        self.addCleanup(setattr, SoftDeleteCollector, "chunk_size", SoftDeleteCollector.chunk_size)
+        SoftDeleteCollector.chunk_size = 2
+        count, per_model = Task.objects.filter(org=self.org).delete()
+        self.assertEqual(per_model, {Task._meta.label: 3})
+        self.assertFalse(Task.objects.filter(org=self.org).exists())
+
+    def test_self_relation(self):
+        user_a = self.create_and_activate_random_user()
+        user_b = self.create_and_activate_random_user()
+        user_b.created_by = user_a
+        user_b.save()
+        user_c = self.create_and_activate_random_user()
+        user_c.created_by = user_b
+        user_c.save()
+        org = self.create_new_org(creator=user_c)[-1]
+
+        count, per_model = user_a.delete()
+        self.assertEqual(per_model, {
+            AppUser._meta.label: 3, Organization._meta.label: 1,
+        })
+        self.assertFalse(AppUser.objects.filter(pk__in=[user_b.pk, user_c.pk]).exists())
+        self.assertFalse(Organization.objects.filter(pk=org.pk).exists())
+
+    def test_signals(self):
+        sent = self.capture_signals()
+        already_deleted = self.tags[0]
+        already_deleted.delete()
+        sent.clear()
+
+        self.org.delete()
+        self.assertEqual(sent, {
+            Organization: {self.org.pk},
+            Department: {self.depart.pk},
+            Task: {task.pk for task in self.tasks},
+            Tag: {self.tags[1].pk},
+            Role: {self.role.pk},
+        })
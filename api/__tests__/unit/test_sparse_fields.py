@@ -0,0 +1,60 @@
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+
+class TestSparseFields(BaseTestClass):
+    """
+    - `fields` and `exclude` query params select fields rendered by list and
+      retrieve endpoints, as repeated or comma separated params
+    - columns and relations of unselected fields aren't loaded
+    - unknown fields are rejected
+    """
+
+    def setUp(self):
+        self.owner, _, self.org = self.create_new_org()
+        _, self.task = self.create_new_task(self.org)
+        self.task.assigned_to.add(self.create_and_activate_random_user())
+        self.task.tags.add(self.create_new_tag(self.org)[1])
+
+    def get_data(self, url_name, query_params, args=None):
+        self.url_name = url_name
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(self.owner, args=args, query_params=query_params)
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        return self.loads(response.content), [query["sql"] for query in ctx.captured_queries]
+
+    def test_list_fields(self):
+        data, queries = self.get_data("tasks-list", {"fields": ["id,name", "status", "due_date"]})
+        self.assertEqual(list(data["results"][0]), ["id", "name", "due_date", "status"])
+        list_query = next(query for query in queries if query.startswith('SELECT "tasks_task"'))
+        self.assertIn('"tasks_task"."status"', list_query)
+        self.assertNotIn('"tasks_task"."description"', list_query)
+
+    def test_retrieve_exclude(self):
+        full_data, full_queries = self.get_data("tasks-detail", {}, args=[self.task.id])
+        data, queries = self.get_data(
+            "tasks-detail",
+            {"exclude": "assigned_to,tags,can_be_accessed_by,depart,org"},
+            args=[self.task.id]
+        )
+        self.assertEqual(
+            set(full_data) - set(data),
+            {"assigned_to", "tags", "can_be_accessed_by", "depart", "org"}
+        )
+        self.assertEqual(len(full_queries) - len(queries), 3)
+        for query in queries:
+            self.assertNotIn('JOIN "tasks_task_assigned_to"', query)
+            self.assertNotIn('"organization_organization"', query.split(" FROM ")[0])
+
+    def test_method_fields_can_be_excluded(self):
+        _, role = self.create_new_role(self.org)
+        data, queries = self.get_data("roles-list", {"fields": "id,name"})
+        self.assertEqual(data["results"], [{"id": str(role.id), "name": role.name}])
+        list_query = next(query for query in queries if query.startswith('SELECT "perms_role"'))
+        self.assertNotIn('"perms_role"."perms"', list_query)
+
+    def test_unknown_fields(self):
+        self.url_name = "tasks-list"
+        for query_params in [{"fields": "id,unknown"}, {"exclude": "password"}]:
+            response = self.auth_get(self.owner, query_params=query_params)
+            self.assertEqual(response.status_code, self.status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,97 @@
+from ..base_classe import BaseTestClass
+
+from app_lib.app_permssions import perm_registry, CAN_CREATE_TASK, CAN_CREATE_TAG
+from perms.models import UserRolePermissions, Role
+
+
+class TestUserRolePermissions(BaseTestClass):
+    """
+    - users role permissions are the union of their roles permissions in each org
+    - they are refreshed when:
+        - role perms or org change, only in the role orgs
+        - role users are added, removed or cleared, from both sides
+        - role is soft deleted or deleted
+    - they aren't refreshed on role saves changing neither perms nor org, perms left
+    out of a partial save are refreshed by the next save writing them
+    - users without role permissions in an org don't have an entry
+    """
+
+    def setUp(self):
+        _, _, self.org = self.create_new_org()
+        _, _, self.other_org = self.create_new_org()
+        self.user = self.create_and_activate_random_user()
+        self.other_user = self.create_and_activate_random_user()
+        _, self.role = self.create_new_role(self.org)
+        self.role.add_permissions(CAN_CREATE_TASK)
+        _, self.other_role = self.create_new_role(self.org)
+        self.other_role.add_permissions(CAN_CREATE_TAG)
+
+    def get_role_perms(self, user=None, org=None):
+        entry = UserRolePermissions.objects.filter(
+            user=user or self.user, org=org or self.org
+        ).first()
+        return sorted(perm_registry.get_perms(entry.perms)) if entry else None
+
+    def test_users_change(self):
+        self.role.users.add(self.user, self.other_user)
+        self.assertEqual(self.get_role_perms(), [CAN_CREATE_TASK])
+        self.user.role_set.add(self.other_role)
+        self.assertEqual(self.get_role_perms(), sorted([CAN_CREATE_TASK, CAN_CREATE_TAG]))
+        self.role.users.remove(self.user)
+        self.assertEqual(self.get_role_perms(), [CAN_CREATE_TAG])
+        self.user.role_set.clear()
+        self.assertIsNone(self.get_role_perms())
+        self.assertEqual(self.get_role_perms(self.other_user), [CAN_CREATE_TASK])
+        self.role.users.clear()
+        self.assertIsNone(self.get_role_perms(self.other_user))
+
+    def test_role_change(self):
+        self.role.users.add(self.user)
+        self.role.add_permissions(CAN_CREATE_TAG)
+        self.assertEqual(self.get_role_perms(), sorted([CAN_CREATE_TASK, CAN_CREATE_TAG]))
+        self.role.remove_permissions([CAN_CREATE_TASK, CAN_CREATE_TAG])
+        self.assertIsNone(self.get_role_perms())
+        self.role.add_permissions(CAN_CREATE_TASK)
+        self.role.org = self.other_org
+        self.role.save()
+        self.assertIsNone(self.get_role_perms())
+        self.assertEqual(self.get_role_perms(org=self.other_org), [CAN_CREATE_TASK])
+
+    def tamper_role_perms(self, org):
+        UserRolePermissions.objects.filter(user=self.user, org=org).update(perms=0)
+
+    def test_role_change_refresh_only_role_orgs(self):
+        _, other_org_role = self.create_new_role(self.other_org)
+        other_org_role.add_permissions(CAN_CREATE_TAG)
+        self.user.role_set.add(self.role, other_org_role)
+        self.tamper_role_perms(self.other_org)
+        self.role.add_permissions(CAN_CREATE_TAG)
+        self.assertEqual(self.get_role_perms(), sorted([CAN_CREATE_TASK, CAN_CREATE_TAG]))
+        self.assertEqual(self.get_role_perms(org=self.other_org), [])
+
+    def test_role_save_without_perms_change(self):
+        self.role.users.add(self.user)
+        self.tamper_role_perms(self.org)
+        self.role.name = "renamed role"
+        self.role.save()
+        role = Role.objects.get(id=self.role.id)
+        role.description = "new description"
+        role.save(update_fields=["description"])
+        self.assertEqual(self.get_role_perms(), [])
+
+    def test_role_partial_save_then_full_save(self):
+        self.role.users.add(self.user)
+        self.role.perms = self.role.dump_perms([CAN_CREATE_TASK, CAN_CREATE_TAG])
+        self.role.name = "renamed role"
+        self.role.save(update_fields=["name"])
+        self.assertEqual(self.get_role_perms(), [CAN_CREATE_TASK])
+        self.role.save()
+        self.assertEqual(self.get_role_perms(), sorted([CAN_CREATE_TASK, CAN_CREATE_TAG]))
+
+    def test_role_deletion(self):
+        self.role.users.add(self.user)
+        self.other_role.users.add(self.user)
+        Role.objects.filter(id=self.role.id).delete()
+        self.assertEqual(self.get_role_perms(), [CAN_CREATE_TAG])
+        self.other_role.hard_delete()
+        self.assertIsNone(self.get_role_perms())
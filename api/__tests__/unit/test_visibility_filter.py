@@ -0,0 +1,85 @@
+from django.db import connection
+
+from ..base_classe import BaseTestClass
+from ..lib import wrap_with_query_capture
+
+from tasks.models import Task
+
+
+class TestVisibilityFilter(BaseTestClass):
+    """
+    - tasks visible through each condition are listed once, even when visible
+      through several of them
+    - list queries of each viewset don't use `DISTINCT` and relations are searched
+      through indexes according to sqlite query plan
+    """
+
+    def setUp(self):
+        self.user = self.create_and_activate_random_user()
+        _, _, self.org = self.create_new_org()
+        _, _, self.user_org = self.create_new_org(owner=self.user)
+        _, self.depart = self.create_new_depart(self.org, creator=self.user)
+        _, self.other_depart = self.create_new_depart(self.org)
+        self.other_depart.can_be_accessed_by.add(self.user)
+        self.tasks = [self.create_new_task(self.org)[1] for _ in range(7)]
+        self.tasks[0].org = self.user_org
+        self.tasks[0].save()
+        self.tasks[1].depart = self.depart
+        self.tasks[1].save()
+        self.tasks[2].depart = self.other_depart
+        self.tasks[2].save()
+        self.tasks[3].created_by = self.user
+        self.tasks[3].save()
+        self.tasks[4].can_be_accessed_by.add(self.user)
+        self.tasks[5].assigned_to.add(self.user)
+        # visible through every condition
+        self.tasks[6].org = self.user_org
+        self.tasks[6].depart = self.depart
+        self.tasks[6].created_by = self.user
+        self.tasks[6].save()
+        self.tasks[6].can_be_accessed_by.add(self.user)
+        self.tasks[6].assigned_to.add(self.user)
+        # not visible
+        self.create_new_task(self.org)
+
+    def get_list_query_plan(self, url_name, table, args=None):
+        self.url_name = url_name
+        with wrap_with_query_capture() as ctx:
+            response = self.auth_get(self.user, args=args)
+        self.assertEqual(response.status_code, self.status.HTTP_200_OK)
+        sql = next(
+            query["sql"] for query in ctx.captured_queries
+            if query["sql"].startswith("SELECT") and f'FROM "{table}"' in query["sql"]
+            and "LIMIT" in query["sql"]
+        )
+        self.assertNotIn("DISTINCT", sql)
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plan = "\n".join(row[-1] for row in cursor.fetchall())
+        self.assertNotIn("DISTINCT", plan)
+        return self.loads(response.content), plan
+
+    def test_tasks_are_listed_once(self):
+        data, plan = self.get_list_query_plan("tasks-list", "tasks_task")
+        ids = [obj["id"] for obj in data["results"]]
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(set(ids), {str(task.id) for task in self.tasks})
+        self.assertEqual(data["total_count"], len(self.tasks))
+        for table in [
+            "tasks_task_assigned_to", "tasks_task_can_be_accessed_by",
+            "organization_department_can_be_accessed_by",
+        ]:
+            self.assertIn(f"USING COVERING INDEX {table}_", plan)
+        self.assertIn("CORRELATED SCALAR SUBQUERY", plan)
+
+    def test_viewsets_list_queries(self):
+        for url_name, table, args in [
+            ("orgs-list", "organization_organization", None),
+            ("departments-list", "organization_department", [self.org.id]),
+            ("tags-list", "tags_tag", None),
+            ("roles-list", "perms_role", None),
+            ("users-list", "user_appuser", None),
+        ]:
+            _, plan = self.get_list_query_plan(url_name, table, args)
+            # subqueries tables are aliased `U0`, they should never be scanned
+            self.assertNotIn("SCAN U0", plan)
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from django.utils.translation import gettext_lazy as _
 
 
@@ -36,6 +38,75 @@ CREATOR_ONLY_PERMS = {
 
 ALL_PERMS = {**APP_PERMISSIONS, **CREATOR_ONLY_PERMS}
 
+# Bit position of each permission in stored permission masks.
+# Positions are persisted, never reorder or reuse them: a new permission
+# takes the next free position.
+PERMISSION_BITS = {
+    CAN_CREATE_DEPART: 0,
+    CAN_CREATE_TASK: 1,
+    CAN_CREATE_TAG: 2,
+    CAN_CHANGE_RESSOURCES_OWNERS: 3,
+}
+
+
+class PermissionRegistry:
+    """
+    Immutable permission registry, compiled once from permissions definitions.
+    Lookups are done on frozensets and read only mappings, metadata are serialized
+    once, see `perm_registry`.
+    """
+    __slots__ = (
+        "default", "creator_only", "all",
+        "default_list", "creator_only_list", "all_list",
+        "ids", "masks", "default_mask", "all_mask", "data",
+    )
+
+    def __init__(self, default_perms: dict, creator_only_perms: dict, bits: dict):
+        set_ = object.__setattr__
+        all_perms = {**default_perms, **creator_only_perms}
+        if set(bits) != set(all_perms) or len(set(bits.values())) != len(bits):
+            raise ValueError(
+                "Each permission must have its own bit in PERMISSION_BITS"
+            )
+
+        set_(self, "default", frozenset(default_perms))
+        set_(self, "creator_only", frozenset(creator_only_perms))
+        set_(self, "all", frozenset(all_perms))
+        # ordered labels, as declared
+        set_(self, "default_list", tuple(default_perms))
+        set_(self, "creator_only_list", tuple(creator_only_perms))
+        set_(self, "all_list", tuple(all_perms))
+        # stable integer ids, the permission bit position
+        set_(self, "ids", MappingProxyType(dict(bits)))
+        set_(self, "masks", MappingProxyType({
+            perm: 1 << bit for perm, bit in bits.items()
+        }))
+        set_(self, "default_mask", self.get_mask(default_perms))
+        set_(self, "all_mask", self.get_mask(all_perms))
+        set_(self, "data", MappingProxyType({
+            perm: MappingProxyType({"label": perm, **meta_data})
+            for perm, meta_data in all_perms.items()
+        }))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("The permission registry is immutable")
+
+    def get_mask(self, perms) -> int:
+        """Return the mask of `perms`, unknown permissions are ignored"""
+        masks = self.masks
+        mask = 0
+        for perm in perms:
+            mask |= masks.get(perm, 0)
+        return mask
+
+    def get_perms(self, mask: int) -> list[str]:
+        """Return permission labels set in `mask`, ordered by id"""
+        return [perm for perm, perm_mask in self.masks.items() if mask & perm_mask]
+
+
+perm_registry = PermissionRegistry(APP_PERMISSIONS, CREATOR_ONLY_PERMS, PERMISSION_BITS)
+
+
 def permissions_exist(
         permissions: str | list[str], 
         search_from: dict =None
@@ -53,16 +124,15 @@ def permissions_exist(
     if isinstance(permissions, str):
         permissions = permissions.split(',')
 
-    all_perms = ALL_PERMS if not search_from else search_from
+    all_perms = perm_registry.all if not search_from else search_from
         
     not_found = []
     found = []
     for perm in permissions:
         perm_lower = perm.lower()
-        try:
-            all_perms[perm_lower]
+        if perm_lower in all_perms:
             found.append(perm_lower)
-        except KeyError:
+        else:
             not_found.append(perm_lower)
     
     return False if not_found else True, found, not_found
@@ -80,12 +150,12 @@ def get_perm_list(
     Default to all permission labels
     """
     if creator_only:
-        perms = CREATOR_ONLY_PERMS
+        perms = perm_registry.creator_only_list
     elif default_only:
-        perms = APP_PERMISSIONS
+        perms = perm_registry.default_list
     else:
-        perms = {**APP_PERMISSIONS, **CREATOR_ONLY_PERMS}
-    return list(perms.keys())
+        perms = perm_registry.all_list
+    return list(perms)
 
 
 def get_perm_data(perms:list[str]):
@@ -110,17 +180,19 @@ def get_perm_data(perms:list[str]):
 
     **Note** :
         - If a permission is not found in `ALL_PERMS`, it is ignored.
+        - Metadata are read only, see `perm_registry`
    
     """
-    
-    data = []
-    for perm in perms:
-        perm_meta_data = ALL_PERMS.get(perm, None)
-        if not perm_meta_data:
-            # probably an unknow or removed perm
-            continue
-        data.append({
-            "label": perm,
-            **perm_meta_data
-        })
-    return data
\ No newline at end of file
+    data = perm_registry.data
+    # unknow or removed perms are skipped
+    return [data[perm] for perm in perms if perm in data]
+
+
+def perms_to_mask(perms: list[str]) -> int:
+    """Return the permission mask of `perms`, unknown permissions are ignored"""
+    return perm_registry.get_mask(perms)
+
+
+def mask_to_perms(mask: int) -> list[str]:
+    """Return permission labels set in `mask`"""
+    return perm_registry.get_perms(mask)
@@ -1,17 +1,43 @@
 from django.db.transaction import atomic
+from django.utils import timezone
+from django.db.models import Q, F
+from django.core.exceptions import FieldDoesNotExist
 from django.contrib.auth import get_user_model
 
 from perms.models import UserPermissions
 from .queryset import queryset_helpers, Organization
-from .app_permssions import permissions_exist, get_perm_list
+from .app_permssions import permissions_exist, perm_registry
+from .authorization_cache import decision_cache
+from .permission_resolver import perm_resolver
+from .permission_cache import perm_cache
 
 User = get_user_model()
 
 class AuthorizationChecker:
+    # kind of check used in decision cache keys for plain object access
+    OBJ_ACCESS = "obj_access"
+    # kind of check used in decision cache keys for user effective permissions in an org
+    ORG_PERMISSIONS = "org_permissions"
+    # above this number of objects, access checks over objects are done in the database
+    BULK_CHECK_THRESHOLD = 20
+    # number of objects written per query in bulk writes
+    BULK_WRITE_BATCH_SIZE = 1000
+
+    def invalidate_cache(self):
+        """Forget authorization decisions computed so far in the current request.
+        Should be called after a write that can change who has access to what."""
+        decision_cache.invalidate()
 
     def has_access_to_obj(self, obj, want_access_obj) -> bool:
         """Check `want_access_obj` can have access to the object by checking
-        `owner`, `created_by`, `can_be_accessed_by` and `id` attrs on the `obj`"""
+        `owner`, `created_by`, `can_be_accessed_by` and `id` attrs on the `obj`.
+        The decision is computed once per request"""
+        return decision_cache.get_or_compute(
+            decision_cache.make_key(want_access_obj, obj, self.OBJ_ACCESS),
+            lambda: self._has_access_to_obj(obj, want_access_obj)
+        )
+
+    def _has_access_to_obj(self, obj, want_access_obj) -> bool:
         want_access_obj_id = want_access_obj.id
         is_allowed = obj.id == want_access_obj_id
 
@@ -40,7 +66,14 @@ class AuthorizationChecker:
             want_access_obj: The object or permission criteria to check access against.
         Returns:
             bool: True if access is granted to all objects, False otherwise.
+        Above `BULK_CHECK_THRESHOLD` objects the check is done in one query, 
+        see `get_inaccessible_ids`.
         """
+        if self.is_bulk_check(objs):
+            return not self.get_inaccessible_ids(
+                self.get_model(objs), [obj.id for obj in objs], want_access_obj
+            )
+
         for obj in objs:
             is_allowed = self.has_access_to_obj(obj, want_access_obj)
             if not is_allowed:
@@ -66,7 +99,13 @@ class AuthorizationChecker:
         Passes when one of the condition below is met:
             - the objects `id` and `want_access_obj` `id` are the same (obj itself)
             - the objects `created_by` is the same as the `want_access_obj` obj
+        Above `BULK_CHECK_THRESHOLD` objects the check is done in one query.
         """
+        if self.is_bulk_check(objs):
+            return not self.get_creator_inaccessible_ids(
+                self.get_model(objs), [obj.id for obj in objs], want_access_obj
+            )
+
         for obj in objs:
             is_allowed = self.has_creator_access_on_obj(obj, want_access_obj)
             if not is_allowed:
@@ -89,7 +128,12 @@ class AuthorizationChecker:
 
     def has_access_to_org_depart_or_obj_on_objs(self, objs, want_access_obj):
         """Check if the `want_access_obj` obj has access to all obj in objs
-        org or depart or the obj itself. Org attribute must exist on the obj"""
+        org or depart or the obj itself. Org attribute must exist on the obj.
+        Above `BULK_CHECK_THRESHOLD` objects the check is done in one query."""
+        if self.is_bulk_check(objs):
+            return not self.get_org_depart_or_obj_inaccessible_ids(
+                self.get_model(objs), [obj.id for obj in objs], want_access_obj
+            )
 
         for obj in objs:
             is_allowed = self.has_access_to_org_depart_or_obj(obj, want_access_obj)
@@ -97,9 +141,98 @@ class AuthorizationChecker:
                 return is_allowed
         return True
 
+    def is_bulk_check(self, objs) -> bool:
+        return len(objs) > self.BULK_CHECK_THRESHOLD
+
+    def get_model(self, objs):
+        model = getattr(objs, "model", None)
+        return model if model is not None else type(next(iter(objs)))
+
+    def has_field(self, model, name) -> bool:
+        """Check `name` is a field declared on `model`, reverse relations are ignored"""
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return False
+        return not field.auto_created
+
+    def get_access_filter(
+        self, model, want_access_obj, prefix="", creator_only=False
+    ) -> Q:
+        """
+        Database version of `has_access_to_obj` and `has_creator_access_on_obj` (with `creator_only`), 
+        return a filter matching `model` objects `want_access_obj` can access. 
+        `prefix` is used to apply the filter through a relation, eg: `org__`
+        """
+        want_access_obj_id = want_access_obj.id
+        fields = ["created_by"] if creator_only else [
+            "owner", "created_by", "can_be_accessed_by"
+        ]
+        query = Q(**{f"{prefix}id": want_access_obj_id})
+        for name in fields:
+            if self.has_field(model, name):
+                query |= Q(**{f"{prefix}{name}": want_access_obj_id})
+        return query
+
+    def get_org_depart_or_obj_access_filter(
+        self, model, want_access_obj, creator_only=False
+    ) -> Q:
+        """Return a filter matching `model` objects `want_access_obj` can access through 
+        the object itself, its `org` or its `depart`"""
+        query = self.get_access_filter(
+            model, want_access_obj, creator_only=creator_only
+        )
+        for name in ["org", "depart"]:
+            if self.has_field(model, name):
+                query |= self.get_access_filter(
+                    model._meta.get_field(name).related_model,
+                    want_access_obj,
+                    prefix=f"{name}__",
+                    creator_only=creator_only
+                )
+        return query
+
+    def get_unmatched_ids(self, model, ids, query) -> set:
+        """Return ids in `ids` of `model` objects not matching `query`, in one query"""
+        ids = set(ids)
+        if not ids:
+            return ids
+        matched = model._base_manager.filter(id__in=ids).filter(
+            query
+        ).values_list("id", flat=True)
+        return ids.difference(matched)
+
+    def get_inaccessible_ids(self, model, ids, want_access_obj) -> set:
+        """Bulk version of `has_access_to_obj`, return ids in `ids` of `model` objects 
+        `want_access_obj` can't access"""
+        return self.get_unmatched_ids(
+            model, ids, self.get_access_filter(model, want_access_obj)
+        )
+
+    def get_creator_inaccessible_ids(self, model, ids, want_access_obj) -> set:
+        """Bulk version of `has_creator_access_on_obj`, return ids in `ids` of `model` objects 
+        `want_access_obj` doesn't have creator access on"""
+        return self.get_unmatched_ids(
+            model, ids, self.get_access_filter(model, want_access_obj, creator_only=True)
+        )
+
+    def get_org_depart_or_obj_inaccessible_ids(
+        self, model, ids, want_access_obj, creator_only=False
+    ) -> set:
+        """Bulk version of `has_access_to_org_depart_or_obj`, return ids in `ids` of `model` 
+        objects `want_access_obj` can't access through the object, its org or depart. 
+        With `creator_only`, only creator access is considered"""
+        return self.get_unmatched_ids(
+            model, ids, self.get_org_depart_or_obj_access_filter(
+                model, want_access_obj, creator_only=creator_only
+            )
+        )
+
     def add_permissions_to_users(self, users, org, perms: str | list[str]):
         """Add `perms` to `users` in `org`. User can be a single value
-        it will be map to a list internally. Return added and not found perms"""
+        it will be map to a list internally. Return added and not found perms.
+        Permission objects are read once, missing ones are bulk created, soft deleted
+        ones are bulk updated and others are updated by batch of ids"""
         _, found, not_found = permissions_exist(perms)
         if not found:
             return found, not_found
@@ -107,25 +240,58 @@ class AuthorizationChecker:
         if not isinstance(users, list):
             users = [users]
 
-        # get all existed perm obj at once and avoid a get_or_create call on each user
-        # where its no needed
-        perm_objs = queryset_helpers.get_user_permission_queryset(
-            only_select_related=True
-        ).filter(user__in=users, org=org)
-        found_user_perms = {perm_obj.user:perm_obj for perm_obj in perm_objs}
+        perms_mask = perm_registry.get_mask(found)
+        user_ids = {getattr(user, "id", user) for user in users}
+        # soft deleted objects are included, (user, org) is unique
+        existing_perm_objs = {
+            perm_obj.user_id: perm_obj
+            for perm_obj in UserPermissions.all_objects.filter(
+                org=org, user_id__in=user_ids
+            ).only("id", "user_id", "perms", "is_deleted", "deleted_at")
+        }
+
+        now = timezone.now()
+        to_create = []
+        to_restore = []
+        to_extend_ids = []
+        for user_id in user_ids:
+            perm_obj = existing_perm_objs.get(user_id, None)
+            if perm_obj is None:
+                to_create.append(
+                    UserPermissions(org=org, user_id=user_id, perms=perms_mask)
+                )
+            elif perm_obj.is_deleted:
+                perm_obj.is_deleted = False
+                perm_obj.deleted_at = None
+                perm_obj.perms = perms_mask
+                perm_obj.updated_at = now
+                to_restore.append(perm_obj)
+            elif perm_obj.perms | perms_mask != perm_obj.perms:
+                to_extend_ids.append(perm_obj.id)
         
         # permissions are added to everyone or no one
         with atomic():
-            for user in users:
-                if user in found_user_perms:
-                    user_perm_obj = found_user_perms[user]
-                else:
-                    user_perm_obj, _ = UserPermissions.objects.get_or_create(
-                        org=org,
-                        user=user
-                    )
-                user_perm_obj.add_permissions(found)
-                
+            UserPermissions.objects.bulk_create(
+                to_create, batch_size=self.BULK_WRITE_BATCH_SIZE
+            )
+            UserPermissions.all_objects.bulk_update(
+                to_restore, 
+                ["perms", "is_deleted", "deleted_at", "updated_at"],
+                batch_size=self.BULK_WRITE_BATCH_SIZE
+            )
+            # the same perms are added to every existing object, update them
+            # by batch of ids instead of row by row
+            batch_size = self.BULK_WRITE_BATCH_SIZE
+            for start in range(0, len(to_extend_ids), batch_size):
+                batch_ids = to_extend_ids[start:start + batch_size]
+                UserPermissions.all_objects.filter(id__in=batch_ids).update(
+                    perms=F("perms").bitor(perms_mask), updated_at=now
+                )
+
+        # bulk operations don't send signals
+        if to_create or to_restore or to_extend_ids:
+            perm_cache.invalidate_org(org.id)
+        self.invalidate_cache()
         return found, not_found
 
     def remove_permissions_from_users(self, users, org, perms: str | list):
@@ -133,6 +299,7 @@ class AuthorizationChecker:
         obj and it will be map to a list internally. Return in order:
         - `list` of `removed` or found perms. Perms are removed only when exist on user
         - `list` of `not_found` perms
+        Permissions are removed with a single update query.
         """
         _, to_remove, not_found = permissions_exist(perms)
         if not to_remove:
@@ -141,13 +308,21 @@ class AuthorizationChecker:
         if not isinstance(users, list):
             users = [users]
 
-        perm_objs = queryset_helpers.get_user_permission_queryset(
-            default=True
-        ).filter(org=org, user__in=users)
+        perms_mask = perm_registry.get_mask(to_remove)
+        # only objects having at least one of the perms are changed
+        updated = UserPermissions.filter_with_any_perms(
+            queryset_helpers.get_user_permission_queryset(default=True),
+            to_remove
+        ).filter(
+            org=org, user_id__in={getattr(user, "id", user) for user in users}
+        ).update(
+            perms=F("perms").bitand(~perms_mask), updated_at=timezone.now()
+        )
 
-        for perm_obj in perm_objs:
-            perm_obj.remove_permissions(to_remove)
-        
+        # bulk operations don't send signals
+        if updated:
+            perm_cache.invalidate_org(org.id)
+        self.invalidate_cache()
         return to_remove, not_found
     
     def has_permission(
@@ -164,7 +339,14 @@ class AuthorizationChecker:
             perm: string representing the permission
         Returns:
             bool: wether or not the user has the permission
+        The decision is computed once per request.
         """
+        return decision_cache.get_or_compute(
+            decision_cache.make_key(user, org, perm),
+            lambda: self._has_permission(user, org, perm)
+        )
+
+    def _has_permission(self, user:User, org:Organization, perm:str):
         exist, found, _, = permissions_exist(perm)
         if not exist or not found:
             return False
@@ -173,33 +355,37 @@ class AuthorizationChecker:
         creator_id = getattr(org.created_by, 'id', None) 
         if creator_id == user.id:
             return True
-        
-        target_perm = found[0]
-
-        # owners have default perms by default
-        is_default_perm = target_perm in get_perm_list(default_only=True)
-        owner_id = getattr(org.owner, 'id', None)
-        if (
-            owner_id == user.id or 
-            user in org.can_be_accessed_by.all()
-        ) and is_default_perm:
-            return True
 
-        if queryset_helpers.get_user_permission_queryset(default=True).filter(
-            user=user, 
-            org=org, 
-            perms__icontains=target_perm
-        ).exists():
-            return True
+        org_perms = self.get_org_permissions(user, org)
+        return org_perms is not None and org_perms.has(found[0])
 
-        if queryset_helpers.get_role_queryset(default=True).filter(
-            org=org, 
-            users=user, 
-            perms__icontains=target_perm
-        ).exists():
-            return True
-        
-        return False
+    def has_permission_many(self, user:User, orgs:list, perm:str) -> dict:
+        """
+        Check wether the user has a perm in each organization of `orgs`, organizations
+        objects or ids. Return a dict mapping each org id to a `bool`, resolved in one query
+        no matter the number of orgs.
+        """
+        org_ids = [getattr(org, "id", org) for org in orgs]
+        exist, found, _, = permissions_exist(perm)
+        if not exist or not found or not org_ids:
+            return {org_id: False for org_id in org_ids}
+
+        resolved = perm_resolver.resolve(user, orgs=org_ids)
+        return {
+            org_id: org_id in resolved and resolved[org_id].has(found[0])
+            for org_id in org_ids
+        }
+
+    def get_org_permissions(self, user:User, org:Organization):
+        """Return `user` effective permissions in `org` as `OrgPermissions`, 
+        `None` when the org doesn't exist. Computed once per request and cached
+        across requests, see `perm_cache`"""
+        return decision_cache.get_or_compute(
+            decision_cache.make_key(user, org, self.ORG_PERMISSIONS),
+            lambda: perm_cache.get_or_resolve(
+                user, org, lambda: perm_resolver.resolve_org(user, org)
+            )
+        )
     
     def can_add_creator_level_perms(
         self, 
@@ -226,12 +412,6 @@ class AuthorizationChecker:
             return True
         
         _, found, _ = permissions_exist(perms)
-
-        creator_level_perms = get_perm_list(creator_only=True)
-        for perm_str in found:
-            if perm_str in creator_level_perms:
-                return False
-            
-        return True
+        return perm_registry.creator_only.isdisjoint(found)
 
 auth_checker = AuthorizationChecker()
\ No newline at end of file
@@ -0,0 +1,73 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+_decisions: ContextVar[dict | None] = ContextVar(
+    "authorization_decisions", default=None
+)
+
+
+class AuthorizationDecisionCache:
+    """
+    Request scoped store for authorization decisions.
+
+    Decisions are only cached while a scope is active, see `scope` and
+    `AuthorizationCacheMiddleware`. Outside of a scope every lookup is computed,
+    so code running outside a request (shell, commands, unit tests) keeps
+    its current behavior.
+    """
+
+    def activate(self):
+        """Open a new empty scope, return the token to pass to `deactivate`"""
+        return _decisions.set({})
+
+    def deactivate(self, token):
+        _decisions.reset(token)
+
+    @contextmanager
+    def scope(self):
+        token = self.activate()
+        try:
+            yield self
+        finally:
+            self.deactivate(token)
+
+    @property
+    def is_active(self) -> bool:
+        return _decisions.get() is not None
+
+    def make_key(self, subject, obj, perm: str):
+        """
+        Build a decision key from the subject (user) requesting access, the target `obj`
+        and `perm`, the permission or the kind of access being checked.
+        Return `None` when the decision can't be identified, it should not be cached.
+        """
+        subject_id = getattr(subject, "id", None)
+        obj_id = getattr(obj, "id", None)
+        if subject_id is None or obj_id is None:
+            return None
+        meta = getattr(obj, "_meta", None)
+        obj_type = meta.label if meta is not None else type(obj).__qualname__
+        return (subject_id, obj_type, obj_id, perm)
+
+    def get_or_compute(self, key, compute):
+        """Return the cached decision for `key` or compute, cache and return it"""
+        decisions = _decisions.get()
+        if decisions is None or key is None:
+            return compute()
+
+        try:
+            return decisions[key]
+        except KeyError:
+            decision = decisions[key] = compute()
+            return decision
+
+    def invalidate(self):
+        """Drop every decision of the current scope. Should be called after
+        writes that can change authorization facts in the same request."""
+        decisions = _decisions.get()
+        if decisions is not None:
+            decisions.clear()
+
+
+decision_cache = AuthorizationDecisionCache()
@@ -3,6 +3,8 @@ from django.utils.translation import gettext_lazy as _
 from rest_framework.utils import html
 from drf_spectacular.utils import extend_schema_field
 
+from .app_permssions import mask_to_perms
+
 class AllowBlankMixin:
     """A mixin to allow blank values in serializers.
     This mixin can be used with any serializer field to allow blank values
@@ -94,4 +96,14 @@ class ManyPrimaryKeyRelatedField(serializers.RelatedField):
 
 
 class DefaultDateTimeField(AllowBlankMixin, serializers.DateTimeField):
-    pass
\ No newline at end of file
+    pass
+
+
+class PermissionListField(serializers.ListField):
+    """A list of permission labels, represent stored permission masks as labels"""
+    child = serializers.CharField()
+
+    def to_representation(self, data):
+        if isinstance(data, int):
+            data = mask_to_perms(data)
+        return super().to_representation(data)
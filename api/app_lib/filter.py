@@ -1,5 +1,8 @@
 from django_filters import rest_framework as filters
-from django.db.models import Q
+from django.db.models import OrderBy, Q
+from rest_framework.filters import OrderingFilter as BaseOrderingFilter
+
+from search.backends import search_backend
 
 
 class CommonFieldsFilter(filters.FilterSet):
@@ -82,9 +85,22 @@ class BaseNameDescriptionDateDataFilter(CommonFieldsFilter, SearchThroughFilter)
         )
 
     def search_through(self, queryset, name, value):
-        return queryset.filter(
-            self.get_default_search_queryset(value)
-        )
+        return self.search_queryset(queryset, value)
+
+    def search_queryset(self, queryset, value, extra_filter=None):
+        """
+        Return `queryset` objects matching `value` through the search backend,
+        ranked, see `search.backends`. Values the backend can't search, eg: too
+        short, fall back to `get_default_search_queryset`. `extra_filter` matches
+        additional objects.
+        """
+        if search_backend.can_search(queryset.model, value):
+            return search_backend.search(queryset, value, extra_filter)
+
+        query = self.get_default_search_queryset(value)
+        if extra_filter is not None:
+            query |= extra_filter
+        return queryset.filter(query)
 
     class Meta:
         model = None
@@ -93,4 +109,25 @@ class BaseNameDescriptionDateDataFilter(CommonFieldsFilter, SearchThroughFilter)
             "name",
             "description",
             "created_at",
-        ]
\ No newline at end of file
+        ]
+
+class OrderingFilter(BaseOrderingFilter):
+    """
+    Ordering filter expanding the view `ordering_aliases`, a dict mapping an ordering
+    field to the fields actually sorted on, eg:
+    `{"priority": ["priority_rank", F("due_date").asc(nulls_last=True)]}`.
+    A descending alias sorts the fields it maps to in descending order, ordering
+    expressions keep their own direction whatever the alias one.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        aliases = getattr(view, "ordering_aliases", None)
+        if not ordering or not aliases:
+            return ordering
+        return tuple(
+            field if isinstance(field, OrderBy)
+            else f"{'-' if order.startswith('-') else ''}{field}"
+            for order in ordering
+            for field in aliases.get(order.lstrip('-'), [order.lstrip('-')])
+        )
@@ -0,0 +1,55 @@
+import os
+import time
+import uuid
+import threading
+
+from django.conf import settings
+
+
+class UUID7Generator:
+    """
+    Generate time ordered UUIDv7 (RFC 9562): a 48 bits unix timestamp in milliseconds,
+    then a 12 bits counter and 62 random bits. The counter starts at a random value
+    each millisecond and is incremented for ids generated in the same millisecond, ids
+    generated by a process are strictly increasing.
+    """
+    counter_bits = 12
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+
+    def get_next_counter(self):
+        """Return the timestamp and counter of the next id"""
+        ms = time.time_ns() // 1_000_000
+        with self._lock:
+            if ms > self._last_ms:
+                # keep room for increments, the counter top bit starts unset
+                self._counter = int.from_bytes(os.urandom(2)) >> (17 - self.counter_bits)
+                self._last_ms = ms
+            else:
+                self._counter += 1
+                if self._counter >> self.counter_bits:
+                    # counter overflow, borrow the next millisecond
+                    self._last_ms += 1
+                    self._counter = 0
+            return self._last_ms, self._counter
+
+    def __call__(self) -> uuid.UUID:
+        ms, counter = self.get_next_counter()
+        rand = int.from_bytes(os.urandom(8)) >> 2
+        return uuid.UUID(int=(
+            (ms & 0xFFFF_FFFF_FFFF) << 80 | 0x7 << 76 | counter << 64 | 0b10 << 62 | rand
+        ))
+
+
+uuid7 = UUID7Generator()
+
+
+def generate_id() -> uuid.UUID:
+    """Primary key of new `AbstractBaseModel` rows, time ordered UUIDv7 when
+    `UUID7_PRIMARY_KEYS` is enabled, random UUIDv4 otherwise"""
+    if settings.UUID7_PRIMARY_KEYS:
+        return uuid7()
+    return uuid.uuid4()
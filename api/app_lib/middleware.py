@@ -0,0 +1,12 @@
+from .authorization_cache import decision_cache
+
+
+class AuthorizationCacheMiddleware:
+    """Open an authorization decision cache scope for the duration of each request"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with decision_cache.scope():
+            return self.get_response(request)
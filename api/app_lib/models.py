@@ -1,11 +1,11 @@
-import uuid
-
 from django.db import models, router
+from django.db.models import F
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.db.models.manager import Manager
 
-from .app_permssions import permissions_exist
+from .ids import generate_id
+from .app_permssions import permissions_exist, perms_to_mask, mask_to_perms
 from .soft_deletion import SoftDeleteCollector
 from .manager import DefaultManager
 
@@ -15,7 +15,7 @@ class AbstractBaseModel(models.Model):
     Abstract base model that provides common fields and methods.
     """
     id = models.UUIDField(
-        primary_key=True, editable=False, default=uuid.uuid4
+        primary_key=True, editable=False, default=generate_id
     )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -77,46 +77,63 @@ class AbstractBaseModel(models.Model):
 
 
 class AbstractBasePermissionModel(AbstractBaseModel):
-    """Provide a permission text field along with how to create and remove
-    permissions"""
-    perms = models.TextField(
+    """Provide a permission field along with how to create and remove
+    permissions. Permissions are stored as a bit mask, see `PERMISSION_BITS`"""
+    perms = models.BigIntegerField(
         _("Permissions"),
+        default=0,
     )
     class Meta:
         abstract = True
 
     def __setattr__(self, name, value):
         if name == "perms":
-            # ensure after perms manipulation the value is set back as string
-            if isinstance(value, list):
+            # ensure after perms manipulation the value is set back as a mask
+            if isinstance(value, (list, str)):
                 value = self.dump_perms(value)
-            elif not isinstance(value, str):
+            elif not isinstance(value, int):
                 raise ValueError(
-                    f"perms model attribute must be set as a string not {type(value)}"
+                    f"perms model attribute must be set as an int not {type(value)}"
                 )
         object.__setattr__(self, name, value)
     
     @classmethod
-    def dump_perms(cls, perms:list) -> str:
-        """Dump permissions to a string"""
-        if isinstance(perms, str):
+    def dump_perms(cls, perms:list|str|int) -> int:
+        """Dump permissions to a mask"""
+        if isinstance(perms, int):
             return perms
         
-        if len(perms) == 0:
-            return ""
+        if isinstance(perms, str):
+            perms = perms.split(",")
         
-        return ",".join(perms)
+        return perms_to_mask(perms)
+
+    @classmethod
+    def filter_with_perms(cls, queryset, perms:str|list[str]):
+        """Filter `queryset` to objects having all `perms`"""
+        if isinstance(perms, str):
+            perms = [perms]
+        mask = cls.dump_perms(perms)
+        return queryset.alias(
+            granted_perms=F("perms").bitand(mask)
+        ).filter(granted_perms=mask)
+
+    @classmethod
+    def filter_with_any_perms(cls, queryset, perms:str|list[str]):
+        """Filter `queryset` to objects having at least one of `perms`"""
+        if isinstance(perms, str):
+            perms = [perms]
+        return queryset.alias(
+            granted_perms=F("perms").bitand(cls.dump_perms(perms))
+        ).exclude(granted_perms=0)
 
-    def save_perms(self, perms:list):
+    def save_perms(self, perms:list|int):
         self.perms = self.dump_perms(perms)
         self.save()
 
     def get_perms(self) -> list[str]:
         """Get permissions of the user as a list"""
-        user_perms = self.perms.split(",")
-        while '' in user_perms:
-            user_perms.remove('')
-        return user_perms
+        return mask_to_perms(self.perms)
     
     def add_permissions(self, perms:str|list[str]):
         """Add permissions to the user and return a tuple containing in order: 
@@ -126,14 +143,9 @@ class AbstractBasePermissionModel(AbstractBaseModel):
         _, found, not_found = permissions_exist(perms)
 
         if found:
-            added_count = 0
-            user_perms = self.get_perms()
-            for user_perm in found:
-                if user_perm not in user_perms:
-                    user_perms.append(user_perm)
-                    added_count += 1
-            if added_count:
-                self.save_perms(user_perms)
+            perms_mask = self.perms | self.dump_perms(found)
+            if perms_mask != self.perms:
+                self.save_perms(perms_mask)
 
         return found, not_found
 
@@ -145,15 +157,8 @@ class AbstractBasePermissionModel(AbstractBaseModel):
         _, found, not_found = permissions_exist(perms)
 
         if found:
-            removed_count = 0
-            user_perms = self.get_perms()
-            for user_perm in found:
-                if user_perm in user_perms:
-                    while user_perm in user_perms:
-                        user_perms.remove(user_perm)
-                    removed_count += 1
-            
-            if removed_count:
-                self.save_perms(user_perms)
+            perms_mask = self.perms & ~self.dump_perms(found)
+            if perms_mask != self.perms:
+                self.save_perms(perms_mask)
 
         return found, not_found
\ No newline at end of file
@@ -1,19 +1,241 @@
-from rest_framework.pagination import CursorPagination
+import json
+
+from django.conf import settings
+from django.db.models import BooleanField, ExpressionWrapper, F, OrderBy, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination, Cursor
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from search.backends import search_backend
 
 class DefaultCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the ordering requested through `OrderingFilter`.
+
+    `tiebreaker` is appended to the ordering so each row has a unique position, the
+    cursor holds the sort key values of the row a page starts after and pages are
+    fetched with a range filter on them, no offset is ever used. Ascending orderings
+    put nulls first and descending ones put them last, fixed direction orderings of
+    `OrderingFilter` aliases placing nulls the other way are sorted on whether the
+    value is null first, see `get_sort_keys`.
+    """
     ordering = '-created_at'
+    tiebreaker = 'id'
     page_size = 50
+    page_size_query_param = 'page_size'
     max_page_size = 500
+    include_total_query_param = 'include_total'
+    # counting stops above this number of rows, `0` to always count every row,
+    # `PAGINATION_COUNT_LIMIT` setting when `None`
+    count_limit = None
 
     def paginate_queryset(self, queryset, request, view=None):
-        self.total_count = len(queryset)
-        return super().paginate_queryset(queryset, request, view)
-    
+        self.total_count, self.total_count_exact = None, True
+        if self.get_include_total(request):
+            self.total_count, self.total_count_exact = self.get_total_count(queryset)
+
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.sort_keys = self.get_sort_keys(self.ordering)
+        self.cursor = self.decode_cursor(request)
+        reverse = self.cursor.reverse if self.cursor else False
+        position = self.get_cursor_position(self.cursor)
+
+        sort_keys = self.reverse_sort_keys(self.sort_keys) if reverse else self.sort_keys
+        queryset = queryset.annotate(**{
+            self.get_key_name(index): expression
+            for index, (expression, _) in enumerate(sort_keys)
+        }).order_by(*[
+            F(self.get_key_name(index)).desc(nulls_last=True) if descending
+            else F(self.get_key_name(index)).asc(nulls_first=True)
+            for index, (_, descending) in enumerate(sort_keys)
+        ])
+        if position is not None:
+            queryset = queryset.filter(self.get_keyset_filter(queryset, sort_keys, position))
+
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following = len(results) > len(self.page)
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_following
+        else:
+            self.has_next, self.has_previous = has_following, position is not None
+
+        if self.page:
+            self.next_position = self.get_position(self.page[-1])
+            self.previous_position = self.get_position(self.page[0])
+        else:
+            self.next_position = self.previous_position = self.cursor and self.cursor.position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """Return the requested ordering followed by `tiebreaker`, in the direction
+        of the last field. Searched querysets are ordered by rank unless an ordering
+        is requested"""
+        requested = ()
+        if (
+            search_backend.rank_annotation in queryset.query.annotations
+            and api_settings.ORDERING_PARAM not in request.query_params
+        ):
+            ordering = [search_backend.rank_annotation]
+        else:
+            requested = super().get_ordering(request, queryset, view)
+            ordering = [
+                order for order in requested
+                if isinstance(order, OrderBy) or order.lstrip('-') not in (self.tiebreaker, 'pk')
+            ]
+        # ordering on the tiebreaker alone keeps its direction
+        last = ordering[-1] if ordering else (requested[-1] if requested else '')
+        ordering.append(f"-{self.tiebreaker}" if self.is_descending(last) else self.tiebreaker)
+        return tuple(ordering)
+
+    def is_descending(self, order) -> bool:
+        return order.descending if isinstance(order, OrderBy) else order.startswith('-')
+
+    def get_sort_keys(self, ordering) -> list:
+        """Return `(expression, descending)` pairs rows are sorted and positioned on.
+        A fixed direction ordering placing nulls the other way, eg:
+        `F("due_date").asc(nulls_last=True)`, is preceded by whether the value is null,
+        so an index on both keys can be used"""
+        sort_keys = []
+        for order in ordering:
+            if not isinstance(order, OrderBy):
+                sort_keys.append((F(order.lstrip('-')), order.startswith('-')))
+                continue
+            nulls_last = order.nulls_last or (order.descending and not order.nulls_first)
+            if nulls_last != order.descending:
+                is_null = Q(**{f"{order.expression.name}__isnull": True})
+                sort_keys.append(
+                    (ExpressionWrapper(is_null, output_field=BooleanField()), order.descending)
+                )
+            sort_keys.append((order.expression, order.descending))
+        return sort_keys
+
+    def reverse_sort_keys(self, sort_keys):
+        return [(expression, not descending) for expression, descending in sort_keys]
+
+    def get_key_name(self, index):
+        return f"cursor_{index}"
+
+    def get_position(self, instance):
+        values = [
+            getattr(instance, self.get_key_name(index)) for index in range(len(self.sort_keys))
+        ]
+        return json.dumps(values, default=str)
+
+    def get_cursor_position(self, cursor):
+        if cursor is None or cursor.position is None:
+            return None
+        try:
+            position = json.loads(cursor.position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.sort_keys):
+            raise NotFound(self.invalid_cursor_message)
+        return position
+
+    def get_keyset_filter(self, queryset, sort_keys, position):
+        """Return a filter matching rows coming after `position` in `sort_keys`:
+        `(a > x) OR (a = x AND b > y) ...`, bounded by `a >= x` so the database can
+        start a range scan on an index"""
+        keyset_filter = Q(pk__in=[])
+        equal = Q()
+        for index, ((_, descending), value) in enumerate(zip(sort_keys, position)):
+            name = self.get_key_name(index)
+            nullable = queryset.query.annotations[name].output_field.null
+            keyset_filter |= equal & self.get_after_filter(name, value, descending, nullable)
+            equal &= Q(**{f"{name}__isnull": True}) if value is None else Q(**{name: value})
+
+        name, value = self.get_key_name(0), position[0]
+        descending = sort_keys[0][1]
+        if value is None:
+            bound = Q() if not descending else Q(**{f"{name}__isnull": True})
+        elif descending:
+            bound = Q(**{f"{name}__lte": value})
+            if queryset.query.annotations[name].output_field.null:
+                bound |= Q(**{f"{name}__isnull": True})
+        else:
+            bound = Q(**{f"{name}__gte": value})
+        return bound & keyset_filter
+
+    def get_after_filter(self, name, value, descending, nullable):
+        """Rows strictly after `value` on a single key"""
+        if descending:
+            if value is None:
+                return Q(pk__in=[])
+            after = Q(**{f"{name}__lt": value})
+            return after | Q(**{f"{name}__isnull": True}) if nullable else after
+        if value is None:
+            return Q(**{f"{name}__isnull": False})
+        return Q(**{f"{name}__gt": value})
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=False, position=self.next_position)
+        )
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=True, position=self.previous_position)
+        )
+
+    def get_include_total(self, request):
+        value = request.query_params.get(self.include_total_query_param, "")
+        return value.lower() not in ("false", "0", "no")
+
+    def get_total_count(self, queryset):
+        """Return the number of rows in `queryset` computed with a `COUNT` and
+        whether it is exact, it isn't when `count_limit` is reached"""
+        count_limit = self.get_count_limit()
+        if not count_limit:
+            return queryset.count(), True
+        count = queryset.order_by()[:count_limit + 1].count()
+        if count > count_limit:
+            return count_limit, False
+        return count, True
+
+    def get_count_limit(self) -> int:
+        if self.count_limit is None:
+            return settings.PAGINATION_COUNT_LIMIT
+        return self.count_limit
+
     def get_paginated_response(self, data):
         return Response({
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'total_count': self.total_count,
+            'total_count_exact': self.total_count_exact,
             'results': data
-        })
\ No newline at end of file
+        })
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema['properties'].update({
+            'total_count': {'type': 'integer', 'nullable': True},
+            'total_count_exact': {'type': 'boolean'},
+        })
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [{
+            'name': self.include_total_query_param,
+            'required': False,
+            'in': 'query',
+            'description': 'Set to `false` to skip counting results, `total_count` is then null.',
+            'schema': {'type': 'boolean', 'default': True},
+        }]
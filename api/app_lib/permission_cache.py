@@ -0,0 +1,131 @@
+import threading
+import uuid
+from contextlib import contextmanager
+
+from django.core.cache import caches
+
+from .permission_resolver import OrgPermissions
+
+
+class PermissionCache:
+    """
+    Cross request cache of users effective permissions per organization, backed by the
+    `permissions` cache alias (LRU with TTL with the default local memory backend).
+
+    Entries are keyed on `(user_id, org_id)` along with a user and an org version, bumping
+    a version invalidates every entry of the user or the org at once. Entries are also
+    dropped by signals, see `perms.signals`.
+
+    Signals only reach the backend of the process making a write: unless the backend is
+    shared, other processes keep their entries until they expire, see
+    `PERMISSION_CACHE_TIMEOUT`. Work that must not act on stale permissions, like jobs,
+    runs within `bypass`.
+    """
+    cache_alias = "permissions"
+    key_prefix = "effective_perms"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._local = threading.local()
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _version_key(self, kind, obj_id):
+        return f"{self.key_prefix}:{kind}_version:{obj_id}"
+
+    def _get_versions(self, user_id, org_id):
+        keys = [
+            self._version_key("user", user_id),
+            self._version_key("org", org_id)
+        ]
+        versions = self.cache.get_many(keys)
+        missing = {
+            key: uuid.uuid4().hex for key in keys if key not in versions
+        }
+        if missing:
+            # never reuse a version, stale entries would become valid again
+            # when a version key is evicted
+            self.cache.set_many(missing, timeout=None)
+            versions.update(missing)
+        return [versions[key] for key in keys]
+
+    def make_key(self, user_id, org_id):
+        user_version, org_version = self._get_versions(user_id, org_id)
+        return f"{self.key_prefix}:{user_id}:{org_id}:{user_version}:{org_version}"
+
+    @contextmanager
+    def bypass(self):
+        """Resolve permissions without reading or filling the cache in the current thread"""
+        previous = getattr(self._local, "bypassed", False)
+        self._local.bypassed = True
+        try:
+            yield
+        finally:
+            self._local.bypassed = previous
+
+    def get_or_resolve(self, user, org, resolve):
+        """Return `user` cached `OrgPermissions` in `org` or call `resolve`,
+        cache and return its result"""
+        if getattr(self._local, "bypassed", False):
+            return resolve()
+
+        key = self.make_key(user.id, org.id)
+        data = self.cache.get(key)
+        if data is not None:
+            self._count(hit=True)
+            return OrgPermissions.load(org, data)
+
+        self._count(hit=False)
+        org_perms = resolve()
+        if org_perms is not None:
+            self.cache.set(key, org_perms.dump())
+        return org_perms
+
+    def invalidate(self, user_id, org_id):
+        """Drop `user_id` entry in `org_id`"""
+        self.cache.delete(self.make_key(user_id, org_id))
+
+    def invalidate_user(self, user_id):
+        """Drop every `user_id` entries"""
+        self.cache.set(
+            self._version_key("user", user_id), uuid.uuid4().hex, timeout=None
+        )
+
+    def invalidate_org(self, org_id):
+        """Drop every entries in `org_id`"""
+        self.cache.set(
+            self._version_key("org", org_id), uuid.uuid4().hex, timeout=None
+        )
+
+    def clear(self):
+        self.cache.clear()
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict:
+        """Return hits and misses counters of the current process along with the hit ratio"""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": hits / total if total else 0.0,
+        }
+
+    def reset_stats(self):
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+perm_cache = PermissionCache()
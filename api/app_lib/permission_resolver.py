@@ -0,0 +1,164 @@
+from django.db.models import (
+    Q,
+    Exists,
+    OuterRef,
+    Subquery,
+    Value,
+    BooleanField,
+    BigIntegerField,
+    ExpressionWrapper,
+)
+from django.db.models.functions import Coalesce
+
+from organization.models import Organization, OrgAccess
+from perms.models import UserPermissions, Role, UserRolePermissions
+from .app_permssions import perm_registry
+
+
+class OrgPermissions:
+    """Effective authorizations of a user in an organization"""
+    # every permission, the org creator has all of them
+    ALL_MASK = perm_registry.all_mask
+    # permissions owners and users in `can_be_accessed_by` have by default
+    DEFAULT_MASK = perm_registry.default_mask
+
+    def __init__(
+        self,
+        org,
+        *,
+        is_creator=False,
+        is_owner=False,
+        has_full_access=False,
+        direct_mask=0,
+        role_mask=0,
+    ):
+        self.org = org
+        self.is_creator = is_creator
+        self.is_owner = is_owner
+        self.has_full_access = has_full_access
+        self.direct_mask = direct_mask
+        self.role_mask = role_mask
+        # user roles in the org, only loaded on demand, see `EffectivePermissionResolver.resolve`
+        self.roles = []
+
+    def dump(self) -> tuple:
+        """Return a compact representation, without the org, see `load`"""
+        return (
+            self.is_creator, self.is_owner, self.has_full_access,
+            self.direct_mask, self.role_mask
+        )
+
+    @classmethod
+    def load(cls, org, data: tuple):
+        """Build `OrgPermissions` from `org` and data returned by `dump`"""
+        is_creator, is_owner, has_full_access, direct_mask, role_mask = data
+        return cls(
+            org,
+            is_creator=is_creator,
+            is_owner=is_owner,
+            has_full_access=has_full_access,
+            direct_mask=direct_mask,
+            role_mask=role_mask,
+        )
+
+    @property
+    def mask(self) -> int:
+        """Mask of every permission the user has in the org"""
+        if self.is_creator:
+            return self.ALL_MASK
+        mask = self.direct_mask | self.role_mask
+        if self.is_owner or self.has_full_access:
+            mask |= self.DEFAULT_MASK
+        return mask
+
+    def has(self, perm: str) -> bool:
+        return bool(self.mask & perm_registry.masks.get(perm, 0))
+
+    def get_perms(self) -> list[str]:
+        return perm_registry.get_perms(self.mask)
+
+
+class EffectivePermissionResolver:
+    """
+    Compute users effective authorizations per organization in a single query:
+    creator, owner and full access flags along with direct and roles permissions,
+    see `UserRolePermissions`, are annotated on organizations rows.
+    """
+
+    def get_queryset(self, user, orgs=None):
+        """Return organizations annotated with `user` authorizations. Default to
+        organizations `user` has access to, restricted to `orgs` when specified"""
+        if orgs is None:
+            queryset = Organization.objects.filter(
+                id__in=OrgAccess.objects.org_ids_for(user)
+            )
+        else:
+            queryset = Organization.objects.filter(id__in=[
+                getattr(org, "id", org) for org in orgs
+            ])
+
+        return queryset.annotate(
+            is_creator=ExpressionWrapper(
+                Q(created_by_id=user.id), output_field=BooleanField()
+            ),
+            is_owner=ExpressionWrapper(
+                Q(owner_id=user.id), output_field=BooleanField()
+            ),
+            has_full_access=Exists(
+                Organization.can_be_accessed_by.through.objects.filter(
+                    organization=OuterRef("pk"), appuser=user
+                )
+            ),
+            direct_mask=Coalesce(
+                Subquery(
+                    UserPermissions.objects.filter(
+                        org=OuterRef("pk"), user=user
+                    ).values("perms")[:1]
+                ),
+                Value(0),
+                output_field=BigIntegerField()
+            ),
+            role_mask=Coalesce(
+                Subquery(
+                    UserRolePermissions.objects.filter(
+                        org=OuterRef("pk"), user=user
+                    ).values("perms")[:1]
+                ),
+                Value(0),
+                output_field=BigIntegerField()
+            ),
+        )
+
+    def resolve(self, user, orgs=None, with_roles=False) -> dict:
+        """
+        Return a dict mapping organizations id to `user` `OrgPermissions`, see `get_queryset`
+        for `orgs`. With `with_roles`, `user` roles in each org are loaded with an additional
+        query.
+        """
+        queryset = self.get_queryset(user, orgs).select_related(
+            "owner", "created_by"
+        )
+
+        resolved = {}
+        for org in queryset:
+            resolved[org.id] = OrgPermissions(
+                org,
+                is_creator=org.is_creator,
+                is_owner=org.is_owner,
+                has_full_access=org.has_full_access,
+                direct_mask=org.direct_mask,
+                role_mask=org.role_mask,
+            )
+
+        if with_roles and resolved:
+            for role in Role.objects.filter(org__in=resolved.keys(), users=user):
+                resolved[role.org_id].roles.append(role)
+
+        return resolved
+
+    def resolve_org(self, user, org) -> OrgPermissions | None:
+        """Return `user` `OrgPermissions` in `org`, `None` when the org doesn't exist"""
+        return self.resolve(user, orgs=[org]).get(getattr(org, "id", org), None)
+
+
+perm_resolver = EffectivePermissionResolver()
@@ -9,6 +9,11 @@ class DefaultBasePermission(BasePermission):
     def has_objects_permission(self, request, view, objs):
         return True
 
+    def get_denied_ids(self, request, view, model, ids) -> set:
+        """Set based version of `has_objects_permission`, return ids in `ids` of
+        `model` objects the permission is denied on, without loading them"""
+        return set()
+
 
 class Can_Access_ObjectInstance(DefaultBasePermission):
     """ Check if a given user has permission to act on the current object 
@@ -21,6 +26,9 @@ class Can_Access_ObjectInstance(DefaultBasePermission):
     def has_objects_permission(self, request, view, objs):
         return auth_checker.has_access_to_objs(objs, request.user)
 
+    def get_denied_ids(self, request, view, model, ids):
+        return auth_checker.get_inaccessible_ids(model, ids, request.user)
+
 class Can_Access_Org_Or_Obj(DefaultBasePermission):
     """ Check if a given user has permission to act on the current object 
     use `created_by`, `can_be_accessed_by`, `org.owner`, `org.can_be_accessed_by`, 
@@ -50,6 +58,11 @@ class Can_Access_Org_Depart_Or_Obj(DefaultBasePermission):
         user = request.user
         return auth_checker.has_access_to_org_depart_or_obj_on_objs(objs, user)
 
+    def get_denied_ids(self, request, view, model, ids):
+        return auth_checker.get_org_depart_or_obj_inaccessible_ids(
+            model, ids, request.user
+        )
+
 
 class Is_Object_Or_Org_Or_Depart_Creator(DefaultBasePermission):
     """Passes if one of the following conditions is met:
@@ -69,7 +82,8 @@ class Is_Object_Or_Org_Or_Depart_Creator(DefaultBasePermission):
         if has_org and auth_checker.has_creator_access_on_obj(obj.org, user):
             return True
         
-        if hasattr(obj, 'depart') and auth_checker.has_creator_access_on_obj(obj.depart, user):
+        depart = getattr(obj, 'depart', None)
+        if depart and auth_checker.has_creator_access_on_obj(depart, user):
             return True
         
         return False
@@ -79,7 +93,17 @@ class Is_Object_Or_Org_Or_Depart_Creator(DefaultBasePermission):
         return self.permform_check(user, obj)
         
     def has_objects_permission(self, request, view, objs):
+        if auth_checker.is_bulk_check(objs):
+            return not self.get_denied_ids(
+                request, view, auth_checker.get_model(objs), [obj.id for obj in objs]
+            )
+
         for obj in objs:
             if not self.permform_check(request.user, obj):
                 return False  
-        return True
\ No newline at end of file
+        return True
+
+    def get_denied_ids(self, request, view, model, ids):
+        return auth_checker.get_org_depart_or_obj_inaccessible_ids(
+            model, ids, request.user, creator_only=True
+        )
\ No newline at end of file
@@ -0,0 +1,150 @@
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework import serializers
+from rest_framework.relations import ManyRelatedField, PrimaryKeyRelatedField
+
+
+class QueryPlan:
+    """
+    Relations and fields to load for a model, computed by `SerializerQueryPlanner`.
+    `fields` are passed to `only()`, `prefetches` are `(lookup, QueryPlan)` pairs
+    planning each prefetched model.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.fields = {model._meta.pk.name}
+        self.select_related = []
+        self.prefetches = []
+
+    def add_all_fields(self, model, prefix=""):
+        self.fields.update(
+            f"{prefix}{field.name}" for field in model._meta.concrete_fields
+        )
+
+
+class SerializerQueryPlanner:
+    """
+    Derive from a serializer class the `select_related`, `prefetch_related` and
+    `only()` calls needed to render it:
+
+    - forward relations rendered with a nested serializer are selected and their
+      fields planned along, the ones rendered as a primary key only load the key
+    - many to many and reverse relations are prefetched with their own plan
+    - a `SerializerMethodField` or a source that isn't a model field can read
+      anything on the instance, every field of its model is then loaded
+
+    Plans are computed once per serializer class and rendered fields.
+    """
+
+    def __init__(self):
+        self._plans = {}
+        self._field_names = {}
+
+    def get_field_names(self, serializer_class) -> tuple:
+        """Return names of the fields `serializer_class` renders"""
+        field_names = self._field_names.get(serializer_class)
+        if field_names is None:
+            field_names = tuple(
+                name for name, field in serializer_class().fields.items()
+                if not field.write_only
+            )
+            self._field_names[serializer_class] = field_names
+        return field_names
+
+    def get_plan(self, serializer_class, field_names=None) -> QueryPlan:
+        """Return the plan of `serializer_class`, restricted to `field_names`
+        fields when specified"""
+        key = (serializer_class, None if field_names is None else frozenset(field_names))
+        plan = self._plans.get(key)
+        if plan is None:
+            serializer = serializer_class()
+            plan = self.build_plan(serializer, serializer.Meta.model, key[1])
+            self._plans[key] = plan
+        return plan
+
+    def build_plan(self, serializer, model, field_names=None) -> QueryPlan:
+        plan = QueryPlan(model)
+        self.add_serializer(plan, serializer, model, field_names=field_names)
+        return plan
+
+    def get_model_field(self, model, field):
+        if isinstance(field, serializers.SerializerMethodField) or len(field.source_attrs) != 1:
+            return None
+        try:
+            return model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            return None
+
+    def add_serializer(self, plan, serializer, model, prefix="", field_names=None):
+        """Add to `plan` what `serializer` reads on `model` instances reached
+        through `prefix`, only `field_names` fields are considered when specified"""
+        plan.fields.add(f"{prefix}{model._meta.pk.name}")
+        for field_name, field in serializer.fields.items():
+            if field.write_only or (field_names is not None and field_name not in field_names):
+                continue
+
+            model_field = self.get_model_field(model, field)
+            if model_field is None:
+                plan.add_all_fields(model, prefix)
+                continue
+
+            name = f"{prefix}{model_field.name}"
+            if not model_field.is_relation:
+                plan.fields.add(name)
+            elif model_field.many_to_many or model_field.one_to_many:
+                plan.prefetches.append((name, self.get_related_plan(field, model_field)))
+            elif model_field.concrete:
+                # forward foreign key or one to one
+                plan.fields.add(name)
+                if isinstance(field, PrimaryKeyRelatedField):
+                    continue
+                plan.select_related.append(name)
+                if isinstance(field, serializers.BaseSerializer):
+                    self.add_serializer(plan, field, model_field.related_model, f"{name}__")
+                else:
+                    plan.add_all_fields(model_field.related_model, f"{name}__")
+            else:
+                # reverse one to one, the related object is queried on access
+                plan.add_all_fields(model, prefix)
+
+    def get_related_plan(self, field, model_field) -> QueryPlan:
+        """Plan of a prefetched relation rendered by `field`"""
+        related_model = model_field.related_model
+        if isinstance(field, serializers.ListSerializer):
+            field = field.child
+        elif isinstance(field, ManyRelatedField):
+            field = field.child_relation
+
+        if isinstance(field, serializers.BaseSerializer):
+            plan = self.build_plan(field, related_model)
+        else:
+            plan = QueryPlan(related_model)
+            if not isinstance(field, PrimaryKeyRelatedField):
+                plan.add_all_fields(related_model)
+
+        if model_field.one_to_many:
+            # needed to attach prefetched objects to their parent
+            plan.fields.add(model_field.field.name)
+        return plan
+
+    def apply(self, plan: QueryPlan, queryset):
+        """Return `queryset` loading relations and fields from `plan` only"""
+        queryset = queryset.select_related(None).prefetch_related(None)
+        if plan.select_related:
+            queryset = queryset.select_related(*plan.select_related)
+        return queryset.only(*plan.fields).prefetch_related(*[
+            Prefetch(
+                lookup,
+                queryset=self.apply(related_plan, related_plan.model._default_manager.all())
+            )
+            for lookup, related_plan in plan.prefetches
+        ])
+
+    def plan_queryset(self, serializer_class, queryset, field_names=None):
+        """Return `queryset` loading what `serializer_class` renders, restricted
+        to `field_names` fields when specified"""
+        return self.apply(self.get_plan(serializer_class, field_names), queryset)
+
+
+query_planner = SerializerQueryPlanner()
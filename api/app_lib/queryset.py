@@ -6,6 +6,7 @@ from organization.models import Department, Organization
 from tasks.models import Task
 from tags.models import Tag
 from perms.models import UserPermissions, Role
+from .query_planner import query_planner
 
 class ModelDefaultQuerysets:
     """
@@ -299,4 +300,19 @@ class ModelDefaultQuerysets:
             prefetch_org_can_be_accessed_by=prefetch_org_can_be_accessed_by
         )
 
+    def get_serializer_queryset(
+        self, serializer_class, queryset=None, field_names=None
+    ) -> QuerySet:
+        """Returns a queryset loading only the relations and fields `serializer_class`
+        renders, see `SerializerQueryPlanner`.
+
+        :param serializer_class: The model serializer class the queryset data is rendered with.
+        :param queryset: The queryset to plan, default to the serializer model `.objects.all()`.
+        :param field_names: If specified, only these serializer fields are rendered.
+        :return: QuerySet for the serializer model.
+        """
+        if queryset is None:
+            queryset = serializer_class.Meta.model.objects.all()
+        return query_planner.plan_queryset(serializer_class, queryset, field_names)
+
 queryset_helpers = ModelDefaultQuerysets()
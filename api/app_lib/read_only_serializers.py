@@ -138,6 +138,12 @@ class RemovePermissionResponseSerializer(serializers.Serializer):
     not_found = serializers.ListSerializer(child=serializers.CharField())
 
 
+class CheckPermissionResponseSerializer(serializers.Serializer):
+    perm = serializers.CharField()
+    granted = serializers.ListSerializer(child=serializers.UUIDField())
+    not_granted = serializers.ListSerializer(child=serializers.UUIDField())
+
+
 class SimpleRoleSerializer(serializers.ModelSerializer):
     id = serializers.ReadOnlyField()
     name = serializers.ReadOnlyField()
@@ -157,7 +163,8 @@ class SimpleRoleSerializer(serializers.ModelSerializer):
     
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        representation["perms"] = instance.get_perms()
+        if "perms" in representation:
+            representation["perms"] = instance.get_perms()
         return representation
     
 
@@ -268,6 +275,18 @@ class CreateUpdateTaskResponseSerializer(TaskDetailSerializer):
     depart = serializers.PrimaryKeyRelatedField(read_only=True)
 
 
+class BulkUpdateTaskResponseSerializer(serializers.Serializer):
+    """Tasks bulk update success response"""
+    updated = serializers.ListField(
+        child=serializers.CharField(),
+        help_text="List of updated task ids."
+    )
+    unchanged = serializers.ListField(
+        child=serializers.CharField(),
+        help_text="List of task ids left as they were."
+    )
+
+
 #======= User detail ==============
 class AuthorizationField(serializers.Serializer):
     org = OrganizationSerializer(read_only=True)
@@ -1,90 +1,147 @@
 from collections import Counter
 from functools import reduce
+from itertools import islice
 from operator import or_
 
-from django.db.models.deletion import Collector
-from django.db import transaction
-from django.db.models import sql
-from django.db import models
+from django.db import models, transaction
+from django.db.models import QuerySet
+from django.dispatch import Signal
+from django.utils import timezone
 
 
-class SoftDeleteCollector(Collector):
-    """Subclasse the default django `collector` to get its power and to allow complete sof delete
-    mechanisme and being able to update our approach as django changes. 
-    
-    We override the `delete` method so objects are softdeleted intead of 
-    completly deleted.
+# Sent once per model after objects are soft deleted, with `queryset`
+# matching soft deleted objects of `sender`
+post_soft_delete = Signal()
+
+
+def is_soft_deletable(model):
+    return any(field.name == "is_deleted" for field in model._meta.concrete_fields)
+
+
+class SoftDeleteCollector:
+    """
+    Soft delete objects along with the ones depending on them, without loading
+    any instance.
+
+    The relation graph is walked from the collected objects, following `on_delete`
+    rules as django does: cascaded rows are soft deleted with a single
+    `UPDATE ... WHERE fk IN (subquery)` per model, `SET_NULL` relations are updated
+    the same way. Collected objects primary keys are read `chunk_size` at a time and
+    each chunk is cascaded on its own. Rows of models without `is_deleted`, like
+    many to many tables, are left as it, they are removed with a hard delete.
+
+    Self referencing or cyclic relations, eg: users created by a deleted user, can't
+    be expressed with nested subqueries, their primary keys are read to start a
+    new walk.
 
     `collect` method should be called before the `delete` method.
-    
+
     This is only use within our own model object and manager"""
+    chunk_size = 1000
+
+    def __init__(self, using, origin=None):
+        self.using = using
+        self.origin = origin
+        self.model = None
+        self.instances = []
+        self.pk_source = None
+
+    def collect(self, objs, **kwargs):
+        """Collect `objs`, a queryset or a list of instances of the same model"""
+        if isinstance(objs, QuerySet):
+            self.model = objs.model
+            self.pk_source = objs.values_list("pk", flat=True)
+        else:
+            self.instances = list(objs)
+            if self.instances:
+                self.model = self.instances[0].__class__
+            self.pk_source = [obj.pk for obj in self.instances]
 
     def delete(self):
-        """Soft delete objects"""
+        """Soft delete collected objects, return the number of soft deleted objects
+        and a dict of this number for each model label"""
         # number of objects soft deleted for each model label
-        deleted_counter = Counter()
-
-        # Optimize for the case with a single obj
-        if len(self.data) == 1:
-            model, instances = list(self.data.items())[0]
-            instance = list(instances)[0]
-            if (
-                len(instances) == 1 and 
-                self.can_fast_delete(instance) and
-                hasattr(instance, "is_deleted")
-            ):
-                count = 1
-                instance.is_deleted = True
-                instance.save()
-                return count, {model._meta.label: count}
-
-        with transaction.atomic(using=self.using, savepoint=False):
-            # no pre_soft_delete yet, will be added if needed
-
-            # fast deletes
-            for qs in self.fast_deletes:
-                if len(qs) == 0:
-                    continue
-                object_from_qs = qs[0]
-                if hasattr(object_from_qs, "is_deleted"):
-                    count = qs.update(is_deleted=True)
-                    deleted_counter[qs.model._meta.label] += count if count else 0
-
-            # update fields, leave this as it, no deletion, just needed fields updated
-            for (field, value), instances_list in self.field_updates.items():
-                updates = []
-                objs = []
-                for instances in instances_list:
-                    if (
-                        isinstance(instances, models.QuerySet)
-                        and instances._result_cache is None
-                    ):
-                        updates.append(instances)
-                    else:
-                        objs.extend(instances)
-                if updates:
-                    combined_updates = reduce(or_, updates)
-                    combined_updates.update(**{field.name: value})
-                if objs:
-                    model = objs[0].__class__
-                    query = sql.UpdateQuery(model)
-                    query.update_batch(
-                        list({obj.pk for obj in objs}), {field.name: value}, self.using
-                    )
+        self.deleted_counter = Counter()
+        # soft deleted objects querysets per model, see `post_soft_delete`
+        self.soft_deleted = {}
+        # primary keys read for models walked through a cycle
+        self.seen = {}
+        self.deleted_at = timezone.now()
 
-            # delete instances by setting is_deleted to true
-            for model, instances in self.data.items():
-                if len(instances) == 0:
-                    continue
-                example_instance = instances.pop()
-                if not hasattr(example_instance, "is_deleted"):
+        if self.model is not None and is_soft_deletable(self.model):
+            with transaction.atomic(using=self.using, savepoint=False):
+                self.delete_pks(self.model, self.pk_source)
+
+        for instance in self.instances:
+            instance.is_deleted = True
+            instance.deleted_at = self.deleted_at
+
+        for model, querysets in self.soft_deleted.items():
+            post_soft_delete.send(
+                sender=model,
+                queryset=reduce(or_, querysets),
+                using=self.using
+            )
+
+        return sum(self.deleted_counter.values()), dict(self.deleted_counter)
+
+    def get_base_queryset(self, model):
+        return model._base_manager.using(self.using)
+
+    def delete_pks(self, model, pks):
+        """Soft delete `model` rows with `pks` primary keys, chunk by chunk"""
+        seen = self.seen.setdefault(model, set())
+        pks = (pk for pk in pks if pk not in seen)
+        while chunk := list(islice(pks, self.chunk_size)):
+            seen.update(chunk)
+            self.delete_queryset(
+                model, self.get_base_queryset(model).filter(pk__in=chunk), (model,)
+            )
+
+    def delete_queryset(self, model, queryset, path):
+        """Soft delete `queryset` rows and the ones depending on them, `path` holds
+        models walked to reach `model`"""
+        for relation in self.get_dependent_relations(model):
+            related_model = relation.related_model
+            field = relation.field
+            related = self.get_base_queryset(related_model).filter(**{
+                f"{field.name}__in": queryset.values(field.target_field.attname)
+            })
+            on_delete = field.remote_field.on_delete
+
+            if on_delete is models.CASCADE:
+                if not is_soft_deletable(related_model):
                     continue
-                pk_list = [obj.pk for obj in instances]
-                pk_list.append(example_instance.pk)
-                count = model._default_manager.filter(pk__in=pk_list).update(is_deleted=True)
-                deleted_counter[model._meta.label] += count if count else 0
+                if related_model in path:
+                    self.delete_pks(
+                        related_model, list(related.values_list("pk", flat=True))
+                    )
+                else:
+                    self.delete_queryset(
+                        related_model, related, (*path, related_model)
+                    )
+            elif on_delete is models.SET_NULL:
+                related.update(**{field.name: None})
+            elif on_delete is models.SET_DEFAULT:
+                related.update(**{field.name: field.get_default()})
+            elif on_delete is not models.DO_NOTHING:
+                raise NotImplementedError(
+                    "%s.%s on_delete isn't supported by soft deletion"
+                    % (related_model._meta.label, field.name)
+                )
 
-                # no post_soft_delete yet, will be added if needed
+        count = queryset.filter(is_deleted=False).update(
+            is_deleted=True, deleted_at=self.deleted_at
+        )
+        if count:
+            self.deleted_counter[model._meta.label] += count
+            self.soft_deleted.setdefault(model, []).append(
+                queryset.filter(deleted_at=self.deleted_at)
+            )
 
-        return sum(deleted_counter.values()), dict(deleted_counter)
-    
\ No newline at end of file
+    def get_dependent_relations(self, model):
+        """Reverse foreign keys and one to one relations pointing to `model`"""
+        return [
+            relation for relation in model._meta.related_objects
+            if (relation.one_to_many or relation.one_to_one) and relation.field.concrete
+        ]
@@ -5,10 +5,12 @@ from rest_framework.request import Request
 from django.db.transaction import atomic
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
-from django.db.models.query import Q
+from django.conf import settings
+from django.http import HttpRequest
 from django.http.response import Http404
 from django.shortcuts import get_object_or_404
 
@@ -17,14 +19,22 @@ from .global_serializers import (
     ChangeUserOwnerListSerializer
 )
 from .authorization import auth_checker
+from .queryset import queryset_helpers
+from .query_planner import query_planner
 from .decorators import schema_wrapper
 from .app_permssions import CAN_CHANGE_RESSOURCES_OWNERS
 from .permissions import Is_Object_Or_Org_Or_Depart_Creator
+from .visibility import VisibilityFilter
 from organization.models import Organization
 
 
 class BulkDeleteResourceMixin:
     bulk_delete_view_name = "bulk_delete"
+    # number of ids checked and deleted per query
+    bulk_delete_chunk_size = 1000
+    # above this number of ids, ressources are deleted by a job, see `run_bulk_delete_job`,
+    # `BULK_DELETE_ASYNC_THRESHOLD` setting when `None`
+    bulk_delete_async_threshold = None
 
     @schema_wrapper(
         request_serializer=BulkDeleteResourceSerializer
@@ -54,31 +64,65 @@ class BulkDeleteResourceMixin:
         
         If all provided IDs are not found, a 404 error response is returned with an 
         appropriate error message.
+
+        Above `BULK_DELETE_ASYNC_THRESHOLD` IDs, a 202 response is returned with the job
+        deleting the resources, its status and counts are available at `/jobs/{id}/`.
         """
         return self.perform_bulk_delete(request)
 
     def get_ressources_queryset(self, ressource_ids):
         return self.get_queryset().filter(id__in=ressource_ids)
-    
+
+    def get_id_chunks(self, ressource_ids):
+        size = self.bulk_delete_chunk_size
+        return [
+            ressource_ids[start:start + size] for start in range(0, len(ressource_ids), size)
+        ]
+
+    def get_bulk_delete_async_threshold(self) -> int:
+        if self.bulk_delete_async_threshold is None:
+            return settings.BULK_DELETE_ASYNC_THRESHOLD
+        return self.bulk_delete_async_threshold
+
+    def get_found_ids(self, ressource_ids) -> set:
+        """Return ids in `ressource_ids` of ressources returned by `get_queryset`"""
+        found = set()
+        for chunk in self.get_id_chunks(ressource_ids):
+            found.update(
+                str(pk) for pk in self.get_ressources_queryset(chunk).values_list("id", flat=True)
+            )
+        return found
+
+    def check_bulk_delete_permissions(self, request, ressource_ids):
+        """Check user permissions over ressources, potentially raise a forbiden error"""
+        model = self.get_queryset().model
+        for chunk in self.get_id_chunks(ressource_ids):
+            self.check_ids_permissions(
+                request, model, [model._meta.pk.to_python(r_id) for r_id in chunk]
+            )
+
     def perform_bulk_delete(self, request:Request):
         """Perform bulk delete of ressources. Use data returned by get_queryset"""
         serializer = BulkDeleteResourceSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        ressource_ids = serializer.data.get('ids')
+        ressource_ids = list(dict.fromkeys(serializer.data.get('ids')))
+
+        if len(ressource_ids) > self.get_bulk_delete_async_threshold():
+            return self.create_bulk_delete_job(request, ressource_ids)
 
         # get ressources
-        to_be_deleted = self.get_ressources_queryset(ressource_ids)
-        if not to_be_deleted:
+        found = self.get_found_ids(ressource_ids)
+        if not found:
             return self.get_not_found_error()
-        
+        deleted = [r_id for r_id in ressource_ids if r_id in found]
+        not_found = [r_id for r_id in ressource_ids if r_id not in found]
+
         # check for user permission over objects, potentially return a forbiden response
-        self.check_objects_permissions(request, to_be_deleted)
+        self.check_bulk_delete_permissions(request, deleted)
 
         # delete ressources
-        deleted = [str(deleted.id) for deleted in to_be_deleted]
-        not_found = [n_id for n_id in ressource_ids if n_id not in deleted]
         with atomic():
-            to_be_deleted.delete()
+            self.get_ressources_queryset(deleted).delete()
 
         if not_found:
             return Response(
@@ -90,6 +134,48 @@ class BulkDeleteResourceMixin:
         
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def create_bulk_delete_job(self, request:Request, ressource_ids):
+        # imported here, `app_lib` doesn't depend on the `jobs` app at import time
+        from jobs.lib import enqueue_bulk_delete
+
+        data = enqueue_bulk_delete(request.user, type(self), self.kwargs, ressource_ids)
+        return Response(data, status=status.HTTP_202_ACCEPTED)
+
+    @classmethod
+    def get_job_view(cls, job):
+        """Return a view acting for `job` creator as in the request creating it"""
+        initkwargs = getattr(getattr(cls, cls.bulk_delete_view_name), "kwargs", {})
+        view = cls(**initkwargs)
+        view.action = cls.bulk_delete_view_name
+        view.args, view.kwargs, view.format_kwarg = (), job.payload["kwargs"], None
+        view.request = Request(HttpRequest())
+        view.request.user = job.created_by
+        return view
+
+    @classmethod
+    def run_bulk_delete_job(cls, job):
+        """
+        Delete ressources of a job created by `perform_bulk_delete` chunk by chunk,
+        `job` counts are saved with each chunk, a job run again after its worker stopped
+        carries on. Permissions over every ressource are
+        checked before anything is deleted, the job fails as the request would.
+        """
+        view = cls.get_job_view(job)
+        ressource_ids = job.payload["ids"]
+        found = view.get_found_ids(ressource_ids)
+        deleted = [r_id for r_id in ressource_ids if r_id in found]
+        view.check_bulk_delete_permissions(view.request, deleted)
+
+        # a job run again keeps the count of ressources its previous runs deleted
+        job.not_found_count = len(ressource_ids) - len(deleted) - job.deleted_count
+        job.save_progress("not_found_count")
+        label = view.get_queryset().model._meta.label
+        for chunk in view.get_id_chunks(deleted):
+            with atomic():
+                _, per_model = view.get_ressources_queryset(chunk).delete()
+                job.deleted_count += per_model.get(label, 0)
+                job.save_progress("deleted_count")
+
 
 class ChangeObjectOwnersMixin:
     owner_view_name = "change_owners"
@@ -160,6 +246,11 @@ class DefaultModelViewSet(ModelViewSet):
     retrieve_view_name = "retrieve"
     list_view_name = "list"
     delete_view_name = "destroy"
+    # actions loading only what their serializer renders, see `get_base_queryset`
+    planned_actions = [list_view_name, retrieve_view_name]
+    # query params to select fields rendered by `planned_actions`, see `get_sparse_field_names`
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
 
     def get_raw_object(self):
         """
@@ -185,6 +276,73 @@ class DefaultModelViewSet(ModelViewSet):
         """
         return super().get_queryset()
 
+    def get_base_queryset(self):
+        """
+        Returns `.queryset`, for `planned_actions` relations and fields loaded are
+        derived from the action serializer, see `SerializerQueryPlanner`.
+        """
+        queryset = super().get_queryset()
+        if self.action in self.planned_actions:
+            return queryset_helpers.get_serializer_queryset(
+                self.get_serializer_class(), queryset, self.get_sparse_field_names()
+            )
+        return queryset
+
+    def get_queryset(self):
+        return self.get_base_queryset()
+
+    def get_query_param_list(self, name):
+        return [
+            value.strip()
+            for param in self.request.query_params.getlist(name)
+            for value in param.split(",") if value.strip()
+        ]
+
+    def get_sparse_field_names(self):
+        """
+        Returns names of the fields to render for `planned_actions` selected with 
+        `fields` and/or `exclude` query params, comma separated. `None` when every field 
+        should be rendered. Raise a validation error on unknown fields.
+        """
+        if self.action not in self.planned_actions:
+            return None
+        if hasattr(self, "_sparse_field_names"):
+            return self._sparse_field_names
+
+        fields = self.get_query_param_list(self.fields_query_param)
+        exclude = self.get_query_param_list(self.exclude_query_param)
+        field_names = None
+        if fields or exclude:
+            available = query_planner.get_field_names(self.get_serializer_class())
+            errors = {
+                param: _("Unknown fields: %(fields)s") % {"fields": ", ".join(unknown)}
+                for param, values in [
+                    (self.fields_query_param, fields), (self.exclude_query_param, exclude)
+                ]
+                if (unknown := [value for value in values if value not in available])
+            }
+            if errors:
+                raise ValidationError(errors)
+            field_names = [
+                name for name in available
+                if (not fields or name in fields) and name not in exclude
+            ]
+
+        self._sparse_field_names = field_names
+        return field_names
+
+    def get_serializer(self, *args, **kwargs):
+        """Returns the serializer instance, without fields not selected, 
+        see `get_sparse_field_names`"""
+        serializer = super().get_serializer(*args, **kwargs)
+        field_names = self.get_sparse_field_names()
+        if field_names is not None:
+            fields = getattr(serializer, "child", serializer).fields
+            for name in list(fields):
+                if name not in field_names:
+                    fields.pop(name)
+        return serializer
+
     def get_access_allowed_queryset(
             self, 
             with_owner_filter=False,
@@ -192,21 +350,36 @@ class DefaultModelViewSet(ModelViewSet):
             filters=None
         ):
         """Return ressources that the user can access"""
-        queryset = super().get_queryset()
+        queryset = self.get_base_queryset()
 
         if filters:
             return queryset.filter(filters)
         
-        user = self.request.user
-        filters = Q(created_by=user) | Q(can_be_accessed_by__in=[user])
+        visibility = VisibilityFilter(queryset.model, self.request.user).created_by().in_m2m(
+            "can_be_accessed_by"
+        )
 
         if with_owner_filter:
-            filters = filters | Q(owner=user)
+            visibility.owner()
 
         if with_self_data:
-            filters = filters |  Q(id=user.id)
+            visibility.is_user()
+
+        return visibility.filter(queryset)
 
-        return queryset.filter(filters).distinct()
+    def check_ids_permissions(self, request, model, ids):
+        """
+        Set based version of `check_objects_permissions` over `model` objects with
+        `ids`, objects aren't loaded, see `get_denied_ids` on permissions.
+        """
+        for permission in self.get_permissions():
+            checker = getattr(permission, "get_denied_ids", None)
+            if checker and checker(request, self, model, ids):
+                self.permission_denied(
+                    request,
+                    message=getattr(permission, 'message', None),
+                    code=getattr(permission, 'code', None)
+                )
 
     def check_objects_permissions(self, request, objs):
         """
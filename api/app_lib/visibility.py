@@ -0,0 +1,63 @@
+from django.db.models import Q, Exists, OuterRef
+
+from organization.models import OrgAccess
+
+
+class VisibilityFilter:
+    """
+    Build the filter matching `model` objects `user` can see, conditions are chained
+    and combined with `OR`.
+
+    Many to many conditions are correlated `EXISTS` over the relation table and org
+    access is an `IN` over `OrgAccess`, rows are never joined to multi-valued relations
+    so querysets don't need `DISTINCT`, eg:
+
+        VisibilityFilter(Tag, user).created_by().in_m2m("can_be_accessed_by").in_orgs()
+    """
+
+    def __init__(self, model, user):
+        self.model = model
+        self.user = user
+        self.query = Q()
+
+    def add(self, query):
+        self.query |= query
+        return self
+
+    def get_related_model(self, relation):
+        if relation is None:
+            return self.model
+        return self.model._meta.get_field(relation).related_model
+
+    def created_by(self, relation=None):
+        """`user` created the object or its `relation`"""
+        name = f"{relation}__created_by" if relation else "created_by"
+        return self.add(Q(**{name: self.user}))
+
+    def owner(self):
+        return self.add(Q(owner=self.user))
+
+    def is_user(self):
+        """The object is `user` itself"""
+        return self.add(Q(pk=self.user.pk))
+
+    def in_m2m(self, field_name, relation=None):
+        """`user` is in the object or its `relation` `field_name` many to many field"""
+        field = self.get_related_model(relation)._meta.get_field(field_name)
+        outer_ref = f"{relation}_id" if relation else "pk"
+        return self.add(Exists(
+            field.remote_field.through.objects.filter(**{
+                field.m2m_field_name(): OuterRef(outer_ref),
+                field.m2m_reverse_field_name(): self.user,
+            })
+        ))
+
+    def in_orgs(self, levels=None, field_name="org"):
+        """The object `field_name` is an organization `user` has access to through
+        one of `levels`, see `OrgAccess`"""
+        return self.add(Q(**{
+            f"{field_name}__in": OrgAccess.objects.org_ids_for(self.user, levels)
+        }))
+
+    def filter(self, queryset):
+        return queryset.filter(self.query)
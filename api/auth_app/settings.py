@@ -49,7 +49,9 @@ INSTALLED_APPS = [
     'organization',
     'tasks',
     'tags',
-    'perms'
+    'perms',
+    'search',
+    'jobs',
 ]
 if DEBUG:
     INSTALLED_APPS.append('rest_framework')
@@ -62,6 +64,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'app_lib.middleware.AuthorizationCacheMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -140,6 +143,27 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = "user.AppUser"
 
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # users effective permissions per organization, see app_lib.permission_cache.
+    # Entries are invalidated in the backend of the process making a write, with the
+    # default per process memory backend other processes may use permissions up to
+    # `PERMISSION_CACHE_TIMEOUT` seconds old. Set a backend shared by every process,
+    # eg: redis, before raising the timeout
+    "permissions": {
+        "BACKEND": config(
+            "PERMISSION_CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("PERMISSION_CACHE_LOCATION", default="effective-permissions"),
+        "TIMEOUT": config("PERMISSION_CACHE_TIMEOUT", default=5, cast=int),
+        "OPTIONS": {
+            "MAX_ENTRIES": config("PERMISSION_CACHE_MAX_ENTRIES", default=10000, cast=int),
+        },
+    },
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
@@ -147,11 +171,36 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_FILTER_BACKENDS': (
         'django_filters.rest_framework.DjangoFilterBackend',
-        "rest_framework.filters.OrderingFilter"
+        "app_lib.filter.OrderingFilter"
     ),
     'DEFAULT_PAGINATION_CLASS': 'app_lib.pagination.DefaultCursorPagination',
 }
 
+# Above this number of rows, list responses total count is a lower bound, 0 to disable
+PAGINATION_COUNT_LIMIT = config("PAGINATION_COUNT_LIMIT", default=0, cast=int)
+
+# New rows primary keys are time ordered UUIDv7 instead of random UUIDv4, see `app_lib.ids`
+UUID7_PRIMARY_KEYS = config("UUID7_PRIMARY_KEYS", default=False, cast=bool)
+
+# Backend of the `search` filter, `search.backends.DatabaseSearchBackend` on databases other than SQLite
+SEARCH_BACKEND = config("SEARCH_BACKEND", default="search.backends.FTS5SearchBackend")
+
+# Soft deleted rows are hard deleted this number of days after their deletion by the
+# `purge_soft_deleted` command, in batches of `SOFT_DELETE_PURGE_BATCH_SIZE` rows spaced
+# by `SOFT_DELETE_PURGE_SLEEP` seconds, see `jobs.purge`
+SOFT_DELETE_RETENTION_DAYS = config("SOFT_DELETE_RETENTION_DAYS", default=30, cast=int)
+SOFT_DELETE_PURGE_BATCH_SIZE = config("SOFT_DELETE_PURGE_BATCH_SIZE", default=500, cast=int)
+SOFT_DELETE_PURGE_SLEEP = config("SOFT_DELETE_PURGE_SLEEP", default=0.1, cast=float)
+
+# Above this number of ids, bulk deletions are done by a job run by the `run_jobs` command
+BULK_DELETE_ASYNC_THRESHOLD = config("BULK_DELETE_ASYNC_THRESHOLD", default=1000, cast=int)
+
+# Jobs running without saving progress for `JOB_HEARTBEAT_TIMEOUT` seconds were left by a
+# stopped worker, they are run again up to `JOB_MAX_ATTEMPTS` times then failed. The timeout
+# should be well above the time a job takes between two progress saves, eg: a bulk delete chunk
+JOB_HEARTBEAT_TIMEOUT = config("JOB_HEARTBEAT_TIMEOUT", default=300, cast=int)
+JOB_MAX_ATTEMPTS = config("JOB_MAX_ATTEMPTS", default=3, cast=int)
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60) if DEBUG else timedelta(minutes=15),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=21),
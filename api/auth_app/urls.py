@@ -15,6 +15,7 @@ urlpatterns = [
     path('', include('organization.urls')),
     path('', include('tags.urls')),
     path('', include('tasks.urls')),
+    path('', include('jobs.urls')),
 ]
 
 
@@ -0,0 +1,19 @@
+from .models import Job
+from .serializers import JobSerializer
+
+
+def enqueue_bulk_delete(user, view_class, view_kwargs, ressource_ids) -> dict:
+    """Create a pending job deleting `ressource_ids` as `view_class` would for `user`,
+    see `BulkDeleteResourceMixin.run_bulk_delete_job`. Return the job data as returned
+    by the jobs endpoint"""
+    job = Job.objects.create(
+        kind=Job.Kind.BULK_DELETE,
+        created_by=user,
+        total_count=len(ressource_ids),
+        payload={
+            "view": f"{view_class.__module__}.{view_class.__qualname__}",
+            "kwargs": view_kwargs,
+            "ids": ressource_ids,
+        }
+    )
+    return JobSerializer(job).data
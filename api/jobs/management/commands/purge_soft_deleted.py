@@ -0,0 +1,53 @@
+import gzip
+
+from django.core.management.base import BaseCommand
+
+from jobs.purge import SoftDeletePurger
+
+
+class Command(BaseCommand):
+    help = (
+        "Hard delete rows soft deleted more than `SOFT_DELETE_RETENTION_DAYS` days ago, "
+        "meant to be scheduled, eg: daily with cron"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, help="Retention window in days, override the setting"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, help="Number of rows deleted per batch"
+        )
+        parser.add_argument(
+            "--sleep", type=float, help="Pause in seconds between batches"
+        )
+        parser.add_argument(
+            "--archive",
+            help="Write purged rows to this gzip compressed NDJSON file first, "
+            "appended to when it exists"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="Only report rows to purge"
+        )
+
+    def handle(self, *args, **options):
+        purger = SoftDeletePurger(
+            retention_days=options["days"],
+            batch_size=options["batch_size"],
+            sleep=options["sleep"],
+        )
+        if options["dry_run"]:
+            self.report("Rows to purge", purger.count())
+            return
+
+        if options["archive"]:
+            with gzip.open(options["archive"], "at", encoding="utf-8") as archive:
+                deleted = purger.purge(archive)
+        else:
+            deleted = purger.purge()
+        self.report("Purged rows", deleted)
+
+    def report(self, title, counts):
+        self.stdout.write(self.style.SUCCESS(f"{title}: {sum(counts.values())}"))
+        for label, count in sorted(counts.items()):
+            self.stdout.write(f"  {label}: {count}")
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from jobs.worker import job_worker
+
+
+class Command(BaseCommand):
+    help = "Run pending jobs, eg: large bulk deletions, polling for new ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once", action="store_true", help="Exit once no job is pending"
+        )
+        parser.add_argument(
+            "--sleep", type=float, default=2.0,
+            help="Seconds to wait before polling again when no job is pending"
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            count = job_worker.run_pending()
+            if count:
+                self.stdout.write(self.style.SUCCESS(f"{count} jobs run"))
+            if options["once"]:
+                return
+            time.sleep(options["sleep"])
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.db import models
+from django.db.models import Q
+from django.conf import settings
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from app_lib.ids import generate_id
+
+
+class JobQuerySet(models.QuerySet):
+    def claim_next(self):
+        """Mark the oldest pending job as running and return it, `None` when there
+        is no pending job. A job is claimed by a single worker"""
+        Status = self.model.Status
+        while True:
+            job = self.filter(status=Status.PENDING).order_by("created_at").first()
+            if job is None:
+                return None
+            now = timezone.now()
+            claimed = self.filter(pk=job.pk, status=Status.PENDING).update(
+                status=Status.RUNNING, started_at=now, heartbeat_at=now,
+                attempts=models.F("attempts") + 1
+            )
+            if claimed:
+                job.refresh_from_db()
+                return job
+
+    def reclaim_stale(self, timeout, max_attempts) -> tuple[int, int]:
+        """Jobs running without a heartbeat for `timeout` seconds were left by a worker
+        that stopped, run them again or fail them after `max_attempts` runs. Return the
+        number of jobs set back to pending and failed"""
+        Status = self.model.Status
+        now = timezone.now()
+        cutoff = now - timedelta(seconds=timeout)
+        stale = self.filter(status=Status.RUNNING).filter(
+            Q(heartbeat_at__lt=cutoff) | Q(heartbeat_at=None, started_at__lt=cutoff)
+        )
+        failed = stale.filter(attempts__gte=max_attempts).update(
+            status=Status.FAILED, finished_at=now,
+            error=f"The worker running the job stopped {max_attempts} times"
+        )
+        pending = stale.filter(attempts__lt=max_attempts).update(status=Status.PENDING)
+        return pending, failed
+
+
+class Job(models.Model):
+    """
+    Work done outside of the request by a worker, see `run_jobs` command. `payload`
+    holds what the job kind handler needs, see `jobs.worker`.
+    """
+    class Kind(models.TextChoices):
+        BULK_DELETE = "bulk_delete", _("Bulk delete")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE = "done", _("Done")
+        FAILED = "failed", _("Failed")
+
+    id = models.UUIDField(
+        primary_key=True, editable=False, default=generate_id
+    )
+    kind = models.CharField(
+        max_length=50, choices=Kind
+    )
+    status = models.CharField(
+        max_length=20, choices=Status, default=Status.PENDING
+    )
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="jobs"
+    )
+    payload = models.JSONField(default=dict)
+    # number of objects targeted, processed so far and not found
+    total_count = models.PositiveIntegerField(default=0)
+    deleted_count = models.PositiveIntegerField(default=0)
+    not_found_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name=_('created at')
+    )
+    started_at = models.DateTimeField(null=True, blank=True)
+    # set while running, see `JobQuerySet.reclaim_stale`
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = JobQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="job_status_created_idx")
+        ]
+
+    def save_progress(self, *fields):
+        """Save `fields` and tell workers the job is still running"""
+        self.heartbeat_at = timezone.now()
+        self.save(update_fields=[*fields, "heartbeat_at"])
+
+    def __str__(self):
+        return f"{self.kind} {self.id} ({self.status})"
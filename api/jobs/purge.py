@@ -0,0 +1,126 @@
+import json
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from app_lib.soft_deletion import is_soft_deletable
+
+
+class SoftDeletePurger:
+    """
+    Hard delete soft deleted rows once they are older than a retention window.
+
+    Rows are deleted `batch_size` at a time with a pause of `sleep` seconds between
+    batches, so the purge can run along the app traffic, eg: from a daily cron running
+    the `purge_soft_deleted` command. Models depending on others are purged first and
+    a row is only purged once no soft deletable row cascaded from it remains, those
+    rows keep their own retention window and are archived on their own. Rows without
+    soft deletion, like permissions rebuilt from roles, are cascaded.
+
+    Purged rows can be written to an archive first, one JSON object per line with the
+    model label and the row fields, many to many fields hold related objects ids.
+    """
+
+    def __init__(self, retention_days=None, batch_size=None, sleep=None):
+        self.retention_days = (
+            settings.SOFT_DELETE_RETENTION_DAYS if retention_days is None else retention_days
+        )
+        self.batch_size = batch_size or settings.SOFT_DELETE_PURGE_BATCH_SIZE
+        self.sleep = settings.SOFT_DELETE_PURGE_SLEEP if sleep is None else sleep
+
+    def get_cutoff(self):
+        return timezone.now() - timedelta(days=self.retention_days)
+
+    def get_models(self) -> list:
+        """Soft deletable models, the ones cascaded from a model come before it"""
+        soft_deletable = [model for model in apps.get_models() if is_soft_deletable(model)]
+        ordered = []
+
+        def add(model, path):
+            if model in ordered or model in path:
+                return
+            for relation in self.get_cascaded_relations(model):
+                add(relation.related_model, (*path, model))
+            ordered.append(model)
+
+        for model in soft_deletable:
+            add(model, ())
+        return ordered
+
+    def get_cascaded_relations(self, model):
+        """Relations of soft deletable models cascaded from `model`"""
+        return [
+            relation for relation in model._meta.related_objects
+            if (relation.one_to_many or relation.one_to_one) and relation.field.concrete
+            and relation.on_delete is models.CASCADE and is_soft_deletable(relation.related_model)
+        ]
+
+    def get_queryset(self, model, cutoff):
+        """`model` rows soft deleted before `cutoff` without rows cascaded from them left.
+        Rows soft deleted before `deleted_at` was set fall back to their last update date"""
+        queryset = model._base_manager.filter(is_deleted=True).filter(
+            Q(deleted_at__lt=cutoff) | Q(deleted_at=None, updated_at__lt=cutoff)
+        )
+        for relation in self.get_cascaded_relations(model):
+            field = relation.field
+            queryset = queryset.exclude(Exists(
+                relation.related_model._base_manager.filter(**{
+                    field.attname: OuterRef(field.target_field.attname)
+                })
+            ))
+        return queryset
+
+    def count(self) -> dict:
+        """Return the number of rows to purge per model label"""
+        cutoff = self.get_cutoff()
+        counts = {
+            model._meta.label: self.get_queryset(model, cutoff).count()
+            for model in self.get_models()
+        }
+        return {label: count for label, count in counts.items() if count}
+
+    def get_rows(self, model, pks):
+        pk_name = model._meta.pk.attname
+        rows = {
+            row[pk_name]: row for row in model._base_manager.filter(pk__in=pks).values()
+        }
+        for field in model._meta.many_to_many:
+            for row in rows.values():
+                row[field.name] = []
+            related_pks = model._base_manager.filter(
+                pk__in=pks, **{f"{field.name}__isnull": False}
+            ).values_list("pk", field.name)
+            for pk, related_pk in related_pks:
+                rows[pk][field.name].append(related_pk)
+        return rows.values()
+
+    def archive_rows(self, archive, model, pks):
+        for row in self.get_rows(model, pks):
+            archive.write(
+                json.dumps({"model": model._meta.label, "fields": row}, cls=DjangoJSONEncoder)
+            )
+            archive.write("\n")
+
+    def purge(self, archive=None) -> dict:
+        """Hard delete rows soft deleted before the retention window, writing them to
+        the `archive` text file when specified. Return the number of deleted rows
+        per model label, cascaded ones included"""
+        cutoff = self.get_cutoff()
+        deleted_counter = Counter()
+        for model in self.get_models():
+            queryset = self.get_queryset(model, cutoff).order_by()
+            while pks := list(queryset.values_list("pk", flat=True)[:self.batch_size]):
+                if archive is not None:
+                    self.archive_rows(archive, model, pks)
+                _, per_model = model._base_manager.filter(pk__in=pks).delete()
+                deleted_counter.update(per_model)
+                if self.sleep:
+                    time.sleep(self.sleep)
+        return dict(deleted_counter)
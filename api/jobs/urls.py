@@ -0,0 +1,10 @@
+from rest_framework.routers import DefaultRouter
+
+from .views import JobViewSet
+
+router = DefaultRouter()
+router.register(r'jobs', JobViewSet, 'jobs')
+
+urlpatterns = [
+    *router.urls
+]
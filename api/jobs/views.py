@@ -0,0 +1,23 @@
+from rest_framework import mixins
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.viewsets import GenericViewSet
+
+from .models import Job
+from .serializers import JobSerializer
+
+
+class JobViewSet(mixins.RetrieveModelMixin, GenericViewSet):
+    permission_classes = [IsAuthenticated]
+    serializer_class = JobSerializer
+    queryset = Job.objects.all()
+
+    def get_queryset(self):
+        return super().get_queryset().filter(created_by=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        # Get a job status.
+        Jobs are only visible to the user who started them. `deleted_count` and 
+        `not_found_count` are updated as the job progresses.
+        """
+        return super().retrieve(request, *args, **kwargs)
@@ -0,0 +1,69 @@
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import APIException
+
+from app_lib.permission_cache import perm_cache
+from .models import Job
+
+logger = logging.getLogger(__name__)
+
+
+def run_bulk_delete(job):
+    """`payload` holds the dotted path of the view the request was made to, see
+    `BulkDeleteResourceMixin.run_bulk_delete_job`"""
+    view_class = import_string(job.payload["view"])
+    view_class.run_bulk_delete_job(job)
+
+
+class JobWorker:
+    """Run pending jobs with the handler of their kind, one at a time"""
+
+    def __init__(self):
+        self.handlers = {}
+
+    def register(self, kind, handler):
+        self.handlers[kind] = handler
+
+    def run(self, job):
+        try:
+            # the worker process doesn't get other processes invalidations,
+            # permissions are read from the database
+            with perm_cache.bypass():
+                self.handlers[job.kind](job)
+        except APIException as error:
+            # same error the request would have got
+            job.status, job.error = Job.Status.FAILED, str(error.detail)
+        except Exception as error:
+            logger.exception("Job %s failed", job.id)
+            job.status, job.error = Job.Status.FAILED, repr(error)
+        else:
+            job.status = Job.Status.DONE
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error", "finished_at"])
+        return job
+
+    def run_next(self) -> Job | None:
+        """Run the oldest pending job, return it or `None` when there is none"""
+        job = Job.objects.claim_next()
+        return job and self.run(job)
+
+    def reclaim_stale(self):
+        """Run again or fail jobs left running by a worker that stopped"""
+        return Job.objects.reclaim_stale(
+            settings.JOB_HEARTBEAT_TIMEOUT, settings.JOB_MAX_ATTEMPTS
+        )
+
+    def run_pending(self) -> int:
+        """Run jobs until none is pending, return the number of jobs run"""
+        self.reclaim_stale()
+        count = 0
+        while self.run_next() is not None:
+            count += 1
+        return count
+
+
+job_worker = JobWorker()
+job_worker.register(Job.Kind.BULK_DELETE, run_bulk_delete)
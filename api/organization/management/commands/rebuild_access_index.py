@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from organization.models import OrgAccess
+
+
+class Command(BaseCommand):
+    help = "Rebuild the user to organization access index from organizations data"
+
+    def handle(self, *args, **options):
+        count = OrgAccess.objects.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Access index rebuilt with {count} entries")
+        )
@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-17 00:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_access_index(apps, schema_editor):
+    Organization = apps.get_model('organization', 'Organization')
+    OrgAccess = apps.get_model('organization', 'OrgAccess')
+    sources = [
+        ('creator', Organization.objects.exclude(created_by=None).values_list('id', 'created_by_id')),
+        ('owner', Organization.objects.exclude(owner=None).values_list('id', 'owner_id')),
+        ('full_access', Organization.can_be_accessed_by.through.objects.values_list('organization_id', 'appuser_id')),
+        ('member', Organization.members.through.objects.values_list('organization_id', 'appuser_id')),
+    ]
+    for level, pairs in sources:
+        OrgAccess.objects.bulk_create(
+            [OrgAccess(org_id=org_id, user_id=user_id, access_level=level) for org_id, user_id in pairs],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0013_alter_department_created_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrgAccess',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_level', models.CharField(choices=[('creator', 'Creator'), ('owner', 'Owner'), ('full_access', 'Full access'), ('member', 'Member')], max_length=20)),
+                ('org', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='accesses', to='organization.organization')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='org_accesses', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Organization access',
+                'verbose_name_plural': 'Organization accesses',
+                'indexes': [models.Index(fields=['user', 'access_level', 'org'], name='organizatio_user_id_6f93b5_idx')],
+                'unique_together': {('user', 'org', 'access_level')},
+            },
+        ),
+        migrations.RunPython(build_access_index, migrations.RunPython.noop),
+    ]
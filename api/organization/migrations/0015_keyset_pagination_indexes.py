@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-17 00:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0014_orgaccess'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='department',
+            name='organizatio_name_93bf26_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='organization',
+            name='organizatio_name_2d216c_idx',
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['name', 'id'], name='organizatio_name_c50aaa_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(fields=['created_at', 'id'], name='organizatio_created_123c7f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['name', 'id'], name='organizatio_name_d23906_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['created_at', 'id'], name='organizatio_created_6f8a86_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2 on 2026-10-17 01:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0016_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='department',
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name='organization',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='department',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['org', 'created_at'], name='depart_org_created_live_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='department',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name', 'org'), name='depart_name_org_live_uniq'),
+        ),
+        migrations.AddConstraint(
+            model_name='organization',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name', 'owner'), name='org_name_owner_live_uniq'),
+        ),
+    ]
@@ -1,12 +1,54 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from app_lib.models import AbstractBaseModel
+from app_lib.manager import DefaultManager, DefaultQueryset
 from app_lib.fn import get_diff_objs
 from app_lib.email import send_invitation_success_email
 
 
+class OrganizationQuerysetMixin:
+  """Keep the `OrgAccess` index and the permission cache in sync on bulk operations,
+  they don't send signals"""
+  access_fields = {"owner", "owner_id", "created_by", "created_by_id"}
+
+  def invalidate_perms(self, org_ids):
+    # To avoid circular imports error
+    from app_lib.permission_cache import perm_cache
+
+    for org_id in org_ids:
+      perm_cache.invalidate_org(org_id)
+
+  def bulk_create(self, objs, *args, **kwargs):
+    created = super().bulk_create(objs, *args, **kwargs)
+    OrgAccess.objects.sync_orgs(created)
+    # conflicting rows can be updated, see `update_conflicts`
+    self.invalidate_perms(org.id for org in created)
+    return created
+
+  def update(self, **kwargs):
+    if not self.access_fields.intersection(kwargs):
+      return super().update(**kwargs)
+
+    org_ids = list(self.values_list("id", flat=True))
+    count = super().update(**kwargs)
+    OrgAccess.objects.sync_orgs(
+      self.model.all_objects.filter(id__in=org_ids)
+    )
+    self.invalidate_perms(org_ids)
+    return count
+
+
+class OrganizationQueryset(OrganizationQuerysetMixin, DefaultQueryset):
+  """Deletions are soft deletions"""
+
+
+class AllOrganizationsQueryset(OrganizationQuerysetMixin, models.QuerySet):
+  """Soft deleted organizations included, deletions are hard deletions"""
+
+
 class Organization(AbstractBaseModel):
   name = models.CharField(
     _('organization name'), max_length=100
@@ -29,12 +71,23 @@ class Organization(AbstractBaseModel):
     related_name="user_orgs",
   )
 
+  objects = DefaultManager.from_queryset(OrganizationQueryset)()
+  all_objects = AllOrganizationsQueryset.as_manager()
+
   class Meta:
     verbose_name = _('Organization')
     verbose_name_plural = _('Organizations')
-    unique_together = ["name", "owner"]
+    constraints = [
+      # soft deleted organizations names can be reused
+      models.UniqueConstraint(
+        fields=['name', 'owner'], name='org_name_owner_live_uniq',
+        condition=Q(is_deleted=False)
+      ),
+    ]
     indexes = [
-      models.Index(fields=['name'])
+      # keyset pagination, see `DefaultCursorPagination`
+      models.Index(fields=['name', 'id']),
+      models.Index(fields=['created_at', 'id']),
     ]
 
   def __str__(self):
@@ -75,10 +128,134 @@ class Department(AbstractBaseModel):
   class Meta:
     verbose_name = _('Department')
     verbose_name_plural = _('Departments')
-    unique_together = ("name", "org")
+    constraints = [
+      # soft deleted departments names can be reused
+      models.UniqueConstraint(
+        fields=['name', 'org'], name='depart_name_org_live_uniq',
+        condition=Q(is_deleted=False)
+      ),
+    ]
+    indexes = [
+      # keyset pagination, see `DefaultCursorPagination`
+      models.Index(fields=['name', 'id']),
+      models.Index(fields=['created_at', 'id']),
+      # live rows access paths, see `DefaultManager`
+      models.Index(
+        fields=['org', 'created_at'], name='depart_org_created_live_idx',
+        condition=Q(is_deleted=False)
+      ),
+    ]
+
+  def __str__(self):
+    return f"{self.name}"
+
+
+class OrgAccessQuerySet(models.QuerySet):
+  def org_ids_for(self, user, levels=None):
+    """Return a subquery of organization ids `user` has access to through
+    one of `levels`, all levels are considered by default"""
+    queryset = self.filter(user=user)
+    if levels:
+      queryset = queryset.filter(access_level__in=levels)
+    return queryset.values("org_id")
+
+  def grant(self, level, pairs):
+    """Add `level` access for each `(org_id, user_id)` in `pairs`"""
+    return self.bulk_create(
+      [
+        self.model(org_id=org_id, user_id=user_id, access_level=level)
+        for org_id, user_id in pairs
+      ],
+      batch_size=1000,
+      ignore_conflicts=True
+    )
+
+  def sync_orgs(self, orgs):
+    """Sync `creator` and `owner` access levels with `orgs` current
+    `created_by` and `owner` values"""
+    orgs = list(orgs)
+    Level = self.model.Level
+    self.filter(
+      org__in=orgs, access_level__in=[Level.CREATOR, Level.OWNER]
+    ).delete()
+    self.grant(
+      Level.CREATOR,
+      [(org.id, org.created_by_id) for org in orgs if org.created_by_id]
+    )
+    self.grant(
+      Level.OWNER,
+      [(org.id, org.owner_id) for org in orgs if org.owner_id]
+    )
+
+  def rebuild(self):
+    """Rebuild the whole index from organizations data, return the number of entries"""
+    Level = self.model.Level
+    all_orgs = Organization.all_objects.all()
+    sources = [
+      (
+        Level.CREATOR,
+        all_orgs.exclude(created_by=None).values_list("id", "created_by_id")
+      ),
+      (
+        Level.OWNER,
+        all_orgs.exclude(owner=None).values_list("id", "owner_id")
+      ),
+      (
+        Level.FULL_ACCESS,
+        Organization.can_be_accessed_by.through.objects.values_list(
+          "organization_id", "appuser_id"
+        )
+      ),
+      (
+        Level.MEMBER,
+        Organization.members.through.objects.values_list(
+          "organization_id", "appuser_id"
+        )
+      ),
+    ]
+    with transaction.atomic():
+      self.all().delete()
+      for level, pairs in sources:
+        self.grant(level, pairs.iterator())
+    return self.count()
+
+
+class OrgAccess(models.Model):
+  """
+  Materialized index of users having access to an organization and how, kept in 
+  sync with organizations `created_by`, `owner`, `can_be_accessed_by` and `members`
+  by signals. Use `rebuild_access_index` command to rebuild it.
+  """
+  class Level(models.TextChoices):
+    CREATOR = "creator", _("Creator")
+    OWNER = "owner", _("Owner")
+    FULL_ACCESS = "full_access", _("Full access")
+    MEMBER = "member", _("Member")
+
+  # levels giving a full access over the organization ressources
+  FULL_ACCESS_LEVELS = [Level.CREATOR, Level.OWNER, Level.FULL_ACCESS]
+
+  user = models.ForeignKey(
+    settings.AUTH_USER_MODEL, on_delete=models.CASCADE,
+    related_name="org_accesses"
+  )
+  org = models.ForeignKey(
+    Organization, on_delete=models.CASCADE,
+    related_name="accesses"
+  )
+  access_level = models.CharField(
+    max_length=20, choices=Level
+  )
+
+  objects = OrgAccessQuerySet.as_manager()
+
+  class Meta:
+    verbose_name = _('Organization access')
+    verbose_name_plural = _('Organization accesses')
+    unique_together = ["user", "org", "access_level"]
     indexes = [
-      models.Index(fields=['name'])
+      models.Index(fields=['user', 'access_level', 'org'])
     ]
 
   def __str__(self):
-    return f"{self.name}"
\ No newline at end of file
+    return f"{self.user_id}_{self.org_id}_{self.access_level}"
@@ -0,0 +1,47 @@
+from django.db.models.signals import post_save, m2m_changed
+from django.dispatch import receiver
+
+from .models import Organization, OrgAccess
+
+
+@receiver(post_save, sender=Organization)
+def sync_org_access_on_save(sender, instance, update_fields=None, **kwargs):
+  # fields can be given by name or attname, eg: `owner_id`
+  owner_fields = {"owner", "owner_id", "created_by", "created_by_id"}
+  if update_fields and not owner_fields.intersection(update_fields):
+    return
+  OrgAccess.objects.sync_orgs([instance])
+
+
+def sync_org_access_on_m2m_change(level, instance, action, reverse, pk_set, **kwargs):
+  """Keep `level` access entries in sync with an organization users m2m field"""
+  if action == "post_add":
+    if reverse:
+      pairs = [(org_id, instance.id) for org_id in pk_set]
+    else:
+      pairs = [(instance.id, user_id) for user_id in pk_set]
+    OrgAccess.objects.grant(level, pairs)
+
+  elif action == "post_remove":
+    accesses = OrgAccess.objects.filter(access_level=level)
+    if reverse:
+      accesses.filter(user=instance, org_id__in=pk_set).delete()
+    else:
+      accesses.filter(org=instance, user_id__in=pk_set).delete()
+
+  elif action == "post_clear":
+    accesses = OrgAccess.objects.filter(access_level=level)
+    if reverse:
+      accesses.filter(user=instance).delete()
+    else:
+      accesses.filter(org=instance).delete()
+
+
+@receiver(m2m_changed, sender=Organization.members.through)
+def sync_member_access(sender, **kwargs):
+  sync_org_access_on_m2m_change(OrgAccess.Level.MEMBER, **kwargs)
+
+
+@receiver(m2m_changed, sender=Organization.can_be_accessed_by.through)
+def sync_full_access(sender, **kwargs):
+  sync_org_access_on_m2m_change(OrgAccess.Level.FULL_ACCESS, **kwargs)
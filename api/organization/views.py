@@ -1,6 +1,5 @@
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
-from django.db.models.query import Q
 from django.utils.translation import gettext_lazy as _
 from django.shortcuts import get_object_or_404
 
@@ -14,7 +13,7 @@ from .filters import (
     OrganizationDataFilter,
     DepartmentDataFilter,
 )
-from .models import Organization
+from .models import Organization, Department, OrgAccess
 from app_lib.read_only_serializers import (
     OrganizationSerializer,
     OrganizationDetailSerializer,
@@ -33,6 +32,7 @@ from app_lib.global_serializers import (
 )
 from app_lib.views import FullModelViewSet
 from app_lib.queryset import queryset_helpers
+from app_lib.visibility import VisibilityFilter
 from app_lib.authorization import auth_checker
 from app_lib.app_permssions import CAN_CREATE_DEPART
 from app_lib.decorators import schema_wrapper
@@ -68,12 +68,9 @@ class OrganizationViewset(FullModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return super().get_queryset().filter(
-            Q(created_by=user) |
-            Q(owner=user) |
-            Q(can_be_accessed_by=user) |
-            Q(members=user)
-        ).distinct()
+        return VisibilityFilter(Organization, user).in_orgs(
+            field_name="id"
+        ).filter(super().get_queryset())
     
     def get_object(self) -> Organization:
         return super().get_object()
@@ -181,18 +178,13 @@ class DepartmentViewset(FullModelViewSet):
     def get_queryset(self):
         org_id = self.kwargs["id"]
         user = self.request.user
-        queryset = super().get_queryset().filter(
-            Q(org__id=org_id),
-            (
-                Q(org__created_by=user) |
-                Q(org__owner=user) |
-                Q(org__can_be_accessed_by__in=[user]) |
-                Q(created_by=user) |
-                Q(can_be_accessed_by__in=[user]) |
-                Q(members=user)
-            )
-        ).distinct()
-        return queryset
+        return VisibilityFilter(Department, user).in_orgs(
+            OrgAccess.FULL_ACCESS_LEVELS
+        ).created_by().in_m2m(
+            "can_be_accessed_by"
+        ).in_m2m(
+            "members"
+        ).filter(super().get_queryset().filter(org__id=org_id))
 
     def get_related_org_data(self, org_id):
         user = self.request.user
@@ -1,6 +1,7 @@
-from django.db.models import Q
+from django.db.models import Q, F
 
 from app_lib.filter import BaseNameDescriptionDateDataFilter
+from app_lib.app_permssions import perm_registry
 from .models import Role
 
 class RoleDataFilter(BaseNameDescriptionDateDataFilter):
@@ -16,8 +17,16 @@ class RoleDataFilter(BaseNameDescriptionDateDataFilter):
         ]
     
     def search_through(self, queryset, name, value):
-        return queryset.filter(
-            self.get_default_search_queryset(value) |
-            Q(perms__contains=value) |
-            Q(perms__icontains=value)
-        )
\ No newline at end of file
+        # perms are stored as a mask, match roles having any perm
+        # whose label contains the searched value
+        matched_perms = [
+            perm for perm in perm_registry.all_list if value.lower() in perm
+        ]
+        perms_query = Q(pk__in=[])
+        if matched_perms:
+            queryset = queryset.alias(
+                matched_perms=F("perms").bitand(Role.dump_perms(matched_perms))
+            )
+            perms_query = ~Q(matched_perms=0)
+
+        return self.search_queryset(queryset, value, perms_query)
@@ -0,0 +1,76 @@
+# Generated by Django 5.2 on 2026-10-17 00:32
+
+from django.db import migrations, models
+
+
+# permission bits as of this migration, see `app_lib.app_permssions.PERMISSION_BITS`
+PERMISSION_BITS = {
+    'can_create_depart': 0,
+    'can_create_task': 1,
+    'can_create_tag': 2,
+    'can_change_ressources_owners': 3,
+}
+
+
+def perms_to_mask(apps, schema_editor):
+    for model_name in ('UserPermissions', 'Role'):
+        model = apps.get_model('perms', model_name)
+        objs = list(model.objects.only('id', 'perms'))
+        for obj in objs:
+            obj.perms_mask = 0
+            for perm in obj.perms.split(','):
+                bit = PERMISSION_BITS.get(perm.strip().lower())
+                if bit is not None:
+                    obj.perms_mask |= 1 << bit
+        model.objects.bulk_update(objs, ['perms_mask'], batch_size=1000)
+
+
+def mask_to_perms(apps, schema_editor):
+    for model_name in ('UserPermissions', 'Role'):
+        model = apps.get_model('perms', model_name)
+        objs = list(model.objects.only('id', 'perms_mask'))
+        for obj in objs:
+            obj.perms = ','.join(
+                perm for perm, bit in PERMISSION_BITS.items()
+                if obj.perms_mask & (1 << bit)
+            )
+        model.objects.bulk_update(objs, ['perms'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('perms', '0005_alter_role_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='role',
+            name='perms_mask',
+            field=models.BigIntegerField(default=0, verbose_name='Permissions'),
+        ),
+        migrations.AddField(
+            model_name='userpermissions',
+            name='perms_mask',
+            field=models.BigIntegerField(default=0, verbose_name='Permissions'),
+        ),
+        migrations.RunPython(perms_to_mask, mask_to_perms),
+        migrations.RemoveField(
+            model_name='role',
+            name='perms',
+        ),
+        migrations.RemoveField(
+            model_name='userpermissions',
+            name='perms',
+        ),
+        migrations.RenameField(
+            model_name='role',
+            old_name='perms_mask',
+            new_name='perms',
+        ),
+        migrations.RenameField(
+            model_name='userpermissions',
+            old_name='perms_mask',
+            new_name='perms',
+        ),
+    ]
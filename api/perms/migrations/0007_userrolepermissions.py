@@ -0,0 +1,49 @@
+# Generated by Django 5.2 on 2026-10-17 00:45
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def build_role_permissions(apps, schema_editor):
+    Role = apps.get_model('perms', 'Role')
+    UserRolePermissions = apps.get_model('perms', 'UserRolePermissions')
+    masks = {}
+    for user_id, org_id, perms in Role.users.through.objects.filter(
+        role__is_deleted=False
+    ).values_list('appuser_id', 'role__org_id', 'role__perms'):
+        masks[(user_id, org_id)] = masks.get((user_id, org_id), 0) | perms
+    UserRolePermissions.objects.bulk_create(
+        [
+            UserRolePermissions(user_id=user_id, org_id=org_id, perms=perms)
+            for (user_id, org_id), perms in masks.items() if perms
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0014_orgaccess'),
+        ('perms', '0006_perms_bitmask'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserRolePermissions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('perms', models.BigIntegerField(default=0, verbose_name='Permissions')),
+                ('org', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='users_role_permissions', to='organization.organization')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='role_permissions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'User role permissions',
+                'verbose_name_plural': 'Users role permissions',
+                'unique_together': {('user', 'org')},
+            },
+        ),
+        migrations.RunPython(build_role_permissions, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 00:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0015_keyset_pagination_indexes'),
+        ('perms', '0007_userrolepermissions'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='role',
+            name='perms_role_name_e2a9f6_idx',
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['name', 'id'], name='perms_role_name_d8b3b1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(fields=['created_at', 'id'], name='perms_role_created_a3fae9_idx'),
+        ),
+    ]
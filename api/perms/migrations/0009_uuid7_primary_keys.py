@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 01:40
+
+import app_lib.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('perms', '0008_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        # the default is only used by django, no database change
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='role',
+                    name='id',
+                    field=models.UUIDField(default=app_lib.ids.generate_id, editable=False, primary_key=True, serialize=False),
+                ),
+                migrations.AlterField(
+                    model_name='userpermissions',
+                    name='id',
+                    field=models.UUIDField(default=app_lib.ids.generate_id, editable=False, primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+    ]
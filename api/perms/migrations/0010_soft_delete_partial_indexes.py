@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 01:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0017_soft_delete_partial_indexes'),
+        ('perms', '0009_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='role',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='role',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['org', 'created_at'], name='role_org_created_live_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='role',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name', 'org'), name='role_name_org_live_uniq'),
+        ),
+    ]
@@ -1,5 +1,8 @@
+from collections import defaultdict
+
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from app_lib.models import AbstractBasePermissionModel
@@ -48,7 +51,114 @@ class Role(AbstractBasePermissionModel):
     class Meta:
         verbose_name = _("Role")
         verbose_name_plural = _("Roles")
-        unique_together = ("name", 'org')
+        constraints = [
+            # soft deleted roles names can be reused
+            models.UniqueConstraint(
+                fields=['name', 'org'], name='role_name_org_live_uniq',
+                condition=Q(is_deleted=False)
+            ),
+        ]
         indexes = [
-            models.Index(fields=['name'])
-        ]
\ No newline at end of file
+            # keyset pagination, see `DefaultCursorPagination`
+            models.Index(fields=['name', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            # live rows access paths, see `DefaultManager`
+            models.Index(
+                fields=['org', 'created_at'], name='role_org_created_live_idx',
+                condition=Q(is_deleted=False)
+            ),
+        ]
+
+    # fields role permissions of users are computed from, see `perms.signals`
+    users_perms_fields = ("perms", "org_id")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance.set_loaded_users_perms_fields()
+        return instance
+
+    def get_saved_users_perms_fields(self, update_fields=None) -> list:
+        """`users_perms_fields` written by a save with `update_fields`"""
+        if update_fields is None:
+            return list(self.users_perms_fields)
+        saved = {self._meta.get_field(name).attname for name in update_fields}
+        return [name for name in self.users_perms_fields if name in saved]
+
+    def set_loaded_users_perms_fields(self, update_fields=None):
+        """Keep values of `users_perms_fields` as saved, only the ones written when
+        `update_fields` is given. Deferred ones are left out"""
+        loaded = {} if update_fields is None else getattr(self, "_loaded_users_perms_fields", {})
+        self._loaded_users_perms_fields = {**loaded, **{
+            name: self.__dict__[name]
+            for name in self.get_saved_users_perms_fields(update_fields) if name in self.__dict__
+        }}
+
+    def get_changed_users_perms_fields(self, update_fields=None) -> dict:
+        """Values as saved of `users_perms_fields` written since, all of them when
+        they weren't loaded. Only the ones written when `update_fields` is given"""
+        loaded = getattr(self, "_loaded_users_perms_fields", {})
+        return {
+            name: loaded.get(name) for name in self.get_saved_users_perms_fields(update_fields)
+            if name not in loaded or loaded[name] != getattr(self, name)
+        }
+
+
+class UserRolePermissionsQuerySet(models.QuerySet):
+    def refresh_users(self, user_ids, org_ids=None):
+        """Recompute role permissions of users in `user_ids` in all their organizations,
+        or only in `org_ids` when given"""
+        user_ids = set(user_ids)
+        if not user_ids:
+            return
+
+        roles_users = Role.users.through.objects.filter(
+            appuser_id__in=user_ids, role__is_deleted=False
+        )
+        queryset = self.filter(user_id__in=user_ids)
+        if org_ids is not None:
+            roles_users = roles_users.filter(role__org_id__in=org_ids)
+            queryset = queryset.filter(org_id__in=org_ids)
+
+        masks = defaultdict(int)
+        for user_id, org_id, perms in roles_users.values_list(
+            "appuser_id", "role__org_id", "role__perms"
+        ):
+            masks[(user_id, org_id)] |= perms
+
+        with transaction.atomic():
+            queryset.delete()
+            self.bulk_create([
+                self.model(user_id=user_id, org_id=org_id, perms=perms)
+                for (user_id, org_id), perms in masks.items() if perms
+            ], batch_size=1000)
+
+
+class UserRolePermissions(models.Model):
+    """
+    Union of permissions a user has through roles in an organization, kept in sync
+    by signals on `Role` and `Role.users`. Users without role permissions in an org
+    don't have an entry.
+    """
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE,
+        related_name="role_permissions"
+    )
+    org = models.ForeignKey(
+        Organization, on_delete=models.CASCADE,
+        related_name="users_role_permissions"
+    )
+    perms = models.BigIntegerField(
+        _("Permissions"),
+        default=0,
+    )
+
+    objects = UserRolePermissionsQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("User role permissions")
+        verbose_name_plural = _("Users role permissions")
+        unique_together = ("user", "org")
+
+    def __str__(self):
+        return f"{self.user_id}_{self.org_id}"
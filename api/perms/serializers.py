@@ -2,7 +2,7 @@ from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
 
 from app_lib.queryset import queryset_helpers
-from app_lib.fields import ManyPrimaryKeyRelatedField
+from app_lib.fields import ManyPrimaryKeyRelatedField, PermissionListField
 from app_lib.authorization import auth_checker
 from .models import Role
 from app_lib.app_permssions import permissions_exist
@@ -26,8 +26,7 @@ class AddPermissionsSerializer(serializers.Serializer):
         queryset=queryset_helpers.get_user_queryset(),
         write_only=True
     )
-    perms = serializers.ListField(
-        child=serializers.CharField(),
+    perms = PermissionListField(
         required=True,
         allow_empty=False,
         write_only=True
@@ -85,6 +84,39 @@ class RemovePermissionsSerializer(AddPermissionsSerializer):
         return perms_tuple
 
 
+class CheckPermissionSerializer(serializers.Serializer):
+    # upper bound of orgs checked in one request
+    max_orgs = 100
+
+    orgs = serializers.ListField(
+        child=serializers.UUIDField(),
+        allow_empty=False,
+        max_length=max_orgs,
+    )
+    perm = serializers.CharField(required=True)
+
+    def validate_perm(self, perm):
+        exist, found, not_found = permissions_exist(perm)
+        if not exist:
+            raise serializers.ValidationError(
+                _("Unknown permission: {perms}").format(perms=", ".join(not_found))
+            )
+        return found[0]
+
+    def to_internal_value(self, data):
+        # orgs ids can be specified as repeated query params and/or comma separated
+        if hasattr(data, "getlist"):
+            data = {
+                "orgs": [
+                    org_id.strip() 
+                    for value in data.getlist("orgs") 
+                    for org_id in value.split(",") if org_id.strip()
+                ],
+                "perm": data.get("perm", serializers.empty),
+            }
+        return super().to_internal_value(data)
+
+
 class CreateRoleSerializer(RoleDetailSerializer):
     name = serializers.CharField(
         required=True,
@@ -96,8 +128,7 @@ class CreateRoleSerializer(RoleDetailSerializer):
         allow_blank=True,
         allow_null=True,
     )
-    perms = serializers.ListField(
-        child=serializers.CharField(),
+    perms = PermissionListField(
         required=False,
         allow_empty=True,
     )
@@ -180,8 +211,7 @@ class UpdateRoleSerializer(CreateRoleSerializer):
         required=True,
         allow_blank=True,
     )
-    perms = serializers.ListField(
-        child=serializers.CharField(),
+    perms = PermissionListField(
         required=True,
         allow_empty=True,
     )
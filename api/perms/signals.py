@@ -0,0 +1,136 @@
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+
+from app_lib.models import AbstractBaseModel
+from app_lib.authorization import auth_checker
+from app_lib.permission_cache import perm_cache
+from app_lib.soft_deletion import post_soft_delete
+from organization.models import Organization
+from .models import UserPermissions, Role, UserRolePermissions
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_decisions_on_write(sender, instance, **kwargs):
+    """Any write on our models can change owners, creators or permissions,
+    drop authorization decisions computed so far in the request"""
+    if isinstance(instance, AbstractBaseModel):
+        auth_checker.invalidate_cache()
+
+
+@receiver(m2m_changed)
+def invalidate_decisions_on_m2m_change(sender, instance, action, **kwargs):
+    if action.startswith("post_") and isinstance(instance, AbstractBaseModel):
+        auth_checker.invalidate_cache()
+
+
+@receiver(post_soft_delete)
+def invalidate_decisions_on_soft_delete(sender, **kwargs):
+    if issubclass(sender, AbstractBaseModel):
+        auth_checker.invalidate_cache()
+
+
+# ===== effective permissions cache =====
+@receiver(post_save, sender=UserPermissions)
+@receiver(post_delete, sender=UserPermissions)
+def invalidate_user_perms(sender, instance, **kwargs):
+    perm_cache.invalidate(instance.user_id, instance.org_id)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+def invalidate_org_perms(sender, instance, **kwargs):
+    org_id = instance.id if sender is Organization else instance.org_id
+    perm_cache.invalidate_org(org_id)
+
+
+@receiver(post_soft_delete, sender=UserPermissions)
+def invalidate_soft_deleted_user_perms(sender, queryset, **kwargs):
+    for user_id, org_id in queryset.values_list("user_id", "org_id"):
+        perm_cache.invalidate(user_id, org_id)
+
+
+@receiver(post_soft_delete, sender=Role)
+def invalidate_soft_deleted_roles(sender, queryset, **kwargs):
+    for org_id in set(queryset.values_list("org_id", flat=True)):
+        perm_cache.invalidate_org(org_id)
+
+
+@receiver(post_soft_delete, sender=Organization)
+def invalidate_soft_deleted_orgs(sender, queryset, **kwargs):
+    for org_id in queryset.values_list("id", flat=True):
+        perm_cache.invalidate_org(org_id)
+
+
+@receiver(m2m_changed, sender=Role.users.through)
+@receiver(m2m_changed, sender=Organization.can_be_accessed_by.through)
+def invalidate_perms_on_users_change(sender, instance, action, reverse, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if reverse:
+        # users side, `instance` is a user
+        perm_cache.invalidate_user(instance.id)
+    elif isinstance(instance, Role):
+        perm_cache.invalidate_org(instance.org_id)
+    else:
+        perm_cache.invalidate_org(instance.id)
+
+
+# ===== users role permissions =====
+def get_role_user_ids(role_ids):
+    return Role.users.through.objects.filter(
+        role_id__in=role_ids
+    ).values_list("appuser_id", flat=True)
+
+
+@receiver(post_save, sender=Role)
+def refresh_role_permissions_on_save(sender, instance, created, update_fields, **kwargs):
+    """Refresh the role users permissions in the role org, and in its previous org
+    when it changed. Skipped when neither its `perms` nor its org changed"""
+    # fields left out of `update_fields` weren't written, they are still changed
+    changed = instance.get_changed_users_perms_fields(update_fields)
+    instance.set_loaded_users_perms_fields(update_fields)
+    if created or not changed:
+        return
+
+    org_ids = {instance.org_id, changed.get("org_id") or instance.org_id}
+    UserRolePermissions.objects.refresh_users(get_role_user_ids([instance.id]), org_ids)
+
+
+@receiver(pre_delete, sender=Role)
+def collect_role_users_on_delete(sender, instance, **kwargs):
+    # users relations are deleted along with the role
+    instance._role_user_ids = list(get_role_user_ids([instance.id]))
+
+
+@receiver(post_delete, sender=Role)
+def refresh_role_permissions_on_delete(sender, instance, **kwargs):
+    UserRolePermissions.objects.refresh_users(getattr(instance, "_role_user_ids", []))
+
+
+@receiver(post_soft_delete, sender=Role)
+def refresh_role_permissions_on_soft_delete(sender, queryset, **kwargs):
+    UserRolePermissions.objects.refresh_users(
+        get_role_user_ids(queryset.values("id"))
+    )
+
+
+@receiver(m2m_changed, sender=Role.users.through)
+def refresh_role_permissions_on_users_change(
+    sender, instance, action, reverse, pk_set, **kwargs
+):
+    if reverse:
+        # users side, `instance` is a user
+        if action.startswith("post_"):
+            UserRolePermissions.objects.refresh_users([instance.id])
+        return
+
+    if action == "pre_clear":
+        instance._role_user_ids = list(get_role_user_ids([instance.id]))
+    elif action == "post_clear":
+        UserRolePermissions.objects.refresh_users(getattr(instance, "_role_user_ids", []))
+    elif action in ["post_add", "post_remove"]:
+        UserRolePermissions.objects.refresh_users(pk_set)
@@ -8,6 +8,7 @@ router.register(r"roles", RoleViewSet, "roles")
 
 urlpatterns = [
     path("", get_permissions_data, name="perm-list"),
+    path("check/", check_permission, name="check-perms"),
     path("add/", AddPermissionView.as_view(), name="add-perms"),
     path("remove/", RemovePermissionView.as_view(), name="remove-perms"),
     *router.urls,
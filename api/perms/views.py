@@ -4,18 +4,21 @@ from rest_framework.generics import GenericAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
-from django.db.models import Q
 
 from .serializers import (
     AddPermissionsSerializer,
     RemovePermissionsSerializer,
     CreateRoleSerializer,
-    UpdateRoleSerializer
+    UpdateRoleSerializer,
+    CheckPermissionSerializer
 )
 from .filters import RoleDataFilter
-from app_lib.app_permssions import get_perm_data, get_perm_list
+from .models import Role
+from app_lib.app_permssions import perm_registry
 from app_lib.views import FullModelViewSet
+from app_lib.authorization import auth_checker
 from app_lib.queryset import queryset_helpers
+from app_lib.visibility import VisibilityFilter
 from app_lib.permissions import (
     Can_Access_Org_Or_Obj, 
     Can_Access_Org_Depart_Or_Obj
@@ -25,7 +28,8 @@ from app_lib.read_only_serializers import (
     RoleDetailSerializer,
     PermDataSerializer,
     AddPermissionResponseSerializer,
-    RemovePermissionResponseSerializer
+    RemovePermissionResponseSerializer,
+    CheckPermissionResponseSerializer
 )
 from app_lib.decorators import schema_wrapper
 
@@ -37,7 +41,33 @@ def get_permissions_data(request):
     """
     # Retrieve all available permissions.
     """
-    return Response(get_perm_data(get_perm_list()))
+    return Response(list(perm_registry.data.values()))
+
+
+@schema_wrapper(
+    response_serializer=CheckPermissionResponseSerializer,
+    parameters=[CheckPermissionSerializer]
+)
+@api_view([HTTPMethod.GET])
+@permission_classes([IsAuthenticated])
+def check_permission(request):
+    """
+    # Check which organizations grant a permission to the authenticated user.
+
+    Organizations ids are specified with the `orgs` query parameter, repeated and/or comma separated, 
+    the permission label with `perm`. Unknown organizations are reported as not granted.
+    """
+    serializer = CheckPermissionSerializer(data=request.query_params)
+    serializer.is_valid(raise_exception=True)
+    perm = serializer.validated_data["perm"]
+    org_ids = list(dict.fromkeys(serializer.validated_data["orgs"]))
+
+    results = auth_checker.has_permission_many(request.user, org_ids, perm)
+    return Response({
+        "perm": perm,
+        "granted": [org_id for org_id, granted in results.items() if granted],
+        "not_granted": [org_id for org_id, granted in results.items() if not granted],
+    })
 
 
 class AddPermissionView(GenericAPIView):
@@ -115,12 +145,6 @@ class RoleViewSet(FullModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        queryset = super().get_queryset().filter(
-            Q(created_by=user) |
-            Q(can_be_accessed_by=user) |
-            Q(org__owner=user) | 
-            Q(org__created_by=user) | 
-            Q(org__can_be_accessed_by=user) |
-            Q(org__members=user)
-        ).distinct()
-        return queryset
\ No newline at end of file
+        return VisibilityFilter(Role, user).created_by().in_m2m(
+            "can_be_accessed_by"
+        ).in_orgs().filter(super().get_queryset())
\ No newline at end of file
@@ -0,0 +1,159 @@
+from django.conf import settings
+from django.db.models import Q, Value, F, Func, FloatField
+from django.db.models.functions import Coalesce
+from django.utils.module_loading import import_string
+
+from .documents import search_registry
+from .models import SearchDocument, SearchIndex
+
+
+class BaseSearchBackend:
+    """
+    Search objects of models registered in `search_registry` through their
+    `SearchDocument`. Subclasses define how documents are matched and ranked.
+    """
+    # name of the annotation holding results rank, lower is better
+    rank_annotation = "search_rank"
+    # values shorter than this can't be searched by the backend
+    min_length = 1
+    # number of documents written per query
+    batch_size = 1000
+
+    def can_search(self, model, value) -> bool:
+        return search_registry.is_registered(model) and len(value.strip()) >= self.min_length
+
+    def get_documents(self, model):
+        return SearchDocument.objects.filter(
+            content_type=search_registry.get_content_type(model)
+        )
+
+    def get_filter(self, model, value) -> Q:
+        """Return a filter matching `model` objects whose document matches `value`"""
+        raise NotImplementedError("`get_filter` should be implemented by subclasses")
+
+    def get_rank(self, model, value):
+        """Return an expression ranking `model` objects against `value`"""
+        return Value(0.0)
+
+    def search(self, queryset, value, extra_filter=None):
+        """Return `queryset` objects matching `value`, or `extra_filter` when specified,
+        annotated with their rank, see `rank_annotation`"""
+        model = queryset.model
+        query = self.get_filter(model, value)
+        if extra_filter is not None:
+            query |= extra_filter
+        return queryset.filter(query).annotate(**{
+            self.rank_annotation: Coalesce(
+                self.get_rank(model, value), Value(0.0), output_field=FloatField()
+            )
+        })
+
+    def index(self, objs):
+        """Create or update documents of `objs`"""
+        SearchDocument.objects.bulk_create(
+            [
+                SearchDocument(
+                    content_type=search_registry.get_content_type(type(obj)),
+                    object_id=search_registry.get_object_id(type(obj), obj.pk),
+                    body=search_registry.get_body(obj),
+                )
+                for obj in objs
+            ],
+            batch_size=self.batch_size,
+            update_conflicts=True,
+            unique_fields=["content_type", "object_id"],
+            update_fields=["body"],
+        )
+
+    def index_ids(self, model, ids):
+        """Index `model` objects with `ids`, soft deleted ones are removed"""
+        ids = list(ids)
+        objs = search_registry.get_queryset(model).filter(pk__in=ids, is_deleted=False)
+        self.index(objs)
+        self.remove(model, set(ids) - {obj.pk for obj in objs})
+
+    def remove(self, model, ids):
+        self.get_documents(model).filter(object_id__in=[
+            search_registry.get_object_id(model, pk) for pk in ids
+        ]).delete()
+
+    def rebuild(self) -> int:
+        """Rebuild every document, return the number of documents indexed"""
+        SearchDocument.objects.all().delete()
+        count = 0
+        for model in search_registry.get_models():
+            objs = search_registry.get_queryset(model).filter(is_deleted=False).order_by()
+            batch = []
+            for obj in objs.iterator(chunk_size=self.batch_size):
+                batch.append(obj)
+                if len(batch) == self.batch_size:
+                    self.index(batch)
+                    count, batch = count + len(batch), []
+            self.index(batch)
+            count += len(batch)
+        return count
+
+
+class FTS5Rank(Func):
+    """
+    bm25 rank of the document of the object with `pk` among documents matching
+    `match_query`. Matches are materialized once by SQLite, a correlated subquery
+    on `search_index` would run the full text query again for each row.
+    """
+    template = (
+        "(SELECT matches.rank FROM "
+        "(SELECT rowid, rank FROM {index} WHERE {index} MATCH %%s LIMIT -1) matches "
+        "INNER JOIN {documents} documents ON documents.id = matches.rowid "
+        "WHERE documents.content_type = %%s AND documents.object_id = %(expressions)s)"
+    )
+    output_field = FloatField()
+
+    def __init__(self, pk, match_query, content_type):
+        super().__init__(pk)
+        self.match_query = match_query
+        self.content_type = content_type
+
+    def as_sql(self, compiler, connection, **extra_context):
+        template = self.template.format(
+            index=connection.ops.quote_name(SearchIndex._meta.db_table),
+            documents=connection.ops.quote_name(SearchDocument._meta.db_table),
+        )
+        sql, params = super().as_sql(compiler, connection, template=template, **extra_context)
+        return sql, (self.match_query, self.content_type, *params)
+
+
+class DatabaseSearchBackend(BaseSearchBackend):
+    """Portable backend matching documents containing the searched value, unranked"""
+
+    def get_filter(self, model, value) -> Q:
+        return Q(pk__in=self.get_documents(model).filter(
+            body__icontains=value
+        ).values("object_id"))
+
+
+class FTS5SearchBackend(BaseSearchBackend):
+    """
+    SQLite backend matching documents through the `search_index` FTS5 table, its
+    trigram tokenizer matches any substring of at least 3 characters, case
+    insensitively, results are ranked with bm25.
+    """
+    min_length = 3
+
+    def get_match_query(self, value):
+        # searched as a single phrase, quotes escaped
+        return '"%s"' % value.strip().replace('"', '""')
+
+    def get_filter(self, model, value) -> Q:
+        return Q(pk__in=self.get_documents(model).filter(
+            id__in=SearchIndex.objects.filter(
+                body__match=self.get_match_query(value)
+            ).values("rowid")
+        ).values("object_id"))
+
+    def get_rank(self, model, value):
+        return FTS5Rank(
+            F("pk"), self.get_match_query(value), search_registry.get_content_type(model)
+        )
+
+
+search_backend = import_string(settings.SEARCH_BACKEND)()
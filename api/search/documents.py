@@ -0,0 +1,48 @@
+from django.db import connection
+
+from organization.models import Organization, Department
+from perms.models import Role
+from tags.models import Tag
+from tasks.models import Task
+
+
+class SearchRegistry:
+    """
+    Models indexed for search, with the free text fields their search document is
+    built from. Fields searched exactly, eg: tasks status, are filtered by the filter
+    sets, see `BaseNameDescriptionDateDataFilter.search_queryset`.
+    """
+
+    def __init__(self):
+        self._models = {}
+
+    def register(self, model, fields):
+        self._models[model] = tuple(fields)
+
+    def is_registered(self, model):
+        return model in self._models
+
+    def get_models(self):
+        return list(self._models)
+
+    def get_content_type(self, model):
+        return model._meta.label_lower
+
+    def get_object_id(self, model, pk):
+        return str(model._meta.pk.get_db_prep_value(pk, connection))
+
+    def get_queryset(self, model):
+        """Return `model` objects loading what their documents are built from"""
+        return model._base_manager.only(*self._models[model])
+
+    def get_body(self, obj):
+        values = [getattr(obj, name) for name in self._models[type(obj)]]
+        return "\n".join(str(value) for value in values if value)
+
+
+search_registry = SearchRegistry()
+search_registry.register(Organization, ["name", "description"])
+search_registry.register(Department, ["name", "description"])
+search_registry.register(Role, ["name", "description"])
+search_registry.register(Tag, ["name", "description"])
+search_registry.register(Task, ["name", "description"])
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from search.backends import search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild search documents of every searchable object"
+
+    def handle(self, *args, **options):
+        count = search_backend.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS(f"Search index rebuilt with {count} documents")
+        )
@@ -0,0 +1,90 @@
+# Generated by Django 5.2 on 2026-10-17 01:02
+
+import search.models
+from django.db import migrations, models
+
+
+FTS5_INDEX_SQL = [
+    """
+    CREATE VIRTUAL TABLE search_index USING fts5(
+        body, content='search_searchdocument', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_ai AFTER INSERT ON search_searchdocument BEGIN
+        INSERT INTO search_index(rowid, body) VALUES (new.id, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_ad AFTER DELETE ON search_searchdocument BEGIN
+        INSERT INTO search_index(search_index, rowid, body) VALUES ('delete', old.id, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER search_searchdocument_au AFTER UPDATE ON search_searchdocument BEGIN
+        INSERT INTO search_index(search_index, rowid, body) VALUES ('delete', old.id, old.body);
+        INSERT INTO search_index(rowid, body) VALUES (new.id, new.body);
+    END
+    """,
+]
+
+DROP_FTS5_INDEX_SQL = [
+    "DROP TRIGGER IF EXISTS search_searchdocument_ai",
+    "DROP TRIGGER IF EXISTS search_searchdocument_ad",
+    "DROP TRIGGER IF EXISTS search_searchdocument_au",
+    "DROP TABLE IF EXISTS search_index",
+]
+
+
+def create_fts5_index(apps, schema_editor):
+    # the full text index is SQLite specific, other databases use
+    # `search.backends.DatabaseSearchBackend`
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in FTS5_INDEX_SQL:
+        schema_editor.execute(sql)
+
+
+def drop_fts5_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    for sql in DROP_FTS5_INDEX_SQL:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchIndex',
+            fields=[
+                ('rowid', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('body', search.models.FullTextField()),
+                ('rank', models.FloatField()),
+            ],
+            options={
+                'db_table': 'search_index',
+                'managed': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_type', models.CharField(help_text='Label of the object model, eg: `tasks.task`', max_length=100)),
+                ('object_id', models.CharField(help_text='Object primary key, as stored in the database', max_length=64)),
+                ('body', models.TextField()),
+            ],
+            options={
+                'verbose_name': 'Search document',
+                'verbose_name_plural': 'Search documents',
+                'unique_together': {('content_type', 'object_id')},
+            },
+        ),
+        migrations.RunPython(create_fts5_index, drop_fts5_index),
+    ]
@@ -0,0 +1,59 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+# historical models of `search_registry` models with the fields their documents are
+# built from, as when this migration was written
+INDEXED_MODELS = [
+    ("organization", "Organization", ["name", "description"]),
+    ("organization", "Department", ["name", "description"]),
+    ("perms", "Role", ["name", "description"]),
+    ("tags", "Tag", ["name", "description"]),
+    ("tasks", "Task", ["name", "description"]),
+]
+
+
+def index_existing_rows(apps, schema_editor):
+    """Index rows created before search documents existed, as `rebuild_search_index`"""
+    SearchDocument = apps.get_model("search", "SearchDocument")
+    connection = schema_editor.connection
+    for app_label, model_name, fields in INDEXED_MODELS:
+        model = apps.get_model(app_label, model_name)
+        rows = model._base_manager.filter(is_deleted=False).order_by().values_list(
+            "pk", *fields
+        )
+        batch = []
+        for pk, *values in rows.iterator(chunk_size=BATCH_SIZE):
+            batch.append(SearchDocument(
+                content_type=model._meta.label_lower,
+                object_id=str(model._meta.pk.get_db_prep_value(pk, connection)),
+                body="\n".join(str(value) for value in values if value),
+            ))
+            if len(batch) == BATCH_SIZE:
+                write_documents(SearchDocument, batch)
+                batch = []
+        write_documents(SearchDocument, batch)
+
+
+def write_documents(SearchDocument, documents):
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["body"],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0001_initial'),
+        ('organization', '0017_soft_delete_partial_indexes'),
+        ('perms', '0010_soft_delete_partial_indexes'),
+        ('tags', '0005_soft_delete_partial_indexes'),
+        ('tasks', '0011_task_priority_rank'),
+    ]
+
+    operations = [
+        migrations.RunPython(index_existing_rows, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def reindex_tasks(apps, schema_editor):
+    """Task documents only hold their name and description, priority, status and tags
+    names are searched exactly, see `TaskDataFilter.get_exact_search_queryset`"""
+    Task = apps.get_model("tasks", "Task")
+    SearchDocument = apps.get_model("search", "SearchDocument")
+    connection = schema_editor.connection
+    tasks = Task._base_manager.filter(is_deleted=False).order_by().values_list(
+        "pk", "name", "description"
+    )
+    batch = []
+    for pk, *values in tasks.iterator(chunk_size=BATCH_SIZE):
+        batch.append(SearchDocument(
+            content_type="tasks.task",
+            object_id=str(Task._meta.pk.get_db_prep_value(pk, connection)),
+            body="\n".join(str(value) for value in values if value),
+        ))
+        if len(batch) == BATCH_SIZE:
+            write_documents(SearchDocument, batch)
+            batch = []
+    write_documents(SearchDocument, batch)
+
+
+def write_documents(SearchDocument, documents):
+    SearchDocument.objects.bulk_create(
+        documents,
+        update_conflicts=True,
+        unique_fields=["content_type", "object_id"],
+        update_fields=["body"],
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('search', '0002_index_existing_rows'),
+        ('tasks', '0012_task_priority_due_nulls_last'),
+    ]
+
+    operations = [
+        migrations.RunPython(reindex_tasks, migrations.RunPython.noop),
+    ]
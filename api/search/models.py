@@ -0,0 +1,52 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchDocument(models.Model):
+    """Searchable text of an object, see `search.documents`"""
+    content_type = models.CharField(
+        max_length=100,
+        help_text=_("Label of the object model, eg: `tasks.task`")
+    )
+    object_id = models.CharField(
+        max_length=64,
+        help_text=_("Object primary key, as stored in the database")
+    )
+    body = models.TextField()
+
+    class Meta:
+        verbose_name = _("Search document")
+        verbose_name_plural = _("Search documents")
+        unique_together = ("content_type", "object_id")
+
+    def __str__(self):
+        return f"{self.content_type}_{self.object_id}"
+
+
+class FullTextField(models.TextField):
+    """Column of a full text index, supports the `match` lookup"""
+
+
+@FullTextField.register_lookup
+class Match(models.Lookup):
+    lookup_name = "match"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} MATCH {rhs}", lhs_params + rhs_params
+
+
+class SearchIndex(models.Model):
+    """
+    SQLite FTS5 full text index over `SearchDocument.body`, kept in sync by triggers,
+    only exists on SQLite, see `search.backends.FTS5SearchBackend`
+    """
+    rowid = models.BigIntegerField(primary_key=True)
+    body = FullTextField()
+    # bm25 score of the row for the current full text query, lower is better
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "search_index"
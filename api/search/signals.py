@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from app_lib.soft_deletion import post_soft_delete
+from .backends import search_backend
+from .documents import search_registry
+
+
+@receiver(post_save)
+def index_saved_object(sender, instance, **kwargs):
+    if search_registry.is_registered(sender):
+        search_backend.index_ids(sender, [instance.pk])
+
+
+@receiver(post_delete)
+def remove_deleted_object(sender, instance, **kwargs):
+    if search_registry.is_registered(sender):
+        search_backend.remove(sender, [instance.pk])
+
+
+@receiver(post_soft_delete)
+def remove_soft_deleted_objects(sender, queryset, **kwargs):
+    if search_registry.is_registered(sender):
+        search_backend.remove(sender, queryset.values_list("pk", flat=True))
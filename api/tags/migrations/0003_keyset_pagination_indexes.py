@@ -0,0 +1,28 @@
+# Generated by Django 5.2 on 2026-10-17 00:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0015_keyset_pagination_indexes'),
+        ('tags', '0002_alter_tag_created_at_tag_tags_tag_name_3fbe74_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='tag',
+            name='tags_tag_name_3fbe74_idx',
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['name', 'id'], name='tags_tag_name_ecc97a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='tag',
+            index=models.Index(fields=['created_at', 'id'], name='tags_tag_created_8d008b_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from app_lib.models import AbstractBaseModel
 from django.db import models
+from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
 
 from organization.models import Organization
@@ -25,9 +26,22 @@ class Tag(AbstractBaseModel):
     )
 
     class Meta:
-        unique_together = ('name', 'org')
+        constraints = [
+            # soft deleted tags names can be reused
+            models.UniqueConstraint(
+                fields=['name', 'org'], name='tag_name_org_live_uniq',
+                condition=Q(is_deleted=False)
+            ),
+        ]
         indexes = [
-            models.Index(fields=['name'])
+            # keyset pagination, see `DefaultCursorPagination`
+            models.Index(fields=['name', 'id']),
+            models.Index(fields=['created_at', 'id']),
+            # live rows access paths, see `DefaultManager`
+            models.Index(
+                fields=['org', 'created_at'], name='tag_org_created_live_idx',
+                condition=Q(is_deleted=False)
+            ),
         ]
 
     def __str__(self):
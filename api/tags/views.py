@@ -1,12 +1,13 @@
-from django.db.models import Q
 from rest_framework.permissions import IsAuthenticated
 
 from app_lib.views import FullModelViewSet
 from app_lib.queryset import queryset_helpers
+from app_lib.visibility import VisibilityFilter
 from app_lib.permissions import (
     Can_Access_Org_Depart_Or_Obj
 )
 from .filters import TagDataFilter
+from .models import Tag
 from .serializers import (
     CreateTagSerializer,
     UpdateTagSerializer
@@ -27,14 +28,9 @@ class TagViewSet(FullModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
-        return super().get_queryset().filter(
-            Q(created_by=user) |
-            Q(can_be_accessed_by=user) |
-            Q(org__created_by=user) |
-            Q(org__owner=user) |
-            Q(org__can_be_accessed_by=user) |
-            Q(org__members=user)
-        ).distinct()
+        return VisibilityFilter(Tag, user).created_by().in_m2m(
+            "can_be_accessed_by"
+        ).in_orgs().filter(super().get_queryset())
     
     def get_serializer_class(self):
         if self.action == self.retrieve_view_name:
@@ -34,12 +34,25 @@ class  TaskDataFilter(BaseFilter):
         field_name="tags"
     )
 
-    def search_through(self, queryset, name, value):
-        return queryset.filter(
-            self.get_default_search_queryset(value) |
+    def get_exact_search_queryset(self, value):
+        """Priority, status and tags names only match the whole searched value"""
+        return (
             Q(priority__iexact=value) |
             Q(status__iexact=value) |
-            Q(tags__name__in=[value])
+            Q(pk__in=Task.tags.through.objects.filter(
+                tag__name=value
+            ).values("task_id"))
+        )
+
+    def get_default_search_queryset(self, value):
+        return (
+            super().get_default_search_queryset(value) |
+            self.get_exact_search_queryset(value)
+        )
+
+    def search_through(self, queryset, name, value):
+        return self.search_queryset(
+            queryset, value, extra_filter=self.get_exact_search_queryset(value)
         )
     
     class Meta(BaseFilter.Meta):
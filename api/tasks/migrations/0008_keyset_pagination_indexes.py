@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 00:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0015_keyset_pagination_indexes'),
+        ('tags', '0003_keyset_pagination_indexes'),
+        ('tasks', '0007_alter_task_created_at_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['name', 'id'], name='tasks_task_name_3150f0_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['created_at', 'id'], name='tasks_task_created_5b4d0b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['status', 'id'], name='tasks_task_status_2add5e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['priority', 'id'], name='tasks_task_priorit_dd2809_idx'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2 on 2026-10-17 01:46
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0017_soft_delete_partial_indexes'),
+        ('tags', '0005_soft_delete_partial_indexes'),
+        ('tasks', '0009_uuid7_primary_keys'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='task',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['org', 'created_at'], name='task_org_created_live_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['depart'], name='task_depart_live_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='task',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_deleted', False)), fields=('name', 'org'), name='task_name_org_live_uniq'),
+        ),
+    ]
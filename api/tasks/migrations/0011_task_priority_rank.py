@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-17 01:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0017_soft_delete_partial_indexes'),
+        ('tags', '0005_soft_delete_partial_indexes'),
+        ('tasks', '0010_soft_delete_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='priority_rank',
+            field=models.GeneratedField(db_persist=True, expression=models.Case(models.When(priority='low', then=models.Value(1)), models.When(priority='medium', then=models.Value(2)), models.When(priority='high', then=models.Value(3)), models.When(priority='critical', then=models.Value(4)), default=models.Value(0)), help_text='Rank of the priority, computed by the database', output_field=models.PositiveSmallIntegerField()),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('is_deleted', False)), fields=['org', 'priority_rank', 'due_date', 'id'], name='task_org_priority_due_idx'),
+        ),
+    ]
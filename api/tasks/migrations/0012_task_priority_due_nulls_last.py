@@ -0,0 +1,29 @@
+# Generated by Django 5.2 on 2026-10-17 02:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('organization', '0017_soft_delete_partial_indexes'),
+        ('tags', '0005_soft_delete_partial_indexes'),
+        ('tasks', '0011_task_priority_rank'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='tasks_task_priorit_dd2809_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_org_priority_due_idx',
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(models.F('org'), models.OrderBy(models.F('priority_rank'), descending=True), models.ExpressionWrapper(models.Q(('due_date__isnull', True)), output_field=models.BooleanField()), models.F('due_date'), models.F('id'), condition=models.Q(('is_deleted', False)), name='task_org_priority_due_idx'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from app_lib.models import AbstractBaseModel
 from django.db import models
+from django.db.models import Q, Case, When, Value, F, ExpressionWrapper
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
@@ -21,6 +22,14 @@ class Task(AbstractBaseModel):
         COMPLETED = "completed", _("Completed")
         CANCELLED = "cancelled", _("Cancelled")
 
+    # sort key of priorities, higher is more urgent
+    PRIORITY_RANKS = {
+        Priority.LOW: 1,
+        Priority.MEDIUM: 2,
+        Priority.HIGH: 3,
+        Priority.CRITICAL: 4,
+    }
+
     name = models.CharField(
         max_length=255, 
         help_text=_("Name of the task"), 
@@ -52,6 +61,15 @@ class Task(AbstractBaseModel):
         help_text=_("Priority level of the task"), 
         verbose_name=_("Priority")
     )
+    priority_rank = models.GeneratedField(
+        expression=Case(
+            *[When(priority=priority, then=Value(rank)) for priority, rank in PRIORITY_RANKS.items()],
+            default=Value(0),
+        ),
+        output_field=models.PositiveSmallIntegerField(),
+        db_persist=True,
+        help_text=_("Rank of the priority, computed by the database"),
+    )
     status = models.CharField(
         max_length=50,
         choices=Status,
@@ -96,12 +114,40 @@ class Task(AbstractBaseModel):
     )
     
     class Meta:
-        unique_together = ('name', 'org')
+        constraints = [
+            # soft deleted tasks names can be reused
+            models.UniqueConstraint(
+                fields=["name", "org"], name="task_name_org_live_uniq",
+                condition=Q(is_deleted=False)
+            ),
+        ]
         indexes = [
             models.Index(fields=[
                 "name", "priority", "status", "due_date",
                 "estimated_duration", "actual_duration"
-            ])
+            ]),
+            # keyset pagination, see `DefaultCursorPagination`
+            models.Index(fields=["name", "id"]),
+            models.Index(fields=["created_at", "id"]),
+            models.Index(fields=["status", "id"]),
+            # live rows access paths, see `DefaultManager`
+            models.Index(
+                fields=["org", "created_at"], name="task_org_created_live_idx",
+                condition=Q(is_deleted=False)
+            ),
+            models.Index(
+                fields=["depart"], name="task_depart_live_idx",
+                condition=Q(is_deleted=False)
+            ),
+            # `ordering=-priority` in an org, due dates ascending with nulls last, see
+            # `TaskViewSet.ordering_aliases` and `DefaultCursorPagination.get_sort_keys`
+            models.Index(
+                F("org"), F("priority_rank").desc(),
+                ExpressionWrapper(Q(due_date__isnull=True), output_field=models.BooleanField()),
+                F("due_date"), F("id"),
+                name="task_org_priority_due_idx",
+                condition=Q(is_deleted=False)
+            ),
         ]
 
     def __str__(self):
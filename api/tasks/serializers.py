@@ -1,8 +1,16 @@
+from collections import defaultdict
+
 from rest_framework import serializers
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from .models import Task
-from organization.models import Organization
+from organization.models import Organization, Department, OrgAccess
+from tags.models import Tag
+from user.models import AppUser as User
+from search.backends import search_backend
+from app_lib.email import send_invitation_success_email
 from app_lib.queryset import queryset_helpers
 from app_lib.authorization import auth_checker
 from app_lib.fields import (
@@ -447,4 +455,531 @@ class UpdateTaskStatusSerializer(TaskSerializer):
         error_messages={
             'invalid_choice': _("Invalid status choice."),
         }
-    )
\ No newline at end of file
+    )
+
+
+class BulkTaskListSerializer(serializers.ListSerializer):
+    """
+    Base of tasks bulk operations.
+
+    Items fields are validated first, then items passing it are validated together
+    by `validate_items`. Errors are reported by item index. Departments, tags and
+    users referenced by items are read with one query each, orgs owners access over
+    assigned users is checked with one query per owner, see `get_references`.
+    """
+    batch_size = 1000
+
+    def run_child_validation(self, data):
+        validated = super().run_child_validation(data)
+        self.valid_items.append(validated)
+        return validated
+
+    def to_internal_value(self, data):
+        # items passing fields validation, in order, see `run_child_validation`
+        self.valid_items = []
+        try:
+            items = super().to_internal_value(data)
+            errors = [{} for _ in items]
+        except serializers.ValidationError as exc:
+            if not isinstance(exc.detail, list):
+                raise
+            items, errors = self.valid_items, exc.detail
+
+        valid_indexes = [index for index, item_errors in enumerate(errors) if not item_errors]
+        for index, item_errors in zip(valid_indexes, self.validate_items(items)):
+            errors[index] = item_errors
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return items
+
+    def validate_items(self, items) -> list:
+        """Return errors of each item in `items`"""
+        return [{} for _ in items]
+
+    def get_denied_assignees(self, owners) -> set:
+        """`owners` maps org owner ids to ids of users assigned to tasks of their orgs,
+        return `(owner_id, user_id)` pairs of users the owner has no full access over,
+        with one query per owner, see `AuthorizationChecker.get_inaccessible_ids`"""
+        owner_objs = User._base_manager.only("id").in_bulk(owners)
+        return {
+            (owner_id, user_id)
+            for owner_id, user_ids in owners.items()
+            for user_id in auth_checker.get_inaccessible_ids(
+                User, user_ids, owner_objs[owner_id]
+            )
+        }
+
+    def get_references(self, items, owner_ids) -> dict:
+        """Read departments, tags and users referenced by `items`, `owner_ids` holds the
+        owner id of each item task org, `None` when the org is unknown"""
+        users = set(User.objects.filter(
+            id__in={user_id for item in items for user_id in item.get("assigned_to", [])}
+        ).values_list("id", flat=True))
+        owners = defaultdict(set)
+        for item, owner_id in zip(items, owner_ids):
+            if owner_id is not None:
+                owners[owner_id].update(users.intersection(item.get("assigned_to", [])))
+        return {
+            "departs": dict(Department.objects.filter(
+                id__in={item["depart"] for item in items if item.get("depart")}
+            ).values_list("id", "org_id")),
+            "tags": dict(Tag.objects.filter(
+                id__in={tag_id for item in items for tag_id in item.get("tags", [])}
+            ).values_list("id", "org_id")),
+            "users": users,
+            "denied_assignees": self.get_denied_assignees(owners),
+        }
+
+    def get_references_errors(self, item, org_id, owner_id, references) -> dict:
+        """Return errors of `item` department, tags and assigned users for a task
+        in `org_id` org, owned by `owner_id`"""
+        errors = {}
+        departs, tags, users = references["departs"], references["tags"], references["users"]
+
+        depart = item.get("depart")
+        if depart and depart not in departs:
+            errors["depart"] = [_("The specified department does not exist.")]
+        elif depart and departs[depart] != org_id:
+            errors["depart"] = [
+                _("The department must belong to the same organization as the task.")
+            ]
+
+        item_tags = item.get("tags", [])
+        if any(tag_id not in tags for tag_id in item_tags):
+            errors["tags"] = [_("One or more specified tags do not exist.")]
+        elif any(tags[tag_id] != org_id for tag_id in item_tags):
+            errors["tags"] = [
+                _("All tags must belong to the same organization as the task.")
+            ]
+
+        assigned_to = item.get("assigned_to", [])
+        missing = [user_id for user_id in assigned_to if user_id not in users]
+        if missing:
+            errors["assigned_to"] = [
+                _('Invalid value "%(pk)s" - object does not exist.') % {"pk": missing[0]}
+            ]
+        elif any(
+            (owner_id, user_id) in references["denied_assignees"] for user_id in assigned_to
+        ):
+            errors["assigned_to"] = [
+                _("The organization owner must have full access to the assigned users.")
+            ]
+        return errors
+
+    def add_org_members(self, pairs):
+        """Bulk version of `check_and_update_org_members`, `pairs` holds
+        `(org_id, user_id)` tuples, users are added to orgs members when they aren't yet"""
+        if not pairs:
+            return
+
+        OrgMembers = Organization.members.through
+        existing = set(OrgMembers.objects.filter(
+            organization_id__in={org_id for org_id, user_id in pairs},
+            appuser_id__in={user_id for org_id, user_id in pairs},
+        ).values_list("organization_id", "appuser_id"))
+        new_pairs = set(pairs) - existing
+        if not new_pairs:
+            return
+
+        OrgMembers.objects.bulk_create([
+            OrgMembers(organization_id=org_id, appuser_id=user_id)
+            for org_id, user_id in new_pairs
+        ], batch_size=self.batch_size)
+        OrgAccess.objects.grant(OrgAccess.Level.MEMBER, new_pairs)
+
+        orgs = Organization.objects.only("id", "name").in_bulk(
+            {org_id for org_id, user_id in new_pairs}
+        )
+        new_users = User.objects.in_bulk({user_id for org_id, user_id in new_pairs})
+        # emails are only sent once members are saved, a mail failure can't roll them back
+        transaction.on_commit(lambda: self.send_invitation_emails(orgs, new_users, new_pairs))
+
+    def send_invitation_emails(self, orgs, users, pairs):
+        for org_id, org in orgs.items():
+            send_invitation_success_email(
+                [users[user_id] for pair_org_id, user_id in pairs if pair_org_id == org_id],
+                org.name
+            )
+
+
+class BulkCreateTaskListSerializer(BulkTaskListSerializer):
+    """
+    Validate and create many tasks at once, see `BulkCreateTaskSerializer`.
+
+    Referenced orgs are read with a single query and names uniqueness is checked
+    with a single `IN` query. No task is created when an item is invalid. Tasks and
+    their many to many rows are inserted in bulk.
+    """
+
+    def get_allowed_org_ids(self, orgs) -> set:
+        """Ids of `orgs` the user has access to or can create tasks in, see
+        `CreateTaskSerializer.validate_org`"""
+        user = self.context['request'].user
+        denied = auth_checker.get_inaccessible_ids(Organization, orgs, user)
+        allowed = set(orgs).difference(denied)
+        if denied:
+            allowed.update(
+                org_id for org_id, has_perm in auth_checker.has_permission_many(
+                    user, list(denied), CAN_CREATE_TASK
+                ).items() if has_perm
+            )
+        return allowed
+
+    def validate_items(self, items) -> list:
+        orgs = Organization.objects.only("id", "owner_id").in_bulk(
+            {item["org"] for item in items}
+        )
+        allowed_org_ids = self.get_allowed_org_ids(orgs)
+        references = self.get_references(items, [
+            orgs[item["org"]].owner_id if item["org"] in orgs else None for item in items
+        ])
+        existing_names = set(Task.objects.filter(
+            org_id__in=orgs, name__in={item["name"] for item in items}
+        ).values_list("org_id", "name"))
+
+        errors = []
+        for item in items:
+            item_errors = {}
+            errors.append(item_errors)
+            org = orgs.get(item["org"])
+            if org is None:
+                item_errors["org"] = [_("The specified organization does not exist.")]
+                continue
+            if org.id not in allowed_org_ids:
+                item_errors["org"] = [
+                    _("You do not have permission to create tasks in this organization.")
+                ]
+                continue
+
+            key = (org.id, item["name"])
+            if key in existing_names:
+                item_errors["name"] = [
+                    _("A task with this name already exists in the organization.")
+                ]
+            existing_names.add(key)
+            item_errors.update(
+                self.get_references_errors(item, org.id, org.owner_id, references)
+            )
+        return errors
+
+    def create(self, validated_data):
+        user = self.context['request'].user
+        tasks = Task.objects.bulk_create([
+            Task(
+                created_by=user,
+                org_id=item["org"],
+                depart_id=item.get("depart"),
+                **{
+                    name: value for name, value in item.items()
+                    if name not in ("org", "depart", "tags", "assigned_to")
+                }
+            )
+            for item in validated_data
+        ], batch_size=self.batch_size)
+
+        TaskTags = Task.tags.through
+        TaskAssignedTo = Task.assigned_to.through
+        TaskTags.objects.bulk_create([
+            TaskTags(task_id=task.id, tag_id=tag_id)
+            for task, item in zip(tasks, validated_data)
+            for tag_id in set(item.get("tags", []))
+        ], batch_size=self.batch_size)
+        TaskAssignedTo.objects.bulk_create([
+            TaskAssignedTo(task_id=task.id, appuser_id=user_id)
+            for task, item in zip(tasks, validated_data)
+            for user_id in set(item.get("assigned_to", []))
+        ], batch_size=self.batch_size)
+
+        self.add_org_members({
+            (item["org"], user_id)
+            for item in validated_data for user_id in item.get("assigned_to", [])
+        })
+        # bulk inserts don't send signals
+        search_backend.index_ids(Task, [task.id for task in tasks])
+        auth_checker.invalidate_cache()
+        return tasks
+
+
+class BulkUpdateTaskListSerializer(BulkTaskListSerializer):
+    """
+    Validate and update many tasks at once, see `BulkUpdateTaskSerializer`.
+
+    The serializer instance is the queryset of tasks that can be updated, tasks of
+    items are read from it with their own fields only. Items are validated against
+    their task org as on bulk creation. Changed fields are compared with current
+    values and unchanged tasks are skipped: tasks with the same changes are updated
+    with a single `UPDATE` per batch, the others with `bulk_update`. Many to many rows
+    are replaced with bulk inserts and deletes of the difference.
+    """
+    scalar_fields = [
+        "name", "description", "due_date", "priority", "status",
+        "estimated_duration", "actual_duration", "depart",
+    ]
+    many_to_many_fields = ["tags", "assigned_to"]
+
+    def get_attnames(self):
+        return {name: Task._meta.get_field(name).attname for name in self.scalar_fields}
+
+    def get_tasks(self, ids) -> dict:
+        queryset = self.instance.select_related(None).prefetch_related(None).only(
+            "id", "org_id", *self.get_attnames().values()
+        )
+        tasks = {}
+        for start in range(0, len(ids), self.batch_size):
+            tasks.update(queryset.in_bulk(ids[start:start + self.batch_size]))
+        return tasks
+
+    def validate_items(self, items) -> list:
+        # tasks read here are updated by `update`
+        self.tasks = self.get_tasks(list({item["id"] for item in items}))
+        org_owners = dict(Organization.objects.filter(
+            id__in={task.org_id for task in self.tasks.values()}
+        ).values_list("id", "owner_id"))
+        references = self.get_references(items, [
+            org_owners[self.tasks[item["id"]].org_id] if item["id"] in self.tasks else None
+            for item in items
+        ])
+        renamed = {}
+        for item in items:
+            task = self.tasks.get(item["id"])
+            if task is not None and item.get("name", task.name) != task.name:
+                renamed[task.id] = item["name"]
+        # current names of updated tasks are taken too, swapping names is rejected
+        # as rows are updated one at a time against the unique constraint
+        existing_names = set(Task.objects.filter(
+            org_id__in=org_owners, name__in=set(renamed.values())
+        ).values_list("org_id", "name")) if renamed else set()
+
+        errors = []
+        seen = set()
+        for item in items:
+            item_errors = {}
+            errors.append(item_errors)
+            task = self.tasks.get(item["id"])
+            if item["id"] in seen:
+                item_errors["id"] = [_("This task is specified more than once.")]
+                continue
+            seen.add(item["id"])
+            if task is None:
+                item_errors["id"] = [_("The specified task does not exist.")]
+                continue
+
+            if item["id"] in renamed:
+                key = (task.org_id, item["name"])
+                if key in existing_names:
+                    item_errors["name"] = [
+                        _("A task with this name already exists in the organization.")
+                    ]
+                existing_names.add(key)
+            item_errors.update(self.get_references_errors(
+                item, task.org_id, org_owners[task.org_id], references
+            ))
+        return errors
+
+    def get_changes(self, validated_data) -> dict:
+        """Map ids of tasks with changed fields to their changed values by attname"""
+        attnames = self.get_attnames()
+        changes = {}
+        for item in validated_data:
+            task = self.tasks[item["id"]]
+            changed = {
+                attname: item[name] for name, attname in attnames.items()
+                if name in item and getattr(task, attname) != item[name]
+            }
+            if changed:
+                changes[task.id] = changed
+        return changes
+
+    def update_many_to_many(self, name, validated_data) -> set:
+        """Replace `name` related objects of tasks, return ids of changed tasks"""
+        targets = {
+            item["id"]: set(item[name]) for item in validated_data if name in item
+        }
+        if not targets:
+            return set()
+
+        field = Task._meta.get_field(name)
+        through = field.remote_field.through
+        task_column = f"{field.m2m_field_name()}_id"
+        target_column = f"{field.m2m_reverse_field_name()}_id"
+        current = {task_id: set() for task_id in targets}
+        to_delete = []
+        changed_ids = set()
+        for row_id, task_id, target_id in through.objects.filter(**{
+            f"{task_column}__in": targets
+        }).values_list("id", task_column, target_column):
+            if target_id in targets[task_id]:
+                current[task_id].add(target_id)
+            else:
+                to_delete.append(row_id)
+                changed_ids.add(task_id)
+
+        to_create = []
+        for task_id, task_targets in targets.items():
+            for target_id in task_targets - current[task_id]:
+                to_create.append(through(**{task_column: task_id, target_column: target_id}))
+                changed_ids.add(task_id)
+        for start in range(0, len(to_delete), self.batch_size):
+            through.objects.filter(id__in=to_delete[start:start + self.batch_size]).delete()
+        through.objects.bulk_create(to_create, batch_size=self.batch_size)
+        return changed_ids
+
+    def update(self, instance, validated_data):
+        """Apply items changes, return updated tasks in the items order"""
+        now = timezone.now()
+        changes = self.get_changes(validated_data)
+        changed_ids = set(changes)
+        for name in self.many_to_many_fields:
+            changed_ids |= self.update_many_to_many(name, validated_data)
+        updated_ids = [item["id"] for item in validated_data if item["id"] in changed_ids]
+
+        # tasks with the same changes are updated together, by batch of ids
+        groups = defaultdict(list)
+        for task_id in updated_ids:
+            groups[tuple(sorted(changes.get(task_id, {}).items()))].append(task_id)
+        to_bulk_update, bulk_update_fields = [], {"updated_at"}
+        for changed, task_ids in groups.items():
+            if changed and len(task_ids) == 1:
+                task = self.tasks[task_ids[0]]
+                for attname, value in changed:
+                    setattr(task, attname, value)
+                    bulk_update_fields.add(attname)
+                task.updated_at = now
+                to_bulk_update.append(task)
+                continue
+            for start in range(0, len(task_ids), self.batch_size):
+                Task.objects.filter(id__in=task_ids[start:start + self.batch_size]).update(
+                    updated_at=now, **dict(changed)
+                )
+        Task.objects.bulk_update(
+            to_bulk_update, list(bulk_update_fields), batch_size=self.batch_size
+        )
+
+        self.add_org_members({
+            (self.tasks[item["id"]].org_id, user_id)
+            for item in validated_data for user_id in item.get("assigned_to", [])
+        })
+        # bulk updates don't send signals
+        if updated_ids:
+            search_backend.index_ids(Task, updated_ids)
+            auth_checker.invalidate_cache()
+        return [self.tasks[task_id] for task_id in updated_ids]
+
+
+class BulkCreateTaskSerializer(serializers.Serializer):
+    """A task of a bulk creation, references are validated by `BulkCreateTaskListSerializer`"""
+    name = serializers.CharField(
+        max_length=255,
+        help_text=_("Name of the task"),
+    )
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text=_("Detailed description of the task"),
+    )
+    assigned_to = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        help_text=_("Users assigned to this task"),
+    )
+    due_date = serializers.DateTimeField(
+        required=False,
+        allow_null=True,
+        help_text=_("Deadline for the task"),
+    )
+    priority = serializers.ChoiceField(
+        choices=Task.Priority,
+        default=Task.Priority.MEDIUM,
+        help_text=_("Priority level of the task"),
+        error_messages={
+            'invalid_choice': _("Invalid priority choice."),
+        }
+    )
+    status = serializers.ChoiceField(
+        choices=Task.Status,
+        default=Task.Status.PENDING,
+        help_text=_("Current status of the task"),
+        error_messages={
+            'invalid_choice': _("Invalid status choice."),
+        }
+    )
+    estimated_duration = serializers.DurationField(
+        required=False,
+        allow_null=True,
+        help_text=_("Estimated time to complete the task"),
+    )
+    actual_duration = serializers.DurationField(
+        required=False,
+        allow_null=True,
+        help_text=_("Actual time spent on the task"),
+    )
+    tags = serializers.ListField(
+        child=serializers.UUIDField(),
+        required=False,
+        help_text=_("Tags associated with the task"),
+    )
+    depart = serializers.UUIDField(
+        required=False,
+        allow_null=True,
+        help_text=_("Department to which the task belongs"),
+    )
+    org = serializers.UUIDField(
+        help_text=_("Organization to which the task belongs"),
+    )
+
+    class Meta:
+        list_serializer_class = BulkCreateTaskListSerializer
+
+
+class BulkUpdateTaskPatchSerializer(BulkCreateTaskSerializer):
+    """Fields changed on tasks of a bulk update, every field is optional"""
+    name = serializers.CharField(
+        max_length=255,
+        required=False,
+        help_text=_("Name of the task"),
+    )
+    priority = serializers.ChoiceField(
+        choices=Task.Priority,
+        required=False,
+        help_text=_("Priority level of the task"),
+        error_messages={
+            'invalid_choice': _("Invalid priority choice."),
+        }
+    )
+    status = serializers.ChoiceField(
+        choices=Task.Status,
+        required=False,
+        help_text=_("Current status of the task"),
+        error_messages={
+            'invalid_choice': _("Invalid status choice."),
+        }
+    )
+    org = None
+
+
+class BulkUpdateTaskSerializer(BulkUpdateTaskPatchSerializer):
+    """A task of a bulk update, references are validated by `BulkUpdateTaskListSerializer`"""
+    id = serializers.UUIDField(
+        help_text=_("Id of the task to update"),
+    )
+
+    class Meta:
+        list_serializer_class = BulkUpdateTaskListSerializer
+
+
+class BulkUpdateTaskFilterSerializer(serializers.Serializer):
+    """Bulk update of tasks matched by a filter, `patch` is applied to each of them"""
+    filter = serializers.DictField(
+        allow_empty=False,
+        help_text=_("Tasks list query params, eg: `{\"status\": \"pending\", \"tag_ids\": \"<id>,<id>\"}`"),
+    )
+    patch = BulkUpdateTaskPatchSerializer(
+        help_text=_("Fields to change on each matched task"),
+    )
+
+    def validate_patch(self, patch):
+        if "name" in patch:
+            raise serializers.ValidationError(
+                _("Tasks matched by a filter can't be renamed.")
+            )
+        return patch
@@ -1,26 +1,36 @@
 from http import HTTPMethod
 
-from django.db.models.query import Q
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from rest_framework import status
+from django.db.models import F
+from django.db.transaction import atomic
+from django.utils.translation import gettext_lazy as _
 
 from app_lib.views import FullModelViewSet
 from app_lib.queryset import queryset_helpers
+from app_lib.visibility import VisibilityFilter
 from tasks.serializers import (
     CreateTaskSerializer,
     UpdateTaskSeriliazer,
-    UpdateTaskStatusSerializer
+    UpdateTaskStatusSerializer,
+    BulkCreateTaskSerializer,
+    BulkUpdateTaskSerializer,
+    BulkUpdateTaskFilterSerializer
 )
 from app_lib.read_only_serializers import (
     TaskSerializer,
     TaskDetailSerializer,
-    CreateUpdateTaskResponseSerializer
+    CreateUpdateTaskResponseSerializer,
+    BulkUpdateTaskResponseSerializer
 )
 from app_lib.permissions import Can_Access_Org_Depart_Or_Obj
 from app_lib.decorators import schema_wrapper
+from organization.models import OrgAccess
 from .filters import TaskDataFilter
+from .models import Task
 
 
 class TaskViewSet(FullModelViewSet):
@@ -31,7 +41,16 @@ class TaskViewSet(FullModelViewSet):
         prefetch_depart_can_be_accessed_by=True
     ).order_by('created_at')
     filterset_class = TaskDataFilter
-    ordering_fields = ['name', 'description', "created_at", "status", 'priority']
+    # `id` alone follows creation order with `UUID7_PRIMARY_KEYS`, pages are read from
+    # the primary key index
+    ordering_fields = ['name', 'description', "created_at", "status", 'priority', 'id']
+    # priorities are sorted by rank, then soonest due date first, see `Task.priority_rank`
+    ordering_aliases = {"priority": ["priority_rank", F("due_date").asc(nulls_last=True)]}
+    bulk_update_view_name = "bulk_update"
+    # maximum number of tasks created by a bulk create request
+    bulk_create_max_size = 5000
+    # maximum number of tasks updated by a bulk update request
+    bulk_update_max_size = 5000
 
     def get_serializer_class(self):
         if self.action == self.retrieve_view_name:
@@ -47,17 +66,17 @@ class TaskViewSet(FullModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        queryset = super().get_queryset().filter(
-            Q(org__created_by=user) |
-            Q(org__owner=user) |
-            Q(org__can_be_accessed_by__in=[user]) |
-            Q(depart__created_by=user) |
-            Q(depart__can_be_accessed_by__in=[user]) |
-            Q(created_by=user) |
-            Q(can_be_accessed_by__in=[user]) |
-            Q(assigned_to__in=[user])
-        ).distinct()
-        return queryset
+        return VisibilityFilter(Task, user).in_orgs(
+            OrgAccess.FULL_ACCESS_LEVELS
+        ).created_by(
+            "depart"
+        ).in_m2m(
+            "can_be_accessed_by", "depart"
+        ).created_by().in_m2m(
+            "can_be_accessed_by"
+        ).in_m2m(
+            "assigned_to"
+        ).filter(super().get_queryset())
     
     def get_permissions(self):
         if self.action in [
@@ -65,6 +84,7 @@ class TaskViewSet(FullModelViewSet):
             self.bulk_delete_view_name, 
             self.update_view_name, 
             self.partial_update_view_name,
+            self.bulk_update_view_name,
         ]:
             self.permission_classes = [IsAuthenticated, Can_Access_Org_Depart_Or_Obj]
         return super().get_permissions()
@@ -119,4 +139,125 @@ class TaskViewSet(FullModelViewSet):
         serializer = self.get_serializer(obj, data=request.data)
         serializer.is_valid(raise_exception=True)
         serializer.save()
-        return Response(serializer.data)
\ No newline at end of file
+        return Response(serializer.data)
+
+    @schema_wrapper(
+        BulkCreateTaskSerializer(many=True),
+        TaskSerializer(many=True),
+        status.HTTP_201_CREATED
+    )
+    @action(
+        detail=False,
+        methods=[HTTPMethod.POST],
+        url_name="bulk-create",
+        url_path="bulk-create",
+    )
+    def bulk_create(self, request, *args, **kwargs):
+        """
+        # Create many tasks at once.
+        The request data is a list of tasks, at most `bulk_create_max_size`. Each task is
+        validated as on task creation, errors are returned by task index and no task is
+        created when one is invalid. On success the created tasks are returned in the
+        request order.
+        """
+        serializer = BulkCreateTaskSerializer(
+            data=request.data,
+            many=True,
+            max_length=self.bulk_create_max_size,
+            context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+        with atomic():
+            tasks = serializer.save()
+        return Response(
+            TaskSerializer(tasks, many=True).data, status=status.HTTP_201_CREATED
+        )
+
+    @schema_wrapper(
+        BulkUpdateTaskSerializer(many=True),
+        BulkUpdateTaskResponseSerializer,
+    )
+    @action(
+        detail=False,
+        methods=[HTTPMethod.PATCH],
+        url_name="bulk-update",
+        url_path="bulk-update",
+    )
+    def bulk_update(self, request, *args, **kwargs):
+        """
+        # Update many tasks at once.
+        The request data is either a list of tasks, each with its `id` and the fields to
+        change, or an object with a `filter` holding tasks list query params and a `patch`
+        applied to every matched task. At most `bulk_update_max_size` tasks are updated.
+        Errors are returned by task index, by task id with a filter, and no task is
+        updated when one is invalid.
+
+        Changing only the `status` of a task is allowed to users it is assigned to, as on
+        status update, other changes require a full access over the task. Tasks whose
+        fields are unchanged are skipped, updated and unchanged task ids are returned.
+        """
+        data = self.get_bulk_update_data(request)
+        serializer = BulkUpdateTaskSerializer(
+            self.get_queryset(),
+            data=data,
+            many=True,
+            max_length=self.bulk_update_max_size,
+            context=self.get_serializer_context()
+        )
+        if not serializer.is_valid():
+            errors = serializer.errors
+            if data is not request.data:
+                # a single patch is applied, tasks indexes are meaningless to the user
+                errors = {
+                    item["id"]: item_errors
+                    for item, item_errors in zip(data, errors) if item_errors
+                }
+            raise ValidationError(errors)
+
+        self.check_bulk_update_permissions(request, serializer.validated_data)
+        with atomic():
+            tasks = serializer.save()
+
+        updated = [str(task.id) for task in tasks]
+        updated_ids = set(updated)
+        return Response({
+            "updated": updated,
+            "unchanged": [
+                str(item["id"]) for item in serializer.validated_data
+                if str(item["id"]) not in updated_ids
+            ],
+        })
+
+    def get_bulk_update_data(self, request):
+        """Return bulk update items, a filter plus a patch is turned into an
+        item per matched task"""
+        if isinstance(request.data, list):
+            return request.data
+
+        serializer = BulkUpdateTaskFilterSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        filterset = self.filterset_class(
+            data=serializer.validated_data["filter"],
+            queryset=self.get_queryset(),
+            request=request
+        )
+        if not filterset.is_valid():
+            raise ValidationError({"filter": filterset.errors})
+
+        task_ids = list(
+            filterset.qs.order_by().values_list("id", flat=True).distinct()[
+                :self.bulk_update_max_size + 1
+            ]
+        )
+        if len(task_ids) > self.bulk_update_max_size:
+            raise ValidationError({"filter": [
+                _("The filter matches more than %(max)s tasks.") % {"max": self.bulk_update_max_size}
+            ]})
+        return [{**request.data["patch"], "id": str(task_id)} for task_id in task_ids]
+
+    def check_bulk_update_permissions(self, request, items):
+        """Check user permissions over tasks changed on other fields than `status`
+        with a set based check, potentially raise a forbiden error"""
+        task_ids = [item["id"] for item in items if set(item) - {"id", "status"}]
+        for chunk in self.get_id_chunks(task_ids):
+            self.check_ids_permissions(request, Task, chunk)
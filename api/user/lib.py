@@ -1,10 +1,10 @@
 from django.contrib.auth.tokens import default_token_generator
-from django.db.models import Q
+from django.db.models.functions import Lower
 
 from app_lib.email import send_html_email
 from app_lib.urls import get_app_base_url, generate_url_safe_uuid
-from app_lib.queryset import queryset_helpers
-from app_lib.app_permssions import get_perm_data, get_perm_list
+from app_lib.app_permssions import get_perm_data
+from app_lib.permission_resolver import perm_resolver
 
 
 def send_account_created_notification(user, request):
@@ -26,8 +26,9 @@ def send_account_created_notification(user, request):
 
 def get_user_authorizations_per_org(user):
     """Get user authorizations including permissions and roles in organizations.
-    This function retrieves the organizations the user is associated with,
-    their permissions, and roles, and formats the data for easy access.
+    This function resolves the organizations the user is associated with and
+    their effective permissions with `perm_resolver`, then loads the user roles,
+    and formats the data for easy access.
     Args:
         user (AppUser): The user for whom to retrieve authorizations.
     Returns:
@@ -66,115 +67,58 @@ def get_user_authorizations_per_org(user):
     # To avoid circular imports error
     from app_lib.read_only_serializers import (
         OrganizationSerializer,
-        SimpleUserPermissionSerializer,
         SimpleRoleSerializer
     )
-    
-    # db queries
-    user_orgs = list(
-        queryset_helpers.get_org_queryset().filter(
-            Q(created_by=user) |
-            Q(owner=user) |
-            Q(can_be_accessed_by=user) |
-            Q(members=user)
-        ).distinct()
-    )
-
-    if not user_orgs:
-        return []
-        
-    user_perm_objs = list(
-        queryset_helpers.get_user_permission_queryset(
-            only_select_related=True
-        ).filter(
-            org__in=user_orgs, user=user
-        )
-    )
-    user_roles = list(
-        queryset_helpers.get_role_queryset(
-            only_select_related=True
-        ).filter(
-            org__in=user_orgs, users=user
-        )
-    )
-
-    # perm per org for easy reference later.
-    # By design we should only have one userpermission obj for an user 
-    # per org if exist
-    user_perms_per_org = {}
-    for user_perm_obj in user_perm_objs:
-        perm_data = SimpleUserPermissionSerializer(
-            user_perm_obj
-        ).data
-        user_perms_per_org[user_perm_obj.org.id] = {
-            **perm_data, "labels": user_perm_obj.get_perms()
-        }
-
-    # roles per org for easy reference later
-    user_roles_per_org = {}
-    for user_role in user_roles:
-        user_role_data = SimpleRoleSerializer(user_role).data
-        if user_roles_data := user_roles_per_org.get(user_role.org.id, None):
-            user_roles_data.append(user_role_data)
-        else:
-            user_roles_per_org[user_role.org.id] = [user_role_data]
 
     data = []
-
-    for org in user_orgs:
-        user_org_auth = {}
-        user_org_auth["org"] = OrganizationSerializer(org).data
-
-        # perms
-        existing_perms = []
-        if perm_data := user_perms_per_org.get(org.id, None):
-            user_org_auth["perms"] = perm_data['perms']
-            existing_perms = perm_data['labels']
-        else:
-            user_org_auth["perms"] = []
-
-        not_in_existing_perms = set()
-
-        # roles
-        if user_org_roles := user_roles_per_org.get(org.id, None):
-            user_org_auth["roles"] = user_org_roles
-            # check for perms in role but no in user perm list
-            not_in_existing_perms.update([
-                perm
-                for user_org_role in user_org_roles
-                for perm in user_org_role['perms']
-                if not perm in existing_perms
-            ])
-        else:
-            user_org_auth["roles"] = []
-
-        # check if the user is an owner and update perms as needed
-        owner_id = getattr(org.owner, 'id', "")
-        creator_id = getattr(org.created_by, 'id', "")
-        if creator_id == user.id:
-            not_in_existing_perms.update([
-                perm
-                for perm in get_perm_list()
-                if perm not in existing_perms
-            ])
-        elif (
-            owner_id == user.id or
-            user in org.can_be_accessed_by.all()
-        ):
-            not_in_existing_perms.update([
-                perm
-                for perm in get_perm_list(default_only=True)
-                if perm not in existing_perms
-            ])
-
-        # extend existing perms to include role and owner perms
-        if not_in_existing_perms:
-            user_org_auth["perms"].extend(
-                get_perm_data(not_in_existing_perms)
-            )
-        
-        data.append(user_org_auth)
+    for org_perms in perm_resolver.resolve(user, with_roles=True).values():
+        data.append({
+            "org": OrganizationSerializer(org_perms.org).data,
+            "perms": get_perm_data(org_perms.get_perms()),
+            "roles": SimpleRoleSerializer(org_perms.roles, many=True).data,
+        })
 
     return data
 
 
+class UserAutocomplete:
+    """
+    Find users whose email, first name or last name starts with a value, case
+    insensitively, for typeahead pickers.
+
+    Each field is matched with a range on its lower cased index, read in index
+    order and stopped after `max_results` rows, the cost doesn't grow with the
+    number of users. Matches are merged by matched value.
+    """
+    fields = ["email", "first_name", "last_name"]
+    max_results = 20
+
+    def get_prefix_range(self, prefix):
+        """Return bounds of values starting with `prefix`, the upper one excluded"""
+        return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+    def search(self, queryset, value, limit=None) -> list:
+        """Return at most `limit` users from `queryset` matching `value`"""
+        prefix = value.strip().lower()
+        if not prefix:
+            return []
+        limit = min(limit or self.max_results, self.max_results)
+        start, end = self.get_prefix_range(prefix)
+
+        matches = {}
+        for field in self.fields:
+            key = f"{field}_lower"
+            users = queryset.annotate(**{key: Lower(field)}).filter(**{
+                f"{key}__gte": start, f"{key}__lt": end
+            }).order_by(key, "id")[:limit]
+            for user in users:
+                matched = matches.get(user.pk)
+                if matched is None or getattr(user, key) < matched[0]:
+                    matches[user.pk] = (getattr(user, key), user)
+
+        return [
+            user for _, user in sorted(matches.values(), key=lambda match: match[0])[:limit]
+        ]
+
+
+user_autocomplete = UserAutocomplete()
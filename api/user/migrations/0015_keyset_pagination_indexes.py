@@ -0,0 +1,17 @@
+# Generated by Django 5.2 on 2026-10-17 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0014_alter_appuser_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appuser',
+            index=models.Index(fields=['created_at', 'id'], name='user_appuse_created_e24ea8_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2 on 2026-10-17 01:38
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0015_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appuser',
+            index=models.Index(django.db.models.functions.text.Lower('email'), models.F('id'), name='user_email_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appuser',
+            index=models.Index(django.db.models.functions.text.Lower('first_name'), models.F('id'), name='user_first_name_lower_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appuser',
+            index=models.Index(django.db.models.functions.text.Lower('last_name'), models.F('id'), name='user_last_name_lower_idx'),
+        ),
+    ]
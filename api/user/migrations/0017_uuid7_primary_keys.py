@@ -0,0 +1,24 @@
+# Generated by Django 5.2 on 2026-10-17 01:40
+
+import app_lib.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0016_user_prefix_search_indexes'),
+    ]
+
+    operations = [
+        # the default is only used by django, no database change
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name='appuser',
+                    name='id',
+                    field=models.UUIDField(default=app_lib.ids.generate_id, editable=False, primary_key=True, serialize=False),
+                ),
+            ],
+        ),
+    ]
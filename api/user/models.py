@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.auth.models import AbstractBaseUser
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import EmailValidator
@@ -51,5 +52,11 @@ class AppUser(AbstractBaseModel, AbstractBaseUser):
             models.Index(fields=[
                 "email", "first_name", "last_name", 
                 "is_active"
-            ])
+            ]),
+            # keyset pagination, see `DefaultCursorPagination`
+            models.Index(fields=["created_at", "id"]),
+            # prefix search, see `user.lib.UserAutocomplete`
+            models.Index(Lower("email"), "id", name="user_email_lower_idx"),
+            models.Index(Lower("first_name"), "id", name="user_first_name_lower_idx"),
+            models.Index(Lower("last_name"), "id", name="user_last_name_lower_idx"),
         ]
\ No newline at end of file
@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 
 from .models import AppUser
 from app_lib.password import generate_password, validate_password
-from .lib import send_account_created_notification
+from .lib import send_account_created_notification, user_autocomplete
 from app_lib.read_only_serializers import (
     UserDetailSerializer
 )
@@ -139,4 +139,14 @@ class UpdateUserPasswordSerializer(serializers.Serializer):
         new_password = validated_data.get("new_password")
         instance.set_password(new_password)
         instance.save()
-        return instance
\ No newline at end of file
+        return instance
+
+class UserAutocompleteSerializer(serializers.Serializer):
+    q = serializers.CharField(
+        required=True, max_length=254,
+        help_text=_("Start of users email, first name or last name")
+    )
+    limit = serializers.IntegerField(
+        required=False, min_value=1, max_value=user_autocomplete.max_results,
+        default=10
+    )
@@ -16,8 +16,10 @@ from .serializers import (
     CreateUserSerializer,
     UpdateUserSerializer,
     UpdateUserPasswordSerializer,
+    UserAutocompleteSerializer,
 )
 from .filters import UserDataFilter
+from .lib import user_autocomplete
 from app_lib.permissions import Is_Object_Or_Org_Or_Depart_Creator
 
 
@@ -25,6 +27,7 @@ class UserViewSet(FullModelViewSet):
     serializer_class = UserSerializer
     queryset = queryset_helpers.get_user_queryset().order_by('created_at')
     filterset_class= UserDataFilter
+    planned_actions = [*FullModelViewSet.planned_actions, "autocomplete"]
 
     def get_serializer_class(self):
         if self.action in [
@@ -157,6 +160,32 @@ class UserViewSet(FullModelViewSet):
             UserDetailSerializer(user).data
         )
 
+    @schema_wrapper(
+        response_serializer=UserSerializer(many=True),
+        parameters=[UserAutocompleteSerializer]
+    )
+    @action(
+        detail=False,
+        methods=[HTTPMethod.GET],
+        url_name="autocomplete",
+        url_path="autocomplete",
+    )
+    def autocomplete(self, request, *args, **kwargs):
+        """
+        # Autocomplete users
+        Returns at most `limit` users the authenticated user has access to, including 
+        himself, whose email, first name or last name starts with `q`, case insensitive.
+        Intended for typeahead pickers, results are ordered by matched value and not paginated.
+        """
+        params = UserAutocompleteSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        users = user_autocomplete.search(
+            self.get_queryset(),
+            params.validated_data["q"],
+            params.validated_data["limit"]
+        )
+        return Response(self.get_serializer(users, many=True).data)
+
     @schema_wrapper(
         request_serializer=UpdateUserPasswordSerializer,
         response_status_code=status.HTTP_204_NO_CONTENT